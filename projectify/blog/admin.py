@@ -3,17 +3,29 @@
 # SPDX-FileCopyrightText: 2022-2024, 2026 JWP Consulting GK
 """Blog admin configuration."""
 
-from typing import Any
+from typing import Any, Optional
 
 from django import forms
 from django.contrib import admin
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import HttpRequest
 from django.urls import reverse_lazy
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
 from projectify.blog.models import Post, PostContent
+from projectify.blog.selectors.post import post_is_published
 from projectify.lib.forms import RichTextEditor
 from projectify.lib.utils import clean_rich_text
+from projectify.stats.services.sitemap import sitemap_urls
+
+
+def _post_sitemap_urls(post: Optional[Post]) -> list[str]:
+    """Return the sitemap URL of post, if it is published."""
+    if post is None or not post_is_published(post):
+        return []
+    return [post.get_absolute_url()]
 
 
 class PostAdminForm(forms.ModelForm):
@@ -89,6 +101,35 @@ class PostAdmin(admin.ModelAdmin[Post]):
     list_display = ("title", "published", "draft", "post_url")
     exclude = ("body",)
 
+    def save_form(self, request: HttpRequest, form: Any, change: bool) -> Any:
+        """Save post and update sitemap URLs when it is (un)published."""
+        # PostAdminForm.save() always commits, so do this here instead of
+        # in save_model()
+        pk = form.instance.pk
+        before = Post.objects.filter(pk=pk).first() if change else None
+        post = super().save_form(request, form, change)
+        add, remove = _post_sitemap_urls(post), _post_sitemap_urls(before)
+        # Other processes rebuild from the database, so only tell them once
+        # the post is committed
+        transaction.on_commit(
+            lambda: sitemap_urls.update(add=add, remove=remove)
+        )
+        return post
+
+    def delete_model(self, request: HttpRequest, obj: Post) -> None:
+        """Delete post and remove it from the sitemap URLs."""
+        urls = _post_sitemap_urls(obj)
+        super().delete_model(request, obj)
+        transaction.on_commit(lambda: sitemap_urls.update(remove=urls))
+
+    def delete_queryset(
+        self, request: HttpRequest, queryset: QuerySet[Post]
+    ) -> None:
+        """Delete posts and remove them from the sitemap URLs."""
+        urls = [url for post in queryset for url in _post_sitemap_urls(post)]
+        super().delete_queryset(request, queryset)
+        transaction.on_commit(lambda: sitemap_urls.update(remove=urls))
+
     @admin.display(description=_("URL"))
     def post_url(self, instance: Post) -> str:
         """Return link to blog post."""
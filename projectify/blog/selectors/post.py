@@ -38,6 +38,11 @@ def post_list_published(
         return posts.defer("body")
 
 
+def post_is_published(post: Post) -> bool:
+    """Return True if post is visible to everyone today."""
+    return not post.draft and post.published <= timezone.now().date()
+
+
 def post_list_published_with_body() -> QuerySet[Post]:
     """Return published posts with content for RSS feed."""
     today = timezone.now().date()
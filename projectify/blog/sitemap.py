@@ -10,6 +10,7 @@ from django.contrib import sitemaps
 from django.urls import reverse
 
 from projectify.blog.models import Post
+from projectify.blog.selectors.post import post_list_published
 
 
 class BlogSitemap(sitemaps.Sitemap):
@@ -24,7 +25,7 @@ class BlogSitemap(sitemaps.Sitemap):
 
         See names in blog/urls.py.
         """
-        posts = list(Post.objects.all())
+        posts = list(post_list_published())
         return ["blog:post_list", *posts]
 
     def location(self, obj: Union[str, Post]) -> str:  # type: ignore[override]
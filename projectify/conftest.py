@@ -71,11 +71,13 @@ from projectify.workspace.models import (
 from projectify.workspace.selectors.team_member import (
     team_member_find_for_workspace,
 )
+from projectify.workspace.services.cache_generation import pending_bumps
 from projectify.workspace.services.project import (
     project_archive,
     project_create,
 )
 from projectify.workspace.services.task import task_create
+from projectify.workspace.services.team_member import visit_buffer
 from projectify.workspace.services.team_member_invite import (
     team_member_invite_create,
 )
@@ -270,6 +272,20 @@ def faker_seed() -> int:
     return random.randint(0, 2**16)
 
 
+@pytest.fixture(autouse=True)
+def clear_visit_buffer() -> Generator[None, None, None]:
+    """Discard team member visits that a test hasn't written."""
+    yield
+    visit_buffer.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_pending_bumps() -> Generator[None, None, None]:
+    """Discard cache generation bumps of transactions that never commit."""
+    yield
+    pending_bumps.clear()
+
+
 @pytest.fixture
 def now() -> datetime:
     """Return now."""
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Coupon services."""
 
 from typing import Optional
@@ -78,7 +78,7 @@ def coupon_redeem(*, who: User, code: str, workspace: Workspace) -> None:
             pass
     customer.subscription_status = CustomerSubscriptionStatus.CUSTOM
     customer.seats = coupon.seats
-    customer.save()
+    customer.save_changed("subscription_status", "seats")
     coupon.used = timezone.now()
     coupon.customer = customer
     coupon.save()
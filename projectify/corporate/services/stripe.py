@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023-2024 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023-2024,2026 JWP Consulting GK
 """
 Corporate app services that are called from stripe webhook.
 
@@ -23,7 +23,7 @@ def customer_activate_subscription(
     customer.stripe_customer_id = stripe_customer_id
     customer.subscription_status = CustomerSubscriptionStatus.ACTIVE
     customer.seats = seats
-    customer.save()
+    customer.save_changed("stripe_customer_id", "subscription_status", "seats")
     logger.info(
         "Activated subscription for customer %s with stripe id %s",
         customer.uuid,
@@ -42,7 +42,7 @@ def customer_update_seats(*, customer: Customer, seats: int) -> None:
         )
         return None
     customer.seats = seats
-    customer.save()
+    customer.save_changed("seats")
     logger.info("Customer %s updated to %d seats", customer, seats)
 
 
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2025 JWP Consulting GK
+# SPDX-FileCopyrightText: 2025-2026 JWP Consulting GK
 """Help Views."""
 
 import warnings
@@ -12,7 +12,7 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
 from projectify.lib.settings import get_settings
-from projectify.lib.utils import markdown_to_safe_html
+from projectify.lib.utils import markdown_page
 
 settings = get_settings()
 
@@ -109,13 +109,12 @@ def help_detail(request: HttpRequest, page: str) -> HttpResponse:
         raise Http404(
             _("Couldn't find help for topic {topic}").format(page=page)
         )
-    help_text = (
-        (settings.BASE_DIR / "help/markdown_en") / topic["markdown_file"]
-    ).read_text()
-
     # NOTE: This is safe as long as we don't let the user control the page
     # (e.g., local file inclusion)
-    help_html, toc_html = markdown_to_safe_html(help_text)
+    help_page = markdown_page(
+        (settings.BASE_DIR / "help/markdown_en") / topic["markdown_file"]
+    )
+    help_html, toc_html = help_page.html, help_page.toc
     if not toc_html:
         warnings.warn(f"No TOC for help topic {topic}")
 
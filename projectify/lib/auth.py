@@ -6,19 +6,87 @@
 # This is coupled to our own user model for now, otherwise we need to
 # do lots of weird casting with AbstractBaseUser vs. AbstractUser
 import logging
+from collections.abc import Iterable, Sequence
 from typing import Optional, Union
 from uuid import UUID
 
 from django.core.exceptions import PermissionDenied
 
 from projectify.user.models import User
+from projectify.workspace.const import TeamMemberRoles
 from projectify.workspace.models import TeamMember, Workspace
+from projectify.workspace.selectors.team_member import (
+    team_member_find_roles_for_user,
+)
+from projectify.workspace.types import WorkspaceQuota
 
 logger = logging.getLogger(__name__)
 
 PermissionsCache = dict[tuple[str, UUID], bool]
 
 
+class WorkspaceRoles:
+    """
+    Resolve a user's team member roles, loading all of them at once.
+
+    Permission checks receive workspaces from many different querysets, e.g.,
+    project.workspace and task.workspace. All of them share this lookup as
+    long as they check permissions for the same User instance.
+    """
+
+    def __init__(self, user: User):
+        """Create an empty resolver for user."""
+        self.user = user
+        self.roles: Optional[dict[int, TeamMemberRoles]] = None
+
+    def get(self, workspace: Workspace) -> Optional[TeamMemberRoles]:
+        """Return the user's role in workspace, or None if not a member."""
+        if self.roles is None:
+            self.roles = team_member_find_roles_for_user(user=self.user)
+        return self.roles.get(workspace.pk)
+
+    def clear(self) -> None:
+        """Forget loaded roles, so that the next check loads them again."""
+        self.roles = None
+
+
+class WorkspaceQuotas:
+    """
+    Resolve quotas for a batch of workspaces, loading all of them at once.
+
+    Set by validate_perms_many() on each workspace it checks, so that quota
+    predicates look up customers and quota counters only once. Workspaces
+    annotated with their quota, e.g., on the project detail page, use it
+    instead.
+    """
+
+    def __init__(self, workspaces: Sequence[Workspace]):
+        """Create an empty resolver for workspaces."""
+        self.workspaces = workspaces
+        self.quotas: Optional[dict[int, WorkspaceQuota]] = None
+
+    def get(self, workspace: Workspace) -> WorkspaceQuota:
+        """Return all quotas for workspace."""
+        # Avoid circular import through corporate.selectors.customer
+        from projectify.workspace.selectors.quota import (
+            workspace_get_all_quotas_many,
+        )
+
+        if workspace.quota is not None:
+            return workspace.quota
+        if self.quotas is None:
+            self.quotas = workspace_get_all_quotas_many(
+                workspaces=self.workspaces
+            )
+        return self.quotas[workspace.pk]
+
+
+def workspace_roles_clear(user: User) -> None:
+    """Forget a user's loaded roles after their team memberships change."""
+    if user.workspace_roles is not None:
+        user.workspace_roles.clear()
+
+
 # XXX support target, e.g., can user A delete user B?
 def validate_perm(
     perm: str,
@@ -79,3 +147,39 @@ def validate_perm(
             f"'{who}' doesn't have permission '{perm}' for '{target}'"
         )
     return result
+
+
+def validate_perms_many(
+    who: User, perms: Iterable[str], targets: Iterable[Workspace]
+) -> PermissionsCache:
+    """
+    Resolve every permission in perms for every workspace in targets.
+
+    The user's roles are loaded once for all workspaces, and so are quotas,
+    if a permission needs them. Return the results keyed like a
+    PermissionsCache, so that validate_perm() can use them as its cache.
+
+    Unlike validate_perm(), this doesn't log denied permissions, since it
+    resolves what a user may do, not what they try to do.
+    """
+    perms = list(perms)
+    workspaces = list(targets)
+    # Outside of requests, roles are only shared for this batch, so that
+    # they can't go stale
+    local_roles = who.workspace_roles is None
+    if local_roles:
+        who.workspace_roles = WorkspaceRoles(who)
+    workspace_quotas = WorkspaceQuotas(workspaces)
+    for workspace in workspaces:
+        workspace.workspace_quotas = workspace_quotas
+    try:
+        return {
+            (perm, workspace.uuid): who.has_perm(perm, workspace)
+            for workspace in workspaces
+            for perm in perms
+        }
+    finally:
+        for workspace in workspaces:
+            workspace.workspace_quotas = None
+        if local_roles:
+            who.workspace_roles = None
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""In-process caches."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class LRUCache[K, V]:
+    """
+    Thread-safe least recently used cache with optional expiry.
+
+    Entries only live in the current process. Use a ttl for anything that
+    other processes can change, so that stale entries expire eventually.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """Create an empty cache holding up to maxsize entries."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value for key, or None if missing or expired."""
+        with self._lock:
+            try:
+                created, value = self._entries[key]
+            except KeyError:
+                return None
+            if self.ttl is not None and time.monotonic() - created > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store value for key, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove key, if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Heroicon registry.
+
+All heroicons are found and read once per process, and their colored
+variants are prepared at the same time. Icons only change on deploy.
+"""
+
+import hashlib
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+from django.contrib.staticfiles.finders import get_finders
+from django.urls import reverse
+
+HEROICONS_DIR = "heroicons/"
+
+# Length of the ETag prefix used as a version in colored icon URLs
+ICON_VERSION_LENGTH = 12
+
+# See `const colors` projectify/theme/static_src/tailwind.config.js
+ICON_COLORS: Mapping[str, str] = {
+    "primary": "#2563EB",
+    "secondary": "#2563EB",
+    "destructive": "#dc2626",
+    "white": "#ffffff",
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class ColoredIcon:
+    """SVG content of an icon in one color."""
+
+    content: bytes
+    # Strong ETag, without quotes
+    etag: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class Icon:
+    """A heroicon and its colored variants."""
+
+    name: str
+    # Path relative to the static files directory
+    static_path: str
+    colored: Mapping[str, ColoredIcon]
+
+
+def _icon_colored(svg: str, color: str) -> ColoredIcon:
+    """Color an icon."""
+    content = svg.replace("<svg", f'<svg style="color: {color}"').encode()
+    return ColoredIcon(
+        content=content, etag=hashlib.sha256(content).hexdigest()[:32]
+    )
+
+
+class IconRegistry:
+    """All heroicons by name, found on first use."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._icons: Optional[dict[str, Icon]] = None
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[Icon]:
+        """Return the icon called name, if it exists."""
+        icons = self._icons
+        if icons is None:
+            icons = self._build()
+        return icons.get(name)
+
+    def clear(self) -> None:
+        """Find all icons again on next use."""
+        with self._lock:
+            self._icons = None
+
+    def _build(self) -> dict[str, Icon]:
+        """Find and read all icons."""
+        with self._lock:
+            if self._icons is not None:
+                return self._icons
+            icons: dict[str, Icon] = {}
+            # Same order as finders.find(), so that the first match wins
+            for finder in get_finders():
+                for path, storage in finder.list(None):
+                    path = path.replace("\\", "/")
+                    if not (
+                        path.startswith(HEROICONS_DIR)
+                        and path.endswith(".svg")
+                    ):
+                        continue
+                    name = path.removeprefix(HEROICONS_DIR).removesuffix(
+                        ".svg"
+                    )
+                    if name in icons:
+                        continue
+                    with storage.open(path) as f:
+                        svg = f.read().decode()
+                    icons[name] = Icon(
+                        name=name,
+                        static_path=path,
+                        colored={
+                            color: _icon_colored(svg, value)
+                            for color, value in ICON_COLORS.items()
+                        },
+                    )
+            self._icons = icons
+            return icons
+
+
+icon_registry = IconRegistry()
+
+
+def colored_icon_url(icon: str, color: str) -> str:
+    """
+    Return the URL of a colored icon.
+
+    The URL contains a version, so that it changes with the icon's content.
+    """
+    url = reverse("colored-icon", kwargs={"icon": icon, "color": color})
+    found = icon_registry.get(icon)
+    if found is None or color not in found.colored:
+        return url
+    version = found.colored[color].etag[:ICON_VERSION_LENGTH]
+    return f"{url}?v={version}"
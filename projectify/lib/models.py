@@ -1,30 +1,35 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Projectify base models."""
 
 import datetime
 from collections.abc import Iterable, Sequence
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Collection, Optional, Self
 from uuid import uuid4
 
 from django import forms
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db.models import (
     CharField,
+    CheckConstraint,
     DateTimeField,
     Model,
+    QuerySet,
     TextField,
+    UniqueConstraint,
     UUIDField,
 )
 from django.utils import safestring
+from django.utils.functional import cached_property
 from django.utils.html import strip_tags
 from django.utils.translation import gettext_lazy as _
 
 from justhtml import DEFAULT_POLICY, SanitizationPolicy
 
 from projectify.lib.forms import RichTextEditor
-from projectify.lib.utils import clean_rich_text
+from projectify.lib.utils import clean_rich_text, rich_text_policy_fingerprint
 
 Pks = list[str]
 
@@ -149,11 +154,85 @@ class BaseModel(Model):
     modified = ModificationDateTimeField(verbose_name=_("modified"))
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Run full_clean()."""
+        """
+        Run full_clean(), or validate only update_fields if given.
+
+        With update_fields, only those fields and the unique and check
+        constraints involving them are validated. Like in Django, only
+        update_fields are saved, and empty update_fields save nothing.
+        """
         # At the time of writing, this applies to _all_ Projectify models
-        self.full_clean()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.full_clean()
+        elif update_fields:
+            self._clean_update_fields(
+                {self._meta.get_field(name).name for name in update_fields}
+            )
         return super().save(*args, **kwargs)
 
+    def save_changed(self, *fields: str) -> None:
+        """
+        Validate and save only fields, and modified along with them.
+
+        Services use this for frequent, narrow updates.
+        """
+        self.save(update_fields=[*fields, "modified"])
+
+    def _clean_update_fields(self, changed: set[str]) -> None:
+        """Validate changed fields and the constraints involving them."""
+        involved = set(changed)
+        for group in self._constraint_field_groups():
+            if group & changed:
+                involved |= group
+        fields = {f.name for f in self._meta.concrete_fields}
+        errors: dict[str, Any] = {}
+        try:
+            self.clean_fields(exclude=fields - changed)
+        except ValidationError as e:
+            e.update_error_dict(errors)
+        try:
+            self.clean()
+        except ValidationError as e:
+            e.update_error_dict(errors)
+        try:
+            self.validate_unique(exclude=fields - involved)
+        except ValidationError as e:
+            e.update_error_dict(errors)
+        try:
+            self.validate_constraints(exclude=fields - involved)
+        except ValidationError as e:
+            e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
+    @classmethod
+    def _constraint_field_groups(cls) -> list[set[str]]:
+        """Return field names that are validated together."""
+        groups = [set(fields) for fields in cls._meta.unique_together]
+        for constraint in cls._meta.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                groups.append(set(constraint.fields))
+            elif isinstance(constraint, CheckConstraint):
+                # django-types still knows this attribute as check
+                condition: Any = getattr(constraint, "condition")
+                groups.append(set(condition.referenced_base_fields))
+        return groups
+
+    @classmethod
+    def from_db(
+        cls,
+        db: Optional[str],
+        field_names: Collection[str],
+        values: Collection[Any],
+    ) -> Self:
+        """Verify sanitized rich text after loading an instance."""
+        instance = super().from_db(db, field_names, values)
+        for field in cls._meta.concrete_fields:
+            if isinstance(field, SanitizationFingerprintField):
+                field.verify(instance)
+        return instance
+
     class Meta:
         """Make this model abstract."""
 
@@ -172,6 +251,12 @@ class BaseModelUUID(BaseModel):
         abstract = True
 
 
+class SanitizedHtml(safestring.SafeString):
+    """Rich text that was sanitized with the policy that has fingerprint."""
+
+    fingerprint: str
+
+
 # SPDX-SnippetBegin
 # SPDX-License-Identifier: MIT
 # SPDX-SnippetCopyrightText: 2022 LOGIC SMPC <paris@withlogic.co>
@@ -183,7 +268,14 @@ class BaseModelUUID(BaseModel):
 # Adding it as a deconstruct field doesn't work because SanitizationPolicy
 # is difficult to serialize.
 class RichTextField(TextField):  # type: ignore[type-arg]
-    """Vendored in RichTextField from django-prose."""
+    """
+    Vendored in RichTextField from django-prose.
+
+    Values are sanitized in pre_save(). Without a fingerprint, every value
+    read from the database is sanitized again. If the model has a
+    SanitizationFingerprintField for this field, sanitized values are
+    trusted when the stored fingerprint matches this field's policy.
+    """
 
     def __init__(
         self,
@@ -193,35 +285,197 @@ class RichTextField(TextField):  # type: ignore[type-arg]
     ):
         """Override TextField.__init__ and track JustHTML policy."""
         self.policy = policy or DEFAULT_POLICY
+        self.fingerprint = rich_text_policy_fingerprint(self.policy)
         super().__init__(*args, **kwargs)
 
+    @cached_property
+    def fingerprint_field(self) -> Optional["SanitizationFingerprintField"]:
+        """Return the field tracking this field's fingerprint, if any."""
+        for field in self.model._meta.concrete_fields:
+            match field:
+                case SanitizationFingerprintField(source=self.name):
+                    return field
+                case _:
+                    pass
+        return None
+
     def formfield(self, **kwargs: Any) -> forms.Field:
         """Return widget."""
         kwargs = {**kwargs, "widget": RichTextEditor}
         field: forms.Field = super().formfield(**kwargs)
         return field
 
+    def mark_sanitized(self, sanitized_html: str) -> SanitizedHtml:
+        """
+        Mark html as sanitized with this field's policy.
+
+        pre_save() stores marked values as they are. Use this when sanitizing
+        ahead of time, for example in other processes.
+        """
+        marked = SanitizedHtml(sanitized_html)
+        marked.fingerprint = self.fingerprint
+        return marked
+
     def pre_save(self, model_instance: Model, add: bool) -> str:
         """Pre save."""
         del add
         raw_html: str = getattr(model_instance, self.attname)
         if not raw_html:
             return ""
+        match raw_html:
+            case SanitizedHtml(fingerprint=self.fingerprint):
+                return raw_html
+            case _:
+                pass
 
         sanitized_html = clean_rich_text(raw_html, policy=self.policy)
         return sanitized_html
 
     def from_db_value(
         self, value: Optional[str], expression: object, connection: object
-    ) -> Optional[safestring.SafeString]:
-        """Return sanitized value."""
+    ) -> Optional[str]:
+        """
+        Return sanitized value.
+
+        If a fingerprint is tracked, return the value as is. BaseModel.from_db()
+        verifies it with SanitizationFingerprintField.verify(). Everything else,
+        like .values(), receives an unsafe str that templates escape.
+        """
         del expression, connection
         if value is None:
             return value
+        if self.fingerprint_field is not None:
+            return value
         sanitized_html = clean_rich_text(value)
         return sanitized_html
 
 
+class SanitizationFingerprintField(CharField):  # type: ignore[type-arg]
+    """
+    Store the fingerprint of the policy that sanitized a RichTextField.
+
+    Only works for BaseModel subclasses, see BaseModel.from_db().
+
+    When a model instance is loaded and the stored fingerprint matches the
+    fingerprint of the source field's current policy, the rich text is marked
+    safe without parsing it again. Otherwise, the rich text is sanitized
+    lazily. Run `./manage.py rich_text_sanitize` to sanitize stale rows in
+    bulk after changing a policy.
+
+    Writing rich text with QuerySet.update() or bulk_update() bypasses
+    pre_save(). Use RichTextQuerySet as the manager, so that the fingerprint
+    is reset to "" when doing so.
+    """
+
+    def __init__(self, *args: Any, source: str, **kwargs: Any):
+        """Store the name of the RichTextField that this field tracks."""
+        self.source = source
+        kwargs.setdefault("max_length", 64)
+        kwargs.setdefault("blank", True)
+        kwargs.setdefault("default", "")
+        kwargs.setdefault("editable", False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> tuple[Any, Any, Any, Any]:
+        """Add source to kwargs."""
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["source"] = self.source
+        return name, path, args, kwargs
+
+    @property
+    def source_field(self) -> RichTextField:
+        """Return the RichTextField tracked by this field."""
+        field = self.model._meta.get_field(self.source)
+        assert isinstance(field, RichTextField), field
+        return field
+
+    def pre_save(self, model_instance: Model, add: bool) -> str:
+        """Record the fingerprint of the policy that sanitized the rich text."""
+        del add
+        source_attname = self.source_field.attname
+        # The rich text isn't saved together with this field, keep as is
+        if source_attname not in model_instance.__dict__:
+            current: str = getattr(model_instance, self.attname)
+            return current
+        fingerprint = self.source_field.fingerprint
+        setattr(model_instance, self.attname, fingerprint)
+        return fingerprint
+
+    def verify(self, instance: Model) -> None:
+        """Mark rich text safe, or sanitize it if the fingerprint is stale."""
+        source_field = self.source_field
+        # Don't trigger loading deferred fields
+        value = instance.__dict__.get(source_field.attname)
+        if not isinstance(value, str) or not value:
+            return
+        if instance.__dict__.get(self.attname) == source_field.fingerprint:
+            # The value was sanitized with the current policy in pre_save()
+            instance.__dict__[source_field.attname] = safestring.mark_safe(
+                value
+            )
+        else:
+            instance.__dict__[source_field.attname] = clean_rich_text(
+                value, policy=source_field.policy
+            )
+
+
+def _fingerprint_resets(
+    model: type[Model], fields: Collection[str]
+) -> list[SanitizationFingerprintField]:
+    """Return fingerprints of rich text in fields, unless written as well."""
+    resets: list[SanitizationFingerprintField] = []
+    for field in model._meta.concrete_fields:
+        if not isinstance(field, SanitizationFingerprintField):
+            continue
+        if field.name in fields or field.attname in fields:
+            continue
+        source_field = field.source_field
+        if source_field.name in fields or source_field.attname in fields:
+            resets.append(field)
+    return resets
+
+
+class RichTextQuerySet[M: Model](QuerySet[M]):
+    """
+    QuerySet for models with a SanitizationFingerprintField.
+
+    update() and bulk_update() don't call pre_save(). When they write rich
+    text, they reset its fingerprint, so that the rich text is sanitized
+    again when it is loaded.
+    """
+
+    def update(self, **kwargs: Any) -> int:
+        """Update rows and reset fingerprints of written rich text."""
+        for field in _fingerprint_resets(self.model, kwargs):
+            value = kwargs[field.source]
+            match value:
+                case SanitizedHtml(fingerprint=field.source_field.fingerprint):
+                    kwargs[field.name] = value.fingerprint
+                case _:
+                    kwargs[field.name] = ""
+        return super().update(**kwargs)
+
+    def bulk_update(
+        self,
+        objs: Iterable[M],
+        fields: Sequence[str],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """Update objs and reset fingerprints of written rich text."""
+        resets = _fingerprint_resets(self.model, fields)
+        if not resets:
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        objs = list(objs)
+        for obj in objs:
+            for field in resets:
+                setattr(obj, field.attname, "")
+        return super().bulk_update(
+            objs,
+            [*fields, *(field.name for field in resets)],
+            batch_size=batch_size,
+        )
+
+
 class DocumentContentField(RichTextField):
     """Class copied in from prose/fields.py."""
 
@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test Projectify lib caches."""
+
+import pytest
+
+from ..cache import LRUCache
+
+
+def test_lru_cache_eviction() -> None:
+    """Test that the least recently used entry is evicted."""
+    cache = LRUCache[str, int](maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.pop("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that entries expire."""
+    now = 100.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    cache = LRUCache[str, int](maxsize=2, ttl=10)
+    cache.set("a", 1)
+    now = 105.0
+    assert cache.get("a") == 1
+    now = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
@@ -3,11 +3,24 @@
 # SPDX-FileCopyrightText: 2026 JWP Consulting GK
 """Test Projectify lib utils."""
 
+from pathlib import Path
 from typing import Optional
 
+from django.core.cache import cache
+
 import pytest
 
-from ..utils import clean_rich_text, static_image_get_with_dimensions
+from projectify.lib.settings import get_settings
+
+from ..utils import (
+    _static_images_load,
+    clean_rich_text,
+    markdown_page,
+    markdown_pages,
+    markdown_pages_prerender,
+    rich_text_policy_fingerprint,
+    static_image_get_with_dimensions,
+)
 
 
 @pytest.mark.parametrize(
@@ -24,6 +37,25 @@ def test_clean_rich_text(html: str, expected: Optional[str]) -> None:
     assert clean_rich_text(html) == expected
 
 
+def test_rich_text_policy_fingerprint() -> None:
+    """Test that fingerprints are stable and differ between policies."""
+    settings = get_settings()
+    user_policy = rich_text_policy_fingerprint(settings.HTML_USER_POLICY)
+    assert user_policy == rich_text_policy_fingerprint(
+        settings.HTML_USER_POLICY
+    )
+    assert len(user_policy) == 64
+    assert user_policy != rich_text_policy_fingerprint(
+        settings.HTML_PROJECTIFY_POLICY
+    )
+
+    # Sanitizing builds private state in the policy, which is ignored
+    clean_rich_text("<p>hello</p>", policy=settings.HTML_USER_POLICY)
+    assert user_policy == rich_text_policy_fingerprint(
+        settings.HTML_USER_POLICY
+    )
+
+
 def test_static_image_get_with_dimensions() -> None:
     """Test getting image dimensions."""
     result = static_image_get_with_dimensions("apple-touch-icon.png")
@@ -34,3 +66,73 @@ def test_static_image_get_with_dimensions() -> None:
     assert "apple-touch-icon.webp" in url
     assert width == 180
     assert height == 180
+
+
+def test_static_image_manifest(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that images in the manifest are not looked up."""
+
+    def find(path: str) -> None:
+        raise AssertionError(f"Looked up {path}")
+
+    monkeypatch.setattr("django.contrib.staticfiles.finders.find", find)
+    result = static_image_get_with_dimensions("status404Image.png")
+    assert result is not None
+    url, width, height = result
+    assert "status404Image.webp" in url
+    assert (width, height) == (1064, 830)
+
+
+def test_static_image_missing_from_manifest(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that missing images are only reported when measured."""
+    monkeypatch.setattr("projectify.lib.utils.static_images", {})
+    cache.delete("static_image_dimensions:apple-touch-icon.png")
+    for _ in range(2):
+        assert static_image_get_with_dimensions("apple-touch-icon.png")
+    missing = [
+        record
+        for record in caplog.records
+        if "not in the static image manifest" in record.getMessage()
+    ]
+    assert len(missing) == 1
+
+
+@pytest.mark.parametrize(
+    "contents", ["not json", "[]", '{"a.png": "a.webp"}', '{"a.png": [1]}']
+)
+def test_static_image_manifest_invalid(
+    contents: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an invalid manifest is ignored."""
+    manifest_path = tmp_path / "static_images.json"
+    manifest_path.write_text(contents)
+    monkeypatch.setattr(get_settings(), "STATIC_IMAGE_MANIFEST", manifest_path)
+    assert _static_images_load() == {}
+
+
+def test_markdown_page(tmp_path: Path) -> None:
+    """Test that pages are compiled again when their file changes."""
+    path = tmp_path / "page.md"
+    path.write_text("# Hello\n\n<script>alert(1)</script>")
+    page = markdown_page(path)
+    assert "Hello</h1>" in page.html
+    assert "script" not in page.html
+    assert markdown_page(path) is page
+
+    path.write_text("# World")
+    assert "World</h1>" in markdown_page(path).html
+
+
+def test_markdown_pages_prerender(tmp_path: Path) -> None:
+    """Test that prerendered pages are used while the file is unchanged."""
+    path = tmp_path / "page.md"
+    path.write_text("# Hello")
+    assert markdown_pages_prerender([path]) == 1
+    manifest = get_settings().MARKDOWN_PAGE_MANIFEST.read_text()
+    assert "Hello</h1>" in manifest
+
+    assert "Hello</h1>" in markdown_page(path).html
+    markdown_pages.clear()
+    path.write_text("# World")
+    assert "World</h1>" in markdown_page(path).html
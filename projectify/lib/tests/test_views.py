@@ -8,6 +8,8 @@ from django.urls import reverse
 
 import pytest
 
+from ..icons import colored_icon_url
+
 
 class TestColoredIconView:
     """Test the colored_icon view."""
@@ -24,6 +26,23 @@ class TestColoredIconView:
         assert response["Content-Type"] == "image/svg+xml"
         assert '<svg style="color: #2563EB' in response.content.decode()
 
+    def test_versioned_url(self, client: Client) -> None:
+        """Test that versioned URLs are cached forever and have an ETag."""
+        url = colored_icon_url("external_links", "primary")
+        assert "?v=" in url
+        response = client.get(url)
+        assert response.status_code == 200
+        assert "immutable" in response["Cache-Control"]
+        etag = response["ETag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        # Unversioned or outdated URLs are only cached for a day
+        response = client.get(url.replace("?v=", "?v=old"))
+        assert response["Cache-Control"] == "max-age=86400"
+        assert response["ETag"] == etag
+
     @pytest.mark.parametrize(
         ("icon", "color"),
         [
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test Projectify lib periodic workers."""
+
+import threading
+from typing import Optional
+
+from ..worker import PeriodicWorker
+
+
+def test_periodic_worker() -> None:
+    """Test that the worker runs repeatedly and survives errors."""
+    runs: list[int] = []
+    done = threading.Event()
+
+    def run() -> None:
+        runs.append(len(runs))
+        if len(runs) == 1:
+            raise RuntimeError("First run fails")
+        done.set()
+
+    worker = PeriodicWorker(name="test-worker", run=run, interval=lambda: 0.01)
+    worker.start()
+    # Only one thread per process
+    worker.start()
+    try:
+        assert done.wait(timeout=5)
+    finally:
+        worker.stop()
+    assert runs[:2] == [0, 1]
+
+
+def test_periodic_worker_disabled() -> None:
+    """Test that no thread starts without an interval."""
+    interval: Optional[float] = None
+    worker = PeriodicWorker(
+        name="test-worker-disabled",
+        run=lambda: None,
+        interval=lambda: interval,
+    )
+    worker.start()
+    assert not any(
+        thread.name == "test-worker-disabled"
+        for thread in threading.enumerate()
+    )
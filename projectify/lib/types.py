@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: 2024 JWP Consulting GK
+# SPDX-FileCopyrightText: 2024,2026 JWP Consulting GK
 # SPDX-License-Identifier: AGPL-3.0-or-later
 """Types used across apps."""
 
@@ -6,6 +6,7 @@ from collections.abc import Sequence
 from typing import Any, Protocol, Union
 
 from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
 from django.urls import URLPattern, URLResolver
 
 from projectify.user.models import User
@@ -28,7 +29,7 @@ class LoggedInViewP(Protocol):
 
     def __call__(
         self, request: AuthenticatedHttpRequest, *args: Any, **kwargs: Any
-    ) -> HttpResponse:
+    ) -> HttpResponseBase:
         """Take a request and respond."""
         ...
 
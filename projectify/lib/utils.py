@@ -3,9 +3,15 @@
 # SPDX-FileCopyrightText: 2026 JWP Consulting GK
 """Projectify utils."""
 
+import dataclasses
+import functools
+import hashlib
+import json
 import logging
+from collections.abc import Iterable, Mapping
+from importlib.metadata import version
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from django.contrib.staticfiles import finders
 from django.core.cache import cache
@@ -13,10 +19,12 @@ from django.templatetags import static
 from django.utils.safestring import SafeString, mark_safe
 
 from justhtml import Decide, JustHTML, Node, PruneEmpty, SanitizationPolicy
+from justhtml.transforms import TransformSpec
 from justhtml.transforms_spec import DecideAction
 from markdown import Markdown
 from PIL import Image
 
+from projectify.lib.cache import LRUCache
 from projectify.lib.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -34,6 +42,67 @@ def has_only_br(node: Node) -> DecideAction:
             return DecideAction.KEEP
 
 
+# Bump this whenever rich_text_transforms() changes. This invalidates all
+# stored rich text fingerprints.
+RICH_TEXT_TRANSFORMS_VERSION = 1
+
+
+def rich_text_transforms() -> list[TransformSpec]:
+    """Return the transforms that JustHTML applies when sanitizing rich text."""
+    return [Decide("p", has_only_br), PruneEmpty("*")]
+
+
+def _canonicalize_policy(value: object) -> object:
+    """Turn a sanitization policy into a JSON-serializable, ordered value."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Private fields hold state built while sanitizing, like compiled
+        # transforms, which must not change the fingerprint
+        return {
+            field.name: _canonicalize_policy(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+            if not field.name.startswith("_")
+        }
+    match value:
+        case Mapping():
+            # Keys can be tuples, e.g., ("a", "href") in UrlPolicy
+            return sorted(
+                (
+                    [_canonicalize_policy(k), _canonicalize_policy(v)]
+                    for k, v in value.items()
+                ),
+                key=repr,
+            )
+        # Set iteration order depends on PYTHONHASHSEED, so sort them
+        case set() | frozenset():
+            return sorted((_canonicalize_policy(v) for v in value), key=repr)
+        case list() | tuple():
+            return [_canonicalize_policy(v) for v in value]
+        case None | bool() | int() | float() | str():
+            return value
+        case _ if callable(value):
+            return getattr(value, "__qualname__", type(value).__name__)
+        case _:
+            return repr(value)
+
+
+def rich_text_policy_fingerprint(policy: SanitizationPolicy) -> str:
+    """
+    Return a stable fingerprint for sanitizing rich text with `policy`.
+
+    The fingerprint is the same across processes and changes whenever the
+    policy, the rich text transforms, or the JustHTML version change.
+    """
+    canonical = json.dumps(
+        {
+            "policy": _canonicalize_policy(policy),
+            "transforms": RICH_TEXT_TRANSFORMS_VERSION,
+            "justhtml": version("justhtml"),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
 def clean_rich_text(
     unsafe_html: str, policy: SanitizationPolicy = settings.HTML_USER_POLICY
 ) -> SafeString:
@@ -43,7 +112,7 @@ def clean_rich_text(
         unsafe_html,
         policy=policy,
         fragment=True,
-        transforms=[Decide("p", has_only_br), PruneEmpty("*")],
+        transforms=rich_text_transforms(),
     ).to_html(pretty=False)
     # Remember that just marking it "safe" doesn't make it safe
     # sanitized_html is safe to mark as "safe" because `JustHTML` has
@@ -52,15 +121,55 @@ def clean_rich_text(
     return safe_html
 
 
+def _static_images_load() -> Mapping[str, Tuple[str, int, int]]:
+    """Load static image paths and dimensions written by compress_images."""
+    manifest_path = settings.STATIC_IMAGE_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+        return {
+            str(src): (str(path), int(width), int(height))
+            for src, (path, width, height) in manifest.items()
+        }
+    except FileNotFoundError:
+        logger.warning("Static image manifest %s not found", manifest_path)
+        return {}
+    except (AttributeError, TypeError, ValueError):
+        # Raised by json.loads() and for entries that aren't
+        # [path, width, height]
+        logger.warning(
+            "Ignoring invalid static image manifest %s", manifest_path
+        )
+        return {}
+
+
+# Loaded once, so that rendering pictures doesn't need to read any files
+static_images = _static_images_load()
+
+
 def static_image_get_with_dimensions(
     src: str,
 ) -> Optional[Tuple[str, int, int]]:
-    """Return static image file path and dimensions."""
+    """
+    Return static image file path and dimensions.
+
+    Images missing from STATIC_IMAGE_MANIFEST are found and measured instead.
+    """
+    match static_images.get(src):
+        case (str(path), int(width), int(height)):
+            return static.static(path), width, height
+        case _:
+            pass
     cache_key = f"static_image_dimensions:{src}"
     cached_result: Optional[Tuple[str, int, int]] = cache.get(cache_key)
     if cached_result is not None:
         return cached_result
 
+    logger.warning(
+        "'%s' is not in the static image manifest, please run "
+        "./manage.py compress_images",
+        src,
+    )
+
     webp_src = str(Path(src).with_suffix(".webp"))
     final_src = webp_src
     file_path = finders.find(webp_src)
@@ -116,3 +225,113 @@ def markdown_to_safe_html(
     else:
         safe_toc = None
     return safe_html, safe_toc
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MarkdownPage:
+    """Safe HTML and table of contents of a markdown file."""
+
+    html: SafeString
+    toc: Optional[SafeString]
+    # Modification time of the file this was compiled from
+    mtime_ns: int
+
+
+# Help and storefront pages, keyed by file path
+markdown_pages = LRUCache[Path, MarkdownPage](maxsize=64)
+
+
+def markdown_pages_fingerprint() -> str:
+    """Return a fingerprint of everything that affects compiled pages."""
+    settings = get_settings()
+    canonical = json.dumps(
+        {
+            "extensions": settings.MARKDOWN_EXTENSIONS,
+            "markdown": version("markdown"),
+            "policy": rich_text_policy_fingerprint(
+                settings.HTML_PROJECTIFY_POLICY
+            ),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _markdown_page_key(path: Path) -> str:
+    """Return the manifest key for path, relative to BASE_DIR if possible."""
+    base_dir = get_settings().BASE_DIR
+    if path.is_relative_to(base_dir):
+        return str(path.relative_to(base_dir))
+    return str(path)
+
+
+@functools.cache
+def _markdown_pages_manifest() -> Mapping[str, Mapping[str, Any]]:
+    """Load pages prerendered with ./manage.py markdown_prerender."""
+    manifest_path = get_settings().MARKDOWN_PAGE_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.warning("Ignoring invalid page manifest %s", manifest_path)
+        return {}
+    if manifest.get("fingerprint") != markdown_pages_fingerprint():
+        logger.warning("Ignoring outdated page manifest %s", manifest_path)
+        return {}
+    pages: Mapping[str, Mapping[str, Any]] = manifest["pages"]
+    return pages
+
+
+def markdown_page(path: Path) -> MarkdownPage:
+    """
+    Return the compiled markdown file at path.
+
+    Pages are compiled once per process and modification time, unless
+    markdown_prerender has already compiled the same file contents.
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    page = markdown_pages.get(path)
+    if page is not None and page.mtime_ns == mtime_ns:
+        return page
+    markdown = path.read_text()
+    digest = hashlib.sha256(markdown.encode()).hexdigest()
+    match _markdown_pages_manifest().get(_markdown_page_key(path)):
+        case {"sha256": str(sha256), "html": str(html), "toc": toc} if (
+            sha256 == digest
+        ):
+            # These were sanitized by markdown_to_safe_html() when
+            # prerendering
+            page = MarkdownPage(
+                html=mark_safe(html),
+                toc=None if toc is None else mark_safe(toc),
+                mtime_ns=mtime_ns,
+            )
+        case _:
+            html, toc = markdown_to_safe_html(markdown)
+            page = MarkdownPage(html=html, toc=toc, mtime_ns=mtime_ns)
+    markdown_pages.set(path, page)
+    return page
+
+
+def markdown_pages_prerender(paths: Iterable[Path]) -> int:
+    """
+    Compile markdown files at paths into MARKDOWN_PAGE_MANIFEST.
+
+    Return the number of pages written.
+    """
+    pages: dict[str, dict[str, Optional[str]]] = {}
+    for path in paths:
+        markdown = path.read_text()
+        html, toc = markdown_to_safe_html(markdown)
+        pages[_markdown_page_key(path)] = {
+            "sha256": hashlib.sha256(markdown.encode()).hexdigest(),
+            "html": str(html),
+            "toc": None if toc is None else str(toc),
+        }
+    manifest = {"fingerprint": markdown_pages_fingerprint(), "pages": pages}
+    manifest_path = get_settings().MARKDOWN_PAGE_MANIFEST
+    manifest_path.write_text(json.dumps(manifest, sort_keys=True))
+    _markdown_pages_manifest.cache_clear()
+    markdown_pages.clear()
+    return len(pages)
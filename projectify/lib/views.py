@@ -1,10 +1,17 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
 # SPDX-FileCopyrightText: 2026 JWP Consulting GK
-"""View decorators."""
+"""View decorators and helpers."""
+
+from typing import cast
 
 from django.contrib.auth.decorators import login_required
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.views.generic import RedirectView
 
 from projectify.lib.types import DjangoView, LoggedInViewP
@@ -41,3 +48,18 @@ def platform_view(func: LoggedInViewP) -> LoggedInViewP:
 def permanent_redirect(urlname: str) -> DjangoView:
     """Return a permanent redirect view function."""
     return RedirectView.as_view(url=reverse_lazy(urlname), permanent=True)
+
+
+def etag_response(
+    request: HttpRequest, response: HttpResponse, etag: str
+) -> HttpResponseBase:
+    """
+    Add a strong ETag to response.
+
+    Return 304 Not Modified instead if the client already has this version.
+    """
+    response["ETag"] = quote_etag(etag)
+    conditional = get_conditional_response(
+        cast(WSGIRequest, request), etag=response["ETag"], response=response
+    )
+    return response if conditional is None else conditional
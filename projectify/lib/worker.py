@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Periodic background workers."""
+
+import atexit
+import logging
+import os
+import threading
+from collections.abc import Callable
+from typing import Optional
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """
+    Call a function every few seconds in a daemon thread.
+
+    interval is read when the thread starts. If it returns None or 0, no
+    thread is started, and start() checks it again next time. at_exit is
+    called when the process exits, e.g., to write what is still buffered.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        run: Callable[[], object],
+        interval: Callable[[], Optional[float]],
+        at_exit: Optional[Callable[[], object]] = None,
+    ) -> None:
+        """Create a worker. Nothing runs until start() is called."""
+        self.name = name
+        self._run = run
+        self._interval = interval
+        self._at_exit = at_exit
+        self._at_exit_registered = False
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start the thread, unless it already runs in this process."""
+        # Threads don't survive forking, e.g., in preloaded gunicorn workers
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            interval = self._interval()
+            if not interval:
+                return
+            self._pid = pid
+            self._stopped = threading.Event()
+            threading.Thread(
+                target=self._run_forever,
+                args=(interval, self._stopped),
+                name=self.name,
+                daemon=True,
+            ).start()
+            # Forked processes inherit handlers registered before the fork
+            if self._at_exit is not None and not self._at_exit_registered:
+                atexit.register(self._at_exit)
+                self._at_exit_registered = True
+
+    def stop(self) -> None:
+        """Stop the thread after its current run."""
+        with self._lock:
+            self._pid = None
+            self._stopped.set()
+
+    def _run_forever(self, interval: float, stopped: threading.Event) -> None:
+        """Call run every interval seconds until stopped."""
+        while not stopped.wait(interval):
+            try:
+                self._run()
+            except Exception:
+                # Anything escaping here would stop the thread for good
+                logger.exception("Periodic worker %s failed", self.name)
+            finally:
+                # This thread has its own connections
+                connections.close_all()
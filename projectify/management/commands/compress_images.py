@@ -1,8 +1,14 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
 # SPDX-FileCopyrightText: 2026 JWP Consulting GK
-"""Compress static images to webp."""
+"""
+Compress static images to webp.
 
+Also write STATIC_IMAGE_MANIFEST, so that the picture tag knows the paths and
+dimensions of all images without reading them.
+"""
+
+import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -12,6 +18,8 @@ from django.core.management.base import BaseCommand
 
 from PIL import Image
 
+from projectify.lib.settings import get_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,22 +37,29 @@ class Command(BaseCommand):
         # See
         # django/contrib/staticfiles/management/commands/collectstatic.py
         # Command.collect()
-        static_files: list[Path] = []
+        # Static path -> file path, first finder wins like in finders.find()
+        static_files: dict[str, Path] = {}
         finders = get_finders()
         for finder in finders:
             for path, storage in finder.list(None):
-                path = storage.path(path)
-                static_files.append(Path(path))
+                static_files.setdefault(path, Path(storage.path(path)))
 
-        png_files: list[Path] = [
-            p for p in static_files if p.suffix in [".png"]
-        ]
+        png_files: dict[str, Path] = {
+            k: p for k, p in static_files.items() if p.suffix in [".png"]
+        }
 
         count = 0
-        for count, png_path in enumerate(png_files):
+        manifest: dict[str, tuple[str, int, int]] = {}
+        for count, (src, png_path) in enumerate(png_files.items()):
             webp_path = png_path.with_suffix(".webp")
             with Image.open(png_path) as img:
                 img.save(webp_path, "WebP", quality=QUALITY)
+                width, height = img.size
+            manifest[src] = (
+                str(Path(src).with_suffix(".webp")),
+                width,
+                height,
+            )
             original_size = png_path.stat().st_size
             compressed_size = webp_path.stat().st_size
             self.stdout.write(
@@ -52,3 +67,9 @@ class Command(BaseCommand):
             )
 
         self.stdout.write(f"Converted {count} .png images")
+
+        manifest_path = get_settings().STATIC_IMAGE_MANIFEST
+        manifest_path.write_text(
+            json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+        )
+        self.stdout.write(f"Wrote image dimensions to {manifest_path}")
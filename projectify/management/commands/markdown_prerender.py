@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Compile help and storefront markdown pages ahead of time.
+
+Run this when deploying, so that serving these pages doesn't need to convert
+and sanitize markdown. Pages whose file has changed since are compiled on
+first use instead.
+"""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from projectify.lib.settings import get_settings
+from projectify.lib.utils import markdown_pages_prerender
+
+
+class Command(BaseCommand):
+    """Compile markdown pages."""
+
+    help = "Compile help and storefront markdown pages ahead of time"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Handle."""
+        del args, options
+        settings = get_settings()
+        paths = sorted(settings.BASE_DIR.glob("*/markdown_*/**/*.md"))
+        count = markdown_pages_prerender(paths)
+        self.stdout.write(
+            f"Compiled {count} pages into {settings.MARKDOWN_PAGE_MANIFEST}"
+        )
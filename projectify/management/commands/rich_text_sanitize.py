@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Sanitize rich text stored under an outdated sanitization policy.
+
+Rows with a stale fingerprint are sanitized lazily whenever they are loaded.
+Run this command after changing HTML_USER_POLICY, the rich text transforms,
+or upgrading JustHTML, so that reads don't have to sanitize anymore.
+"""
+
+from argparse import ArgumentParser
+from typing import Any
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projectify.lib.models import SanitizationFingerprintField
+
+
+class Command(BaseCommand):
+    """Sanitize rich text with a stale fingerprint."""
+
+    help = "Sanitize rich text stored under an outdated sanitization policy"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add arguments."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of rows to load at once",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        """Handle."""
+        del args
+        chunk_size: int = options["chunk_size"]
+        for model in apps.get_models():
+            for field in model._meta.concrete_fields:
+                if not isinstance(field, SanitizationFingerprintField):
+                    continue
+                source_field = field.source_field
+                stale = (
+                    model._default_manager.exclude(
+                        **{field.attname: source_field.fingerprint}
+                    )
+                    .exclude(**{f"{source_field.attname}__isnull": True})
+                    .only("pk", source_field.attname, field.attname)
+                )
+                count = 0
+                # Loading an instance sanitizes it, see
+                # SanitizationFingerprintField.verify()
+                for count, instance in enumerate(
+                    stale.iterator(chunk_size=chunk_size), start=1
+                ):
+                    with transaction.atomic():
+                        model._default_manager.filter(pk=instance.pk).update(
+                            **{
+                                source_field.attname: getattr(
+                                    instance, source_field.attname
+                                ),
+                                field.attname: source_field.fingerprint,
+                            }
+                        )
+                self.stdout.write(
+                    f"Sanitized {count} {model._meta.label} "
+                    f"{source_field.name} values"
+                )
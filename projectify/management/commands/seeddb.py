@@ -55,6 +55,10 @@ from projectify.user.services.internal import (
 )
 from projectify.workspace.const import TeamMemberRoles
 from projectify.workspace.models import Project, Task, TeamMember, Workspace
+from projectify.workspace.services.quota import (
+    workspace_quota_counter_reconcile,
+)
+from projectify.workspace.services.search import search_index_rebuild
 
 
 @dataclass
@@ -263,6 +267,11 @@ class Command(BaseCommand):
         ]
 
         self.create_tasks(workspace_descriptions)
+        for workspace in workspaces:
+            workspace_quota_counter_reconcile(workspace=workspace)
+        self.stdout.write(f"Counted quotas for {len(workspaces)} workspaces")
+        indexed = search_index_rebuild()
+        self.stdout.write(f"Indexed {indexed} tasks and projects for search")
         return workspaces
 
     def create_corporate_accounts(
@@ -1,14 +1,22 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2022-2024 JWP Consulting GK
+# SPDX-FileCopyrightText: 2022-2026 JWP Consulting GK
 """Projectify middlewares."""
 
 import logging
-from typing import Callable
+from typing import Callable, Union, cast
 
+from django.contrib.auth.middleware import get_user
+from django.contrib.auth.models import AnonymousUser
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import DatabaseError
 from django.http import HttpRequest, HttpResponse
+from django.utils.functional import SimpleLazyObject
 
+from projectify.lib.auth import WorkspaceRoles
 from projectify.lib.settings import get_settings
+from projectify.user.models import User
+from projectify.workspace.services.team_member import team_member_visits_flush
 
 logger = logging.getLogger(__name__)
 
@@ -65,3 +73,56 @@ def reverse_proxy(get_response: GetResponse) -> GetResponse:
         return get_response(request)
 
     return process_request
+
+
+def workspace_roles(get_response: GetResponse) -> GetResponse:
+    """
+    Attach request-scoped team member roles to the requesting user.
+
+    Permission checks then load all of the user's roles with one query,
+    instead of querying once for every Workspace instance they see. Like
+    AuthenticationMiddleware, this stays lazy, so requests that never touch
+    request.user don't load it.
+
+    Needs to come after AuthenticationMiddleware.
+    """
+
+    def process_request(request: HttpRequest) -> HttpResponse:
+        def get_user_with_roles() -> Union[User, AnonymousUser]:
+            user = get_user(cast(WSGIRequest, request))
+            if isinstance(user, AnonymousUser):
+                return user
+            # AUTH_USER_MODEL is projectify.user.models.User
+            assert isinstance(user, User)
+            if user.workspace_roles is None:
+                user.workspace_roles = WorkspaceRoles(user)
+            return user
+
+        request.user = cast(
+            Union[User, AnonymousUser], SimpleLazyObject(get_user_with_roles)
+        )
+        return get_response(request)
+
+    return process_request
+
+
+def team_member_visits(get_response: GetResponse) -> GetResponse:
+    """
+    Write buffered team member visits at the end of a request.
+
+    Visits are written at most every TEAM_MEMBER_VISIT_FLUSH_INTERVAL
+    seconds, so that page views don't turn into a write every time. A
+    background thread writes the visits left when no request follows.
+    """
+    interval = get_settings().TEAM_MEMBER_VISIT_FLUSH_INTERVAL
+
+    def process_request(request: HttpRequest) -> HttpResponse:
+        response = get_response(request)
+        # The response is ready, so losing a batch of visits shouldn't fail it
+        try:
+            team_member_visits_flush(interval=interval)
+        except DatabaseError:
+            logger.exception("Couldn't write team member visits")
+        return response
+
+    return process_request
@@ -9,6 +9,7 @@ from typing import Optional
 import rules
 from rules.predicates import is_superuser
 
+from projectify.lib.auth import WorkspaceQuotas, WorkspaceRoles
 from projectify.user.models import User
 from projectify.workspace.const import TeamMemberRoles
 from projectify.workspace.models import TeamMember, Workspace
@@ -48,19 +49,28 @@ ROLE_EQUIVALENCE = {
 def check_permissions_for(
     role: TeamMemberRoles, user: User, workspace: Optional[Workspace]
 ) -> bool:
-    """Check whether a user has required role for target."""
+    """
+    Check whether a user has required role for target.
+
+    Use the user's request-scoped roles, if available. Otherwise, look up
+    the role.
+    """
     if workspace is None:
         return False
-    if user.pk in workspace.role_cache:
-        team_member_role = workspace.role_cache[user.pk]
+    workspace_roles: Optional[WorkspaceRoles] = getattr(
+        user, "workspace_roles", None
+    )
+    if workspace_roles is not None:
+        team_member_role = workspace_roles.get(workspace)
     else:
         team_member = team_member_find_for_workspace(
             workspace=workspace, user=user
         )
-        if team_member is None:
-            return False
-        team_member_role = TeamMemberRoles[team_member.role]
-        workspace.role_cache[user.pk] = team_member_role
+        team_member_role = (
+            None if team_member is None else TeamMemberRoles[team_member.role]
+        )
+    if team_member_role is None:
+        return False
     return ROLE_EQUIVALENCE[team_member_role][role]
 
 
@@ -84,10 +94,26 @@ is_at_least_owner = rules.predicate(
 def can_create_more(
     resource: Resource, _user: User, workspace: Workspace
 ) -> bool:
-    """Extract .can_create_more from workspace_quota_for."""
-    return workspace_quota_for(
-        resource=resource, workspace=workspace
-    ).can_create_more
+    """
+    Extract .can_create_more from workspace_quota_for.
+
+    Use the workspace's batch quotas, if available.
+    """
+    workspace_quotas: Optional[WorkspaceQuotas] = getattr(
+        workspace, "workspace_quotas", None
+    )
+    if workspace_quotas is None:
+        return workspace_quota_for(
+            resource=resource, workspace=workspace
+        ).can_create_more
+    quota = workspace_quotas.get(workspace)
+    match resource:
+        case "Task":
+            return quota.tasks.can_create_more
+        case "Project":
+            return quota.projects.can_create_more
+        case "TeamMemberAndInvite":
+            return quota.team_members_and_invites.can_create_more
 
 
 # Quota predicates
@@ -126,7 +126,8 @@ class Base(Configuration):
         "script-src": [CSP.SELF, CSP.NONCE],
         "font-src": [CSP.SELF],
         "style-src": [CSP.SELF, CSP.NONCE],
-        "img-src": [CSP.SELF],
+        # data: for inline avatar marbles, see user_avatar
+        "img-src": [CSP.SELF, "data:"],
         "form-action": [
             CSP.SELF,
             "https://github.com",
@@ -207,6 +208,9 @@ class Base(Configuration):
         # After SessionMiddleware if you’re using CSRF_USE_SESSIONS.
         "django.middleware.csrf.CsrfViewMiddleware",
         "django.contrib.auth.middleware.AuthenticationMiddleware",
+        # After AuthenticationMiddleware
+        "projectify.middleware.workspace_roles",
+        "projectify.middleware.team_member_visits",
         "django.contrib.messages.middleware.MessageMiddleware",
         "django.middleware.clickjacking.XFrameOptionsMiddleware",
         "projectify.lib.htmx.HtmxMiddleware",
@@ -236,6 +240,23 @@ class Base(Configuration):
     # 30 days
     USER_EVENT_RETENTION_PERIOD: int = 30 * 24 * 60 * 60
 
+    # How often to write buffered last visited workspaces and projects
+    # In seconds
+    TEAM_MEMBER_VISIT_FLUSH_INTERVAL: float = 60
+
+    # How often to write buffered page hits, in seconds
+    # None means that hits are only written with daily_count_flush()
+    STATS_FLUSH_INTERVAL: Optional[float] = 10
+
+    # How often to check whether other processes changed the sitemap URLs,
+    # in seconds
+    # None means that URLs are only rebuilt with SitemapUrls.refresh()
+    STATS_SITEMAP_CHECK_INTERVAL: Optional[float] = 5
+
+    # How long to keep DailyCount records after they were rolled up
+    # 400 days
+    STATS_DAILY_COUNT_RETENTION_PERIOD: int = 400 * 24 * 60 * 60
+
     # Password validation
     # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
     AUTH_PASSWORD_VALIDATORS = [
@@ -338,6 +359,8 @@ class Base(Configuration):
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
         },
     }
+    # Static image paths and dimensions, written by ./manage.py compress_images
+    STATIC_IMAGE_MANIFEST = BASE_DIR / "static_images.json"
     # https://github.com/openwisp/django-minify-compress-staticfiles?tab=readme-ov-file#settings
     # Allow compressing minified files
     MINICOMPRESS_EXCLUDE_PATTERNS = ["*.gz", "*.br", "*.zip"]
@@ -553,6 +576,8 @@ class Base(Configuration):
         "markdown.extensions.tables",
         "markdown.extensions.toc",
     ]
+    # Pages compiled by ./manage.py markdown_prerender
+    MARKDOWN_PAGE_MANIFEST = BASE_DIR / "markdown_pages.json"
 
     @classmethod
     def setup(cls) -> None:
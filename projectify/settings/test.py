@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2021, 2022, 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2021, 2022, 2023, 2026 JWP Consulting GK
 """Test settings."""
 
 import secrets
@@ -49,6 +49,15 @@ class Test(Base):
     # Enable premail preview for testing
     PREMAIL_PREVIEW = True
 
+    # Write last visited workspaces and projects after every request
+    TEAM_MEMBER_VISIT_FLUSH_INTERVAL = 0
+
+    # Don't write page hits in a background thread
+    STATS_FLUSH_INTERVAL = None
+
+    # Don't refresh sitemap URLs in a background thread
+    STATS_SITEMAP_CHECK_INTERVAL = None
+
     @classmethod
     def pre_setup(cls) -> None:
         """Load environment variables from .env."""
@@ -59,6 +68,9 @@ class Test(Base):
         weakref.finalize(temp_dir, temp_dir.cleanup)
         cls.MEDIA_ROOT = Path(temp_dir.name) / "media"
         cls.STATIC_ROOT = Path(temp_dir.name) / "staticfiles"
+        cls.MARKDOWN_PAGE_MANIFEST = (
+            Path(temp_dir.name) / "markdown_pages.json"
+        )
 
     @classmethod
     def setup(cls) -> None:
@@ -6,14 +6,13 @@
 from datetime import date, timedelta
 
 from django.contrib import admin
-from django.db.models import Sum
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.urls import URLPattern, path
 from django.utils.translation import gettext_lazy as _
 
 from projectify.lib.admin import ReadOnlyAdmin
-from projectify.stats.models import DailyCount
+from projectify.stats.models import DailyCount, DailyTotal, MonthlyCount
 
 
 @admin.register(DailyCount)
@@ -39,25 +38,24 @@ class DailyCountAdmin(ReadOnlyAdmin[DailyCount], admin.ModelAdmin[DailyCount]):
         return custom + urls
 
     def stats_summary_view(self, request: HttpRequest) -> HttpResponse:
-        """Render summarized stats page."""
+        """
+        Render summarized stats page.
+
+        Reads rollups, see stats_rollup().
+        """
         today = date.today()
-        per_page_31 = (
-            DailyCount.objects.filter(date__gte=today - timedelta(days=31))
-            .values("name")
-            .annotate(total=Sum("count"))
-            .order_by("-total")
-        )
-        per_day_31 = (
-            DailyCount.objects.filter(date__gte=today - timedelta(days=31))
-            .values("date")
-            .annotate(total=Sum("count"))
-            .order_by("-date")
-        )
+        last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+        per_page_month = MonthlyCount.objects.filter(
+            month__gte=last_month
+        ).order_by("-month", "-count")
+        per_day_31 = DailyTotal.objects.filter(
+            date__gte=today - timedelta(days=31)
+        ).order_by("-date")
 
         context = {
             **self.admin_site.each_context(request),
             "title": _("Summary"),
-            "per_page_31": list(per_page_31),
+            "per_page_month": list(per_page_month),
             "per_day_31": list(per_day_31),
             "opts": self.model._meta,
         }
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Roll up daily counts and clean up old ones."""
+
+from argparse import ArgumentParser
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+
+from projectify.lib.settings import get_settings
+from projectify.stats.services.rollup import stats_rollup
+
+
+class Command(BaseCommand):
+    """Roll up daily counts."""
+
+    help = "Roll up recent daily counts and delete old ones"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add arguments."""
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="Number of days to recompute, including today",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Handle."""
+        del args
+        days = options["days"]
+        assert isinstance(days, int)
+        settings = get_settings()
+        today = now().date()
+        retention = timedelta(
+            seconds=settings.STATS_DAILY_COUNT_RETENTION_PERIOD
+        )
+        result = stats_rollup(
+            since=today - timedelta(days=max(days, 1) - 1),
+            retain_until=today - retention,
+        )
+        self.stdout.write(
+            f"Rolled up {result.monthly_counts} monthly counts and "
+            f"{result.daily_totals} daily totals, deleted {result.deleted} "
+            "daily counts"
+        )
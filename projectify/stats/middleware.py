@@ -4,55 +4,41 @@
 """Projectify statistics middleware."""
 
 import datetime
-from collections.abc import Sequence
-from functools import lru_cache
-from typing import Any, Callable, cast
+import logging
+from typing import Callable
 
-from django.contrib.sitemaps import Sitemap
-from django.db import transaction
-from django.db.models import F
+from django.db import DatabaseError
 from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
 
-from projectify.urls import sitemaps
+from .services.daily_count import hit_buffer
+from .services.sitemap import sitemap_urls
 
-from .models import DailyCount
+logger = logging.getLogger(__name__)
 
 GetResponse = Callable[[HttpRequest], HttpResponse]
 
 
-@lru_cache(maxsize=1)
-def get_sitemap_urls() -> set[str]:
-    """Get all URLs from sitemaps, cached."""
-    sitemap_urls: set[str] = set()
-    for sitemap_class in sitemaps.values():
-        sitemap: Sitemap = sitemap_class()
-        items = cast(Sequence[Any], sitemap.items())
-        for item in items:
-            url: str = sitemap.location(item)
-            sitemap_urls.add(url)
-    return sitemap_urls
-
-
 def track_hit(path: str) -> None:
-    """Track a hit for a given path."""
-    sitemap_urls = get_sitemap_urls()
+    """
+    Track a hit for a given path.
+
+    The hit is only counted in memory, see daily_count_flush(), and the
+    path is looked up in memory as well, see SitemapUrls.
+    """
     if path not in sitemap_urls:
         return
     today = timezone.now().astimezone(datetime.timezone.utc).date()
-    with transaction.atomic():
-        hit_count_qs = DailyCount.objects.filter(
-            name=path, date=today
-        ).select_for_update()
-
-        if hit_count_qs.exists():
-            hit_count_qs.update(count=F("count") + 1)
-        else:
-            DailyCount.objects.create(name=path, date=today, count=1)
+    hit_buffer.add(name=path, date=today)
 
 
 def count_stats(get_response: GetResponse) -> GetResponse:
     """Middleware to track daily hit counts for sitemap URLs."""
+    # Middleware is created once per worker when it starts
+    try:
+        sitemap_urls.warm()
+    except DatabaseError:
+        logger.exception("Couldn't build sitemap URLs")
 
     def process_request(request: HttpRequest) -> HttpResponse:
         response = get_response(request)
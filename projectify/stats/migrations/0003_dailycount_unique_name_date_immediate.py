@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Make the name and date constraint immediate.
+
+INSERT ... ON CONFLICT can't use deferrable constraints on PostgreSQL.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [
+        ("stats", "0002_dailycount_stats_dailycount_date_and_name")
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="dailycount", name="unique_name_date"
+        ),
+        migrations.AddConstraint(
+            model_name="dailycount",
+            constraint=models.UniqueConstraint(
+                fields=("name", "date"), name="unique_name_date"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Add the shared sitemap URL version."""
+
+from django.db import migrations, models
+
+import projectify.lib.models
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [("stats", "0003_dailycount_unique_name_date_immediate")]
+
+    operations = [
+        migrations.CreateModel(
+            name="SitemapVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    projectify.lib.models.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    projectify.lib.models.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={"get_latest_by": "modified", "abstract": False},
+        )
+    ]
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Add monthly and daily total rollups."""
+
+from django.db import migrations, models
+
+import projectify.lib.models
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [("stats", "0004_sitemapversion")]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    projectify.lib.models.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    projectify.lib.models.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                ("date", models.DateField(unique=True)),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={"get_latest_by": "modified", "abstract": False},
+        ),
+        migrations.CreateModel(
+            name="MonthlyCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    projectify.lib.models.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    projectify.lib.models.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                ("name", models.CharField(max_length=2048)),
+                ("month", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("name", "month"), name="unique_name_month"
+                    )
+                ]
+            },
+        ),
+    ]
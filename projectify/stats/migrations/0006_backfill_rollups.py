@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Roll up all daily counts that existed before rollups were added."""
+
+from typing import Any
+
+import django.db.migrations.operations.special
+from django.apps.registry import Apps
+from django.db import migrations
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_rollups(apps: Apps, schema_editor: object) -> None:
+    """Compute monthly counts and daily totals for every daily count."""
+    del schema_editor
+    DailyCount: Any = apps.get_model("stats", "DailyCount")
+    MonthlyCount: Any = apps.get_model("stats", "MonthlyCount")
+    DailyTotal: Any = apps.get_model("stats", "DailyTotal")
+    monthly = (
+        DailyCount.objects.annotate(month=TruncMonth("date"))
+        .values_list("name", "month")
+        .annotate(total=Sum("count"))
+        .order_by()
+    )
+    MonthlyCount.objects.bulk_create(
+        [
+            MonthlyCount(name=name, month=month, count=total)
+            for name, month, total in monthly
+        ],
+        update_conflicts=True,
+        unique_fields=["name", "month"],
+        update_fields=["count", "modified"],
+    )
+    daily = (
+        DailyCount.objects.values_list("date")
+        .annotate(total=Sum("count"))
+        .order_by()
+    )
+    DailyTotal.objects.bulk_create(
+        [DailyTotal(date=date, count=total) for date, total in daily],
+        update_conflicts=True,
+        unique_fields=["date"],
+        update_fields=["count", "modified"],
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [("stats", "0005_monthlycount_dailytotal")]
+
+    operations = [
+        migrations.RunPython(
+            code=backfill_rollups,
+            reverse_code=django.db.migrations.operations.special.RunPython.noop,
+        )
+    ]
@@ -25,9 +25,47 @@ class DailyCount(BaseModel):
             )
         ]
         constraints = [
+            # Not deferrable, so that hits can be written with
+            # INSERT ... ON CONFLICT, see daily_count_flush()
             models.UniqueConstraint(
-                fields=["name", "date"],
-                name="unique_name_date",
-                deferrable=models.Deferrable.DEFERRED,
+                fields=["name", "date"], name="unique_name_date"
             )
         ]
+
+
+class MonthlyCount(BaseModel):
+    """
+    Monthly count for a name, summed up from DailyCount.
+
+    month is the first day of the month.
+    """
+
+    name = models.CharField(max_length=2048)
+    month = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """Meta options."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["name", "month"], name="unique_name_month"
+            )
+        ]
+
+
+class DailyTotal(BaseModel):
+    """Count for all names on one day, summed up from DailyCount."""
+
+    date = models.DateField(unique=True)
+    count = models.PositiveIntegerField(default=0)
+
+
+class SitemapVersion(BaseModel):
+    """
+    Version of the sitemap URLs, shared by all processes.
+
+    There is only one row, see projectify.stats.services.sitemap.
+    """
+
+    version = models.PositiveBigIntegerField(default=0)
@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Daily count services.
+
+Hits are counted in process memory and written by a background worker, so
+that counting a hit never touches the database. Each flush writes all
+counts with one INSERT ... ON CONFLICT DO UPDATE per name and date.
+"""
+
+import datetime
+import logging
+import threading
+from collections import Counter
+
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from projectify.lib.settings import get_settings
+from projectify.lib.worker import PeriodicWorker
+
+from ..models import DailyCount
+
+logger = logging.getLogger(__name__)
+
+Hits = Counter[tuple[str, datetime.date]]
+
+
+class HitBuffer:
+    """
+    Count hits in memory until they are written.
+
+    Start a flusher in each process the first time a hit is counted, unless
+    STATS_FLUSH_INTERVAL is None.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty buffer."""
+        self._hits: Hits = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, *, name: str, date: datetime.date) -> None:
+        """Count one hit for name on date."""
+        with self._lock:
+            self._hits[name, date] += 1
+        hit_flusher.start()
+
+    def take(self) -> Hits:
+        """Remove and return all hits."""
+        with self._lock:
+            hits, self._hits = self._hits, Counter()
+        return hits
+
+    def restore(self, hits: Hits) -> None:
+        """Count hits again that couldn't be written."""
+        with self._lock:
+            self._hits.update(hits)
+
+    def clear(self) -> None:
+        """Discard all hits."""
+        with self._lock:
+            self._hits = Counter()
+
+
+hit_buffer = HitBuffer()
+
+
+def daily_count_flush() -> int:
+    """Write all buffered hits and return the number of rows written."""
+    hits = hit_buffer.take()
+    if not hits:
+        return 0
+    table = DailyCount._meta.db_table
+    sql = (
+        f"INSERT INTO {table} (created, modified, name, date, count) "
+        "VALUES (%s, %s, %s, %s, %s) "
+        "ON CONFLICT (name, date) DO UPDATE SET "
+        f"count = {table}.count + EXCLUDED.count, "
+        "modified = EXCLUDED.modified"
+    )
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    # Sorted, so that concurrent flushes lock rows in the same order
+    rows = [
+        (now, now, name, connection.ops.adapt_datefield_value(date), count)
+        for (name, date), count in sorted(hits.items())
+    ]
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+    except DatabaseError:
+        hit_buffer.restore(hits)
+        raise
+    return len(rows)
+
+
+hit_flusher = PeriodicWorker(
+    name="daily-count-flusher",
+    run=daily_count_flush,
+    interval=lambda: get_settings().STATS_FLUSH_INTERVAL,
+    at_exit=daily_count_flush,
+)
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Stats rollup services.
+
+Rollups are recomputed from DailyCount for a window of recent days and
+written with INSERT ... ON CONFLICT DO UPDATE, so running them twice gives
+the same result. Raw DailyCount rows are only deleted for months that no
+rollup window reaches anymore, and only once they are part of a monthly
+count and a daily total. Rows from before rollups existed were rolled up by
+migration 0006.
+"""
+
+import datetime
+import logging
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Sum
+from django.db.models.functions import TruncMonth
+
+from ..models import DailyCount, DailyTotal, MonthlyCount
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RollupResult:
+    """Number of rollup rows written and raw rows deleted."""
+
+    monthly_counts: int
+    daily_totals: int
+    deleted: int
+
+
+def _month_start(date: datetime.date) -> datetime.date:
+    """Return the first day of the month of date."""
+    return date.replace(day=1)
+
+
+@transaction.atomic
+def stats_rollup(
+    *, since: datetime.date, retain_until: datetime.date
+) -> RollupResult:
+    """
+    Recompute rollups for all days since since.
+
+    Monthly counts are recomputed for whole months, starting with the month
+    of since. Delete DailyCount rows in months before the month of
+    retain_until, but never rows in or after the month of since, or rows that
+    haven't been rolled up. Only whole months are deleted, so that
+    recomputing a month later never counts part of it.
+    """
+    first_month = _month_start(since)
+    monthly = (
+        DailyCount.objects.filter(date__gte=first_month)
+        .annotate(month=TruncMonth("date"))
+        .values_list("name", "month")
+        .annotate(total=Sum("count"))
+        .order_by()
+    )
+    monthly_counts = MonthlyCount.objects.bulk_create(
+        [
+            MonthlyCount(name=name, month=month, count=total)
+            for name, month, total in monthly
+        ],
+        update_conflicts=True,
+        unique_fields=["name", "month"],
+        update_fields=["count", "modified"],
+    )
+
+    daily = (
+        DailyCount.objects.filter(date__gte=since)
+        .values_list("date")
+        .annotate(total=Sum("count"))
+        .order_by()
+    )
+    daily_totals = DailyTotal.objects.bulk_create(
+        [DailyTotal(date=date, count=total) for date, total in daily],
+        update_conflicts=True,
+        unique_fields=["date"],
+        update_fields=["count", "modified"],
+    )
+
+    cutoff = min(_month_start(retain_until), first_month)
+    rolled_up = Exists(
+        MonthlyCount.objects.filter(
+            name=OuterRef("name"), month=OuterRef("month")
+        )
+    ) & Exists(DailyTotal.objects.filter(date=OuterRef("date")))
+    deleted, _ = (
+        DailyCount.objects.annotate(month=TruncMonth("date"))
+        .filter(rolled_up, date__lt=cutoff)
+        .delete()
+    )
+    logger.info(
+        "Rolled up %d monthly counts and %d daily totals since %s, "
+        "deleted %d daily counts before %s",
+        len(monthly_counts),
+        len(daily_totals),
+        since,
+        deleted,
+        cutoff,
+    )
+    return RollupResult(
+        monthly_counts=len(monthly_counts),
+        daily_totals=len(daily_totals),
+        deleted=deleted,
+    )
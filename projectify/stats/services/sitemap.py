@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Sitemap URL registry.
+
+Every process keeps the set of sitemap URLs in memory, so that looking up
+a path is a set lookup. Changes are applied to the local set and announced
+to other processes by incrementing the version number in SitemapVersion.
+A background worker in each process compares the local version with the
+shared one every STATS_SITEMAP_CHECK_INTERVAL seconds and rebuilds the set
+when it differs, so that lookups never query the database. The set is also
+rebuilt every day, since blog posts with a future publish date appear
+without anyone saving them.
+"""
+
+import datetime
+import logging
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional, cast
+
+from django.contrib.sitemaps import Sitemap
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from projectify.lib.settings import get_settings
+from projectify.lib.worker import PeriodicWorker
+
+from ..models import SitemapVersion
+
+logger = logging.getLogger(__name__)
+
+# Primary key of the only SitemapVersion row
+VERSION_PK = 1
+
+
+def _sitemap_urls_build() -> frozenset[str]:
+    """Collect all URLs from the sitemaps in projectify.urls."""
+    # Imported here, since the URL conf imports most apps
+    from projectify.urls import sitemaps
+
+    urls: set[str] = set()
+    for sitemap_class in sitemaps.values():
+        sitemap: Sitemap = sitemap_class()
+        items = cast(Sequence[Any], sitemap.items())
+        for item in items:
+            url: str = sitemap.location(item)
+            urls.add(url)
+    return frozenset(urls)
+
+
+def _version_get() -> int:
+    """Return the shared version."""
+    version = (
+        SitemapVersion.objects.filter(pk=VERSION_PK)
+        .values_list("version", flat=True)
+        .first()
+    )
+    return 0 if version is None else version
+
+
+@transaction.atomic
+def _version_increment() -> int:
+    """Increment the shared version and return it."""
+    qs = SitemapVersion.objects.filter(pk=VERSION_PK)
+    # Atomic, so that concurrent increments are never lost
+    if not qs.update(version=F("version") + 1, modified=timezone.now()):
+        # The first increment creates the row
+        SitemapVersion.objects.bulk_create(
+            [SitemapVersion(pk=VERSION_PK)], ignore_conflicts=True
+        )
+        qs.update(version=F("version") + 1, modified=timezone.now())
+    # The updated row stays locked until the transaction ends
+    version: int = qs.values_list("version", flat=True).get()
+    return version
+
+
+class SitemapUrls:
+    """
+    Set of sitemap URLs, kept in sync with other processes.
+
+    Start a refresher in each process on the first lookup, unless
+    STATS_SITEMAP_CHECK_INTERVAL is None.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry. It is built by warm() or refresh()."""
+        self._urls: Optional[frozenset[str]] = None
+        self._version: Optional[int] = None
+        self._built_on: Optional[datetime.date] = None
+        self._lock = threading.Lock()
+        self._refresher = PeriodicWorker(
+            name="sitemap-urls-refresher",
+            run=self.refresh,
+            interval=lambda: get_settings().STATS_SITEMAP_CHECK_INTERVAL,
+        )
+
+    def __contains__(self, path: str) -> bool:
+        """Return True if path is in a sitemap, without querying."""
+        self._refresher.start()
+        urls = self._urls
+        # Nothing is counted until the URLs are built
+        return urls is not None and path in urls
+
+    def warm(self) -> None:
+        """Build the URL set now."""
+        with self._lock:
+            self._rebuild(_version_get())
+
+    def update(
+        self, *, add: Iterable[str] = (), remove: Iterable[str] = ()
+    ) -> None:
+        """Add and remove URLs here and tell other processes to rebuild."""
+        add = set(add)
+        remove = set(remove)
+        # Nothing changed, e.g., a published post saved with the same URL
+        if add == remove:
+            return
+        remove -= add
+        with self._lock:
+            version = _version_increment()
+            if self._urls is None or self._version != version - 1:
+                # Another process changed something since our last build
+                self._rebuild(version)
+                return
+            self._urls = (self._urls - remove) | add
+            self._version = version
+
+    def invalidate(self) -> None:
+        """Rebuild the URL set here, and in all other processes."""
+        with self._lock:
+            self._rebuild(_version_increment())
+
+    def refresh(self) -> None:
+        """Rebuild the URL set if the shared version or the day changed."""
+        with self._lock:
+            version = _version_get()
+            if (
+                self._urls is None
+                or version != self._version
+                or self._built_on != timezone.now().date()
+            ):
+                self._rebuild(version)
+
+    def _rebuild(self, version: int) -> None:
+        """Build the URL set and remember which version it belongs to."""
+        self._urls = _sitemap_urls_build()
+        self._version = version
+        self._built_on = timezone.now().date()
+        logger.debug(
+            "Built %d sitemap URLs for version %s", len(self._urls), version
+        )
+
+
+sitemap_urls = SitemapUrls()
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test daily count services."""
+
+import datetime
+from collections.abc import Generator
+
+from django.urls import reverse
+
+import pytest
+
+from pytest_types import DjangoAssertNumQueries
+
+from ..middleware import track_hit
+from ..models import DailyCount
+from ..services.daily_count import daily_count_flush, hit_buffer
+from ..services.sitemap import sitemap_urls
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_hit_buffer() -> Generator[None, None, None]:
+    """Discard hits counted by a test."""
+    yield
+    hit_buffer.clear()
+
+
+def test_daily_count_flush(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Test that buffered hits are added to the stored counts."""
+    today = datetime.date(2026, 1, 1)
+    hit_buffer.add(name="/", date=today)
+    hit_buffer.add(name="/", date=today)
+    hit_buffer.add(name="/pricing", date=today)
+    # One INSERT for all rows, wrapped in a savepoint
+    with django_assert_num_queries(3):
+        assert daily_count_flush() == 2
+    assert daily_count_flush() == 0
+
+    hit_buffer.add(name="/", date=today)
+    daily_count_flush()
+    counts = dict(
+        DailyCount.objects.filter(date=today).values_list("name", "count")
+    )
+    assert counts == {"/": 3, "/pricing": 1}
+
+
+def test_track_hit(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """Test that only sitemap URLs are counted, without queries."""
+    sitemap_urls.warm()
+    url = reverse("users:log-in")
+    with django_assert_num_queries(0):
+        track_hit("/not-in-any-sitemap")
+        track_hit(url)
+        track_hit(url)
+    assert [
+        (name, count) for (name, _), count in hit_buffer.take().items()
+    ] == [(url, 2)]
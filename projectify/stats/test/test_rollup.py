@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test stats rollup services."""
+
+import datetime
+
+from django.core.management import call_command
+
+import pytest
+
+from ..models import DailyCount, DailyTotal, MonthlyCount
+from ..services.rollup import stats_rollup
+
+pytestmark = pytest.mark.django_db
+
+
+def test_stats_rollup() -> None:
+    """Test that rollups are recomputed and old rows deleted."""
+    DailyCount.objects.bulk_create(
+        [
+            DailyCount(name="/", date=datetime.date(2026, 1, 31), count=1),
+            DailyCount(name="/", date=datetime.date(2026, 2, 1), count=2),
+            DailyCount(name="/", date=datetime.date(2026, 2, 2), count=3),
+            DailyCount(name="/blog", date=datetime.date(2026, 2, 2), count=4),
+        ]
+    )
+    result = stats_rollup(
+        since=datetime.date(2026, 2, 2), retain_until=datetime.date(2026, 3, 1)
+    )
+    assert result.monthly_counts == 2
+    assert result.daily_totals == 1
+    # January is outside of the rolled up months, but was never rolled up
+    assert result.deleted == 0
+    assert set(MonthlyCount.objects.values_list("name", "month", "count")) == {
+        ("/", datetime.date(2026, 2, 1), 5),
+        ("/blog", datetime.date(2026, 2, 1), 4),
+    }
+    assert list(DailyTotal.objects.values_list("date", "count")) == [
+        (datetime.date(2026, 2, 2), 7)
+    ]
+
+    # Running it again updates the existing rows
+    DailyCount.objects.filter(name="/blog").update(count=5)
+    stats_rollup(
+        since=datetime.date(2026, 2, 2), retain_until=datetime.date(2026, 3, 1)
+    )
+    assert MonthlyCount.objects.get(name="/blog").count == 5
+    assert DailyTotal.objects.get().count == 8
+
+    # Rows are deleted once their months have been rolled up
+    stats_rollup(
+        since=datetime.date(2026, 1, 31),
+        retain_until=datetime.date(2026, 3, 1),
+    )
+    result = stats_rollup(
+        since=datetime.date(2026, 3, 1), retain_until=datetime.date(2026, 3, 1)
+    )
+    assert result.deleted == 4
+    assert (
+        MonthlyCount.objects.get(
+            name="/", month=datetime.date(2026, 1, 1)
+        ).count
+        == 1
+    )
+    assert not DailyCount.objects.exists()
+
+
+def test_stats_rollup_whole_months() -> None:
+    """Test that raw rows are only deleted for whole months."""
+    DailyCount.objects.bulk_create(
+        [
+            DailyCount(name="/", date=datetime.date(2026, 2, 10), count=1),
+            DailyCount(name="/", date=datetime.date(2026, 2, 20), count=2),
+        ]
+    )
+    stats_rollup(
+        since=datetime.date(2026, 2, 1), retain_until=datetime.date(2026, 2, 1)
+    )
+    result = stats_rollup(
+        since=datetime.date(2026, 3, 1),
+        retain_until=datetime.date(2026, 2, 15),
+    )
+    assert result.deleted == 0
+    # A later run reaching back into February still counts all of it
+    stats_rollup(
+        since=datetime.date(2026, 2, 20),
+        retain_until=datetime.date(2026, 2, 15),
+    )
+    assert (
+        MonthlyCount.objects.get(
+            name="/", month=datetime.date(2026, 2, 1)
+        ).count
+        == 3
+    )
+
+
+def test_stats_rollup_command() -> None:
+    """Test rolling up today's counts."""
+    today = datetime.date.today()
+    DailyCount.objects.create(name="/", date=today, count=1)
+    call_command("stats_rollup")
+    assert DailyTotal.objects.get(date=today).count == 1
+    assert DailyCount.objects.exists()
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test the sitemap URL registry."""
+
+import pytest
+
+from projectify.blog.models import Post
+from pytest_types import DjangoAssertNumQueries
+
+from ..services.sitemap import SitemapUrls
+
+pytestmark = pytest.mark.django_db
+
+
+def test_lookup(
+    post: Post, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    """Test that lookups don't query the database."""
+    urls = SitemapUrls()
+    # Nothing is found before the URLs are built
+    assert "/" not in urls
+    urls.warm()
+    with django_assert_num_queries(0):
+        assert post.get_absolute_url() in urls
+        assert "/" in urls
+        assert "/not-in-any-sitemap" not in urls
+
+
+def test_update(
+    post: Post, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    """Test that updates apply here and reach other processes."""
+    url = post.get_absolute_url()
+    here = SitemapUrls()
+    other = SitemapUrls()
+    here.warm()
+    other.warm()
+
+    post.draft = True
+    post.save()
+    # Only the shared version is written, nothing is rebuilt. The first
+    # increment creates the version row.
+    with django_assert_num_queries(6):
+        here.update(remove=[url])
+    assert url not in here
+    # The other process reads the new version and rebuilds its URLs
+    with django_assert_num_queries(2):
+        other.refresh()
+    assert url not in other
+
+    post.draft = False
+    post.save()
+    with django_assert_num_queries(4):
+        here.update(add=[url])
+    # other missed the update from here, so it rebuilds
+    other.update(add=[url])
+    assert url in here
+    assert url in other
+    # here sees the newer version from other, and rebuilds
+    with django_assert_num_queries(2):
+        here.refresh()
+    assert url in here
+    # Saving a published post with the same URL changes nothing
+    with django_assert_num_queries(0):
+        here.update(add=[url], remove=[url])
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2025 JWP Consulting GK
+# SPDX-FileCopyrightText: 2025-2026 JWP Consulting GK
 """Storefront Views."""
 
 from django.http import HttpRequest, HttpResponse
@@ -8,51 +8,47 @@ from django.shortcuts import render
 
 from projectify.blog.selectors.post import post_list_published
 from projectify.lib.settings import get_settings
-from projectify.lib.utils import markdown_to_safe_html
+from projectify.lib.utils import markdown_page
 
 
 def accessibility(request: HttpRequest) -> HttpResponse:
     """Serve Accessibility page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR
         / "storefront"
         / "markdown_en"
         / "accessibility.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/accessibility.html", context)
 
 
 def contact_us(request: HttpRequest) -> HttpResponse:
     """Serve Contact us page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR
         / "storefront"
         / "markdown_en"
         / "contact-us.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/contact_us.html", context)
 
 
 def download(request: HttpRequest) -> HttpResponse:
     """Serve Download page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR / "storefront" / "markdown_en" / "download.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/download.html", context)
 
 
 def credits(request: HttpRequest) -> HttpResponse:
     """Serve Credits page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR / "storefront" / "markdown_en" / "credits.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/credits.html", context)
 
@@ -66,13 +62,12 @@ def index(request: HttpRequest) -> HttpResponse:
 
 def free_software(request: HttpRequest) -> HttpResponse:
     """Serve Free Software page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR
         / "storefront"
         / "markdown_en"
         / "free-software.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/free_software.html", context)
 
@@ -84,28 +79,26 @@ def privacy(request: HttpRequest) -> HttpResponse:
 
 def security_disclose(request: HttpRequest) -> HttpResponse:
     """Serve Security Disclose page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR
         / "storefront"
         / "markdown_en"
         / "security"
         / "disclose.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/security/disclose.html", context)
 
 
 def security_general(request: HttpRequest) -> HttpResponse:
     """Serve Security Genaral page."""
-    markdowntext = (
+    content = markdown_page(
         get_settings().BASE_DIR
         / "storefront"
         / "markdown_en"
         / "security"
         / "general.md"
-    ).read_text()
-    content, _ = markdown_to_safe_html(markdowntext)
+    ).html
     context = {"content": content}
     return render(request, "storefront/security/general.html", context)
 
@@ -4,21 +4,31 @@
 """Shared template tags for Projectify."""
 
 import logging
-from typing import Any, Literal, Optional, Union
+import secrets
+from collections.abc import Hashable
+from typing import Any, Literal, Optional, Union, cast
 
 from django import template
-from django.contrib.staticfiles import finders
+from django.template.base import FilterExpression, NodeList, Parser, Token
 from django.templatetags import static
 from django.urls import NoReverseMatch, reverse
-from django.utils.html import format_html
+from django.utils.html import conditional_escape, format_html
 from django.utils.safestring import SafeText, mark_safe
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
+from projectify.lib.icons import colored_icon_url, icon_registry
 from projectify.lib.types import SupportsGetAbsoluteUrl
 from projectify.lib.utils import static_image_get_with_dimensions
 from projectify.user.models import User
+from projectify.workspace.avatar_marble import avatar_marble_render
 from projectify.workspace.forms import WorkspaceSearchForm
-from projectify.workspace.models import TeamMember, Workspace
+from projectify.workspace.models import Project, TeamMember, Workspace
+from projectify.workspace.selectors.cache_generation import (
+    cache_generation_for,
+)
+from projectify.workspace.selectors.task import AssigneeRow
+from projectify.workspace.utils import task_row_cache_get, task_row_cache_set
 
 logger = logging.getLogger(__name__)
 
@@ -74,10 +84,7 @@ def anchor(
         target = "_blank"
         extra = format_html(
             '<img class="inline-block size-4" src="{src}" alt="{text}">',
-            src=reverse(
-                "colored-icon",
-                kwargs={"icon": "external_links", "color": "primary"},
-            ),
+            src=colored_icon_url("external_links", "primary"),
             text=_("(Opens in new tab)"),
         )
     else:
@@ -206,14 +213,8 @@ def action_button(
         # icon=icon(icon, style, 6) if icon else "",
         icon=format_html(
             '<img class="size-6 shrink-0" src="{src}" aria-hidden="true">',
-            src=reverse(
-                "colored-icon",
-                kwargs={
-                    "icon": icon,
-                    "color": "destructive"
-                    if style == "destructive"
-                    else "primary",
-                },
+            src=colored_icon_url(
+                icon, "destructive" if style == "destructive" else "primary"
             ),
         )
         if icon
@@ -278,15 +279,15 @@ def icon(
     inline: bool = False,
 ) -> SafeText:
     """Return a rendered heroicon SVG file with optional color."""
-    static_path = f"heroicons/{icon}.svg"
-    if not finders.find(static_path):
+    found = icon_registry.get(icon)
+    if found is None:
         logger.error("Missing icon '%s'", icon)
         return format_html("<div>MISSING ICON {}</div>", icon)
 
     if color:
-        src = reverse("colored-icon", kwargs={"icon": icon, "color": color})
+        src = colored_icon_url(icon, color)
     else:
-        src = static.static(static_path)
+        src = static.static(found.static_path)
     try:
         size_class = {4: "size-4", 6: "size-6"}[size] if size else ""
     except KeyError:
@@ -303,35 +304,48 @@ def icon(
 
 @register.simple_tag
 def user_avatar(
-    team_member_or_user: Union[None, TeamMember, User],
+    team_member_or_user: Union[None, TeamMember, AssigneeRow, User],
+    inline: bool = False,
 ) -> SafeText:
     """
     Render a user avatar image.
 
-    Takes a user or team member object as parameter.
+    Takes a user, team member or assignee row object as parameter. With
+    inline, avatar marbles are embedded as data URIs, which saves one request
+    per avatar in lists showing every team member once. Where the same team
+    member appears many times, e.g., as task assignee, the cacheable URL is
+    smaller.
     """
     match team_member_or_user:
-        case TeamMember(user=user) as team_member if user.profile_picture:
-            return format_html(
-                '<div class="shrink-0 flex flex-row size-6 items-center rounded-full border border-primary"><img src="{src}" alt="{alt}" height="24" width="24" class="h-full w-full overflow-x-auto rounded-full object-cover object-center"></div>',
-                src=reverse(
-                    "dashboard:team-members:picture", args=(team_member.uuid,)
-                ),
-                alt=_("Team member {} avatar").format(str(user)),
-            )
         case TeamMember(user=user) as team_member:
-            avatar_url = reverse(
-                "dashboard:avatar-marble", args=[team_member.uuid]
-            )
-            return format_html(
-                '<div class="shrink-0 flex flex-row size-6 items-center rounded-full border border-primary"><img src="{src}?size=24" alt="{alt}" height="24" width="24" class="h-full w-full overflow-x-auto rounded-full object-cover object-center"></div>',
-                src=avatar_url,
-                alt=_("Team member {} avatar").format(str(user)),
-            )
+            uuid = team_member.uuid
+            name = str(user)
+            has_profile_picture = bool(user.profile_picture)
+        case AssigneeRow() as row:
+            uuid = row.uuid
+            name = row.name
+            has_profile_picture = row.has_profile_picture
         case _:
             return mark_safe(
                 '<div class="shrink-0 flex flex-row size-6 items-center rounded-full border border-primary bg-background"></div>'
             )
+    if has_profile_picture:
+        return format_html(
+            '<div class="shrink-0 flex flex-row size-6 items-center rounded-full border border-primary"><img src="{src}" alt="{alt}" height="24" width="24" class="h-full w-full overflow-x-auto rounded-full object-cover object-center"></div>',
+            src=reverse("dashboard:team-members:picture", args=(uuid,)),
+            alt=_("Team member {} avatar").format(name),
+        )
+    if inline:
+        avatar_url = avatar_marble_render(uuid=uuid, title=name).data_uri
+    else:
+        avatar_url = (
+            reverse("dashboard:avatar-marble", args=[uuid]) + "?size=24"
+        )
+    return format_html(
+        '<div class="shrink-0 flex flex-row size-6 items-center rounded-full border border-primary"><img src="{src}" alt="{alt}" height="24" width="24" class="h-full w-full overflow-x-auto rounded-full object-cover object-center"></div>',
+        src=avatar_url,
+        alt=_("Team member {} avatar").format(name),
+    )
 
 
 @register.simple_tag
@@ -373,3 +387,98 @@ def picture(
 def workspace_search(workspace: Workspace) -> dict[str, object]:
     """Render a workspace search form for the given workspace."""
     return {"workspace": workspace, "form": WorkspaceSearchForm()}
+
+
+# Stands in for the CSRF token in cached task rows, since it differs for every
+# session. Random per process, so that task titles can't contain it.
+CSRF_TOKEN_PLACEHOLDER = f"__task_row_csrf_token_{secrets.token_hex(16)}__"
+
+
+def _assignee_version(
+    assignee: Union[None, TeamMember, AssigneeRow],
+) -> Hashable:
+    """Return what a task row shows of its assignee, see user_avatar."""
+    match assignee:
+        case TeamMember(user=user):
+            return assignee.uuid, str(user), bool(user.profile_picture)
+        case AssigneeRow():
+            return assignee.uuid, assignee.name, assignee.has_profile_picture
+        case _:
+            return None
+
+
+class TaskRowCacheNode(template.Node):
+    """Render a task row, or take it from task_row_cache."""
+
+    def __init__(
+        self,
+        nodelist: NodeList,
+        task: FilterExpression,
+        can_update_task: FilterExpression,
+    ) -> None:
+        """Store the row template and its arguments."""
+        self.nodelist = nodelist
+        self.task = task
+        self.can_update_task = can_update_task
+
+    def render(self, context: template.Context) -> SafeText:
+        """Render the row, unless the task hasn't changed since."""
+        # django-types expects a Mapping instead of a Context
+        resolve_context = cast(Any, context)
+        task = self.task.resolve(resolve_context)
+        can_update_task = self.can_update_task.resolve(resolve_context)
+        variant = bool(can_update_task), get_language()
+        version = task.modified, _assignee_version(task.assignee)
+        html = task_row_cache_get(task.uuid, variant=variant, version=version)
+        if html is None:
+            with context.push(csrf_token=CSRF_TOKEN_PLACEHOLDER):
+                html = self.nodelist.render(context)
+            task_row_cache_set(
+                task.uuid, variant=variant, version=version, html=html
+            )
+        csrf_token = conditional_escape(context.get("csrf_token") or "")
+        # html was rendered by the template engine, and the token is escaped
+        return mark_safe(html.replace(CSRF_TOKEN_PLACEHOLDER, csrf_token))
+
+
+@register.tag
+def task_row_cache(parser: Parser, token: Token) -> TaskRowCacheNode:
+    """
+    Cache a task row per task version and viewer permissions.
+
+    Usage:
+    {% task_row_cache task can_update_task %}...{% endtask_row_cache %}
+
+    The row is rendered again when the task's modified time, its assignee
+    or the assignee's name or profile picture changes. Everything else in
+    the row must only depend on the task, on can_update_task and on the
+    active language.
+    """
+    match token.split_contents():
+        case [_tag, task, can_update_task]:
+            pass
+        case _:
+            raise template.TemplateSyntaxError(
+                "task_row_cache takes a task and can_update_task"
+            )
+    nodelist = parser.parse(("endtask_row_cache",))
+    parser.delete_first_token()
+    return TaskRowCacheNode(
+        nodelist,
+        parser.compile_filter(task),
+        parser.compile_filter(can_update_task),
+    )
+
+
+@register.simple_tag
+def cache_generation(
+    workspace: Workspace, project: Optional[Project] = None
+) -> str:
+    """
+    Return the cache generation of a workspace or project.
+
+    Usage, with Django's cache tag:
+    {% cache_generation workspace project as generation %}
+    {% cache 600 sidebar workspace.pk generation %}...{% endcache %}
+    """
+    return cache_generation_for(workspace=workspace, project=project)
@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test Projectify management commands."""
+
+from typing import cast
+
+from django.core.management import call_command
+
+import pytest
+
+from projectify.lib.models import RichTextField
+from projectify.lib.settings import get_settings
+from projectify.workspace.models import Task
+
+pytestmark = pytest.mark.django_db
+
+
+def test_rich_text_sanitize(task: Task) -> None:
+    """Test sanitizing rich text with a stale fingerprint."""
+    field = cast(RichTextField, Task._meta.get_field("description"))
+    fingerprint = field.fingerprint
+    Task.objects.filter(pk=task.pk).update(
+        description="<p>hello<script>alert(1)</script></p>",
+        description_fingerprint="",
+    )
+    call_command("rich_text_sanitize")
+    (values,) = Task.objects.filter(pk=task.pk).values(
+        "description", "description_fingerprint"
+    )
+    assert values == {
+        "description": "<p>hello</p>",
+        "description_fingerprint": fingerprint,
+    }
+
+
+def test_markdown_prerender() -> None:
+    """Test compiling all markdown pages."""
+    call_command("markdown_prerender")
+    manifest = get_settings().MARKDOWN_PAGE_MANIFEST.read_text()
+    assert "help/markdown_en/basics.md" in manifest
+    assert "storefront/markdown_en/security/general.md" in manifest
@@ -3,25 +3,36 @@
 # SPDX-FileCopyrightText: 2022-2026 JWP Consulting GK
 """Test workspace app rules."""
 
+from django.test.client import Client
+from django.urls import reverse
+
 import pytest
 from faker import Faker
+from rules.permissions import permissions
+from rules.predicates import Predicate, predicate
 
+from projectify.corporate.models import Customer
 from projectify.corporate.services.stripe import customer_cancel_subscription
 from projectify.settings.base import Base
 from projectify.user.models import User
 from projectify.user.services.internal import user_create
 from projectify.workspace.const import TeamMemberRoles
 from projectify.workspace.models import Project, TeamMember, Workspace
+from projectify.workspace.selectors.quota import workspace_get_all_quotas
 from projectify.workspace.services.project import project_create
 from projectify.workspace.services.task import task_create
-from projectify.workspace.services.team_member import team_member_change_role
+from projectify.workspace.services.team_member import (
+    team_member_change_role,
+    team_member_delete,
+)
 from projectify.workspace.services.team_member_invite import (
     team_member_invite_create,
 )
 from projectify.workspace.services.workspace import workspace_add_user
+from pytest_types import DjangoAssertNumQueries
 
 from .. import rules
-from ..lib.auth import validate_perm
+from ..lib.auth import WorkspaceRoles, validate_perm, validate_perms_many
 
 
 @pytest.fixture
@@ -108,6 +119,217 @@ class TestPredicates:
         assert not rules.is_at_least_owner(observer.user, unrelated_workspace)
 
 
+@pytest.mark.django_db
+class TestWorkspaceRoles:
+    """Test request-scoped workspace roles."""
+
+    def test_one_query(
+        self,
+        observer: TeamMember,
+        unrelated_workspace: Workspace,
+        django_assert_num_queries: DjangoAssertNumQueries,
+    ) -> None:
+        """Test that roles are loaded once for all workspace instances."""
+        user = observer.user
+        user.workspace_roles = WorkspaceRoles(user)
+        workspaces = [
+            Workspace.objects.get(pk=observer.workspace.pk) for _ in range(3)
+        ]
+        with django_assert_num_queries(1):
+            for workspace in workspaces:
+                assert rules.is_at_least_observer(user, workspace)
+                assert not rules.is_at_least_contributor(user, workspace)
+            assert not rules.is_at_least_observer(user, unrelated_workspace)
+
+    def test_add_user(
+        self, observer: TeamMember, unrelated_workspace: Workspace
+    ) -> None:
+        """Test that joining a workspace clears loaded roles."""
+        user = observer.user
+        user.workspace_roles = WorkspaceRoles(user)
+        assert not rules.is_at_least_observer(user, unrelated_workspace)
+        workspace_add_user(
+            workspace=unrelated_workspace,
+            user=user,
+            role=TeamMemberRoles.OBSERVER,
+        )
+        assert rules.is_at_least_observer(user, unrelated_workspace)
+
+    def test_change_role(
+        self, team_member: TeamMember, other_team_member: TeamMember
+    ) -> None:
+        """Test that changing roles or removing members clears them."""
+        user = team_member.user
+        user.workspace_roles = WorkspaceRoles(user)
+        workspace = team_member.workspace
+        assert rules.is_at_least_owner(user, workspace)
+        team_member_change_role(
+            who=other_team_member.user,
+            team_member=team_member,
+            role=TeamMemberRoles.OBSERVER,
+        )
+        assert not rules.is_at_least_contributor(user, workspace)
+        assert rules.is_at_least_observer(user, workspace)
+        team_member_delete(who=other_team_member.user, team_member=team_member)
+        assert not rules.is_at_least_observer(user, workspace)
+
+    def test_middleware(
+        self, user_client: Client, team_member: TeamMember
+    ) -> None:
+        """Test that the requesting user receives workspace roles."""
+        response = user_client.get(
+            reverse(
+                "dashboard:workspaces:search",
+                args=(team_member.workspace.uuid,),
+            )
+        )
+        assert response.status_code == 200
+        user = response.wsgi_request.user
+        assert isinstance(user, User)
+        assert isinstance(user.workspace_roles, WorkspaceRoles)
+
+
+@pytest.mark.django_db
+class TestValidatePermsMany:
+    """Test validate_perms_many."""
+
+    def test_matrix(
+        self,
+        team_member: TeamMember,
+        unrelated_workspace: Workspace,
+        unpaid_customer: Customer,
+        django_assert_num_queries: DjangoAssertNumQueries,
+    ) -> None:
+        """Test that roles and quotas are loaded once for all workspaces."""
+        user = team_member.user
+        workspace = Workspace.objects.get(pk=team_member.workspace.pk)
+        unrelated = Workspace.objects.get(pk=unrelated_workspace.pk)
+        perms = ["workspace.create_task", "workspace.update_workspace"]
+        # Roles, customers and quota counters
+        with django_assert_num_queries(3):
+            matrix = validate_perms_many(user, perms, [workspace, unrelated])
+        assert matrix == {
+            ("workspace.create_task", workspace.uuid): True,
+            ("workspace.update_workspace", workspace.uuid): True,
+            ("workspace.create_task", unrelated.uuid): False,
+            ("workspace.update_workspace", unrelated.uuid): False,
+        }
+        assert workspace.workspace_quotas is None
+        # Roles aren't kept outside of this batch
+        assert user.workspace_roles is None
+
+    def test_annotated_quota(
+        self,
+        team_member: TeamMember,
+        unpaid_customer: Customer,
+        django_assert_num_queries: DjangoAssertNumQueries,
+    ) -> None:
+        """Test that a quota the workspace is annotated with is reused."""
+        user = team_member.user
+        workspace = Workspace.objects.get(pk=team_member.workspace.pk)
+        workspace.quota = workspace_get_all_quotas(workspace)
+        # Roles only
+        with django_assert_num_queries(1):
+            matrix = validate_perms_many(
+                user, ["workspace.create_task"], [workspace]
+            )
+        assert matrix == {("workspace.create_task", workspace.uuid): True}
+
+    def test_quota_exceeded(
+        self,
+        team_member: TeamMember,
+        unpaid_customer: Customer,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that quotas still apply."""
+        monkeypatch.setattr(
+            "projectify.workspace.selectors.quota.trial_conditions",
+            {"Task": 1, "Project": 0, "TeamMemberAndInvite": 2},
+        )
+        workspace = team_member.workspace
+        matrix = validate_perms_many(
+            team_member.user,
+            ["workspace.create_project", "workspace.update_project"],
+            [workspace],
+        )
+        assert matrix == {
+            ("workspace.create_project", workspace.uuid): False,
+            ("workspace.update_project", workspace.uuid): True,
+        }
+
+
+class TestCompiledPredicates:
+    """Test compiled predicates in the vendored rules package."""
+
+    @pytest.mark.parametrize(
+        "args", [(), (True,), (False,), (None,), (True, None), (None, False)]
+    )
+    def test_combinators(self, args: tuple[object, ...]) -> None:
+        """Test that compiled predicates match test(), including skips."""
+        # Predicate() accepts functions returning None, which means skip
+        first: Predicate[...] = Predicate(lambda a: a)
+        second: Predicate[...] = Predicate(lambda a, b: b)
+        skip: Predicate[...] = Predicate(lambda: None)
+        for pred in (
+            first & second,
+            first | second,
+            first ^ second,
+            ~first & skip,
+            skip | ~second,
+            (skip ^ first) & (second | skip),
+        ):
+            assert pred.compile()(*args) == pred.test(*args), pred
+
+    def test_bind(self) -> None:
+        """Test that bound predicates still receive a context."""
+
+        def has_context(self: Predicate[...], a: object) -> bool:
+            return self.context is not None and self.context.args == (a,)
+
+        bound: Predicate[...] = Predicate(has_context, bind=True)
+        pred = predicate(lambda a: True) & bound
+        assert pred.compile()(1)
+
+    def test_context(self) -> None:
+        """Test that compiled predicates receive a context, too."""
+
+        @predicate
+        def store(a: object) -> bool:
+            assert store.context is not None
+            store.context["a"] = a
+            return True
+
+        @predicate
+        def load(a: object) -> bool:
+            assert load.context is not None
+            return load.context.get("a") == a
+
+        pred = store & load
+        assert pred.compile()(1)
+        assert store.context is None
+
+    @pytest.mark.django_db
+    def test_permissions(
+        self, observer: TeamMember, team_member: TeamMember
+    ) -> None:
+        """Test that all registered permissions compile to the same result."""
+        # These permissions check a team member instead of a workspace
+        team_member_permissions = {
+            "workspace.update_team_member_role",
+            "workspace.delete_team_member",
+        }
+        for name, pred in permissions.items():
+            target = (
+                observer
+                if name in team_member_permissions
+                else observer.workspace
+            )
+            for user in (observer.user, team_member.user):
+                assert pred.compile()(user, target) == (
+                    pred.test(user, target)
+                ), name
+
+
 @pytest.mark.django_db
 class TestTrialRules:
     """
@@ -23,6 +23,8 @@ from .types import UserEventType
 if TYPE_CHECKING:
     from django.db.models.manager import RelatedManager
 
+    from projectify.lib.auth import WorkspaceRoles
+
 
 class User(BaseModel, AbstractBaseUser, PermissionsMixin):
     """User class."""
@@ -80,6 +82,10 @@ class User(BaseModel, AbstractBaseUser, PermissionsMixin):
 
     USERNAME_FIELD = "email"
 
+    # Team member roles, shared by all permission checks during a request
+    # Set by the projectify.middleware.workspace_roles middleware
+    workspace_roles: Optional["WorkspaceRoles"] = None
+
     if TYPE_CHECKING:
         userevent_set: RelatedManager["UserEvent"]
 
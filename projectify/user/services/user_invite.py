@@ -13,6 +13,7 @@ from projectify.user.models import User, UserInvite
 from projectify.user.selectors.user import user_find_by_email
 from projectify.workspace.const import TeamMemberRoles
 from projectify.workspace.models import TeamMemberInvite
+from projectify.workspace.services.quota import workspace_quota_counter_adjust
 from projectify.workspace.services.workspace import workspace_add_user
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,9 @@ def user_invite_redeem(*, user_invite: UserInvite, user: User) -> None:
         invite.redeemed = True
         invite.redeemed_when = now()
         invite.save()
+        workspace_quota_counter_adjust(
+            workspace=workspace, team_member_invite_count=-1
+        )
 
 
 @transaction.atomic
@@ -316,7 +316,8 @@ class TestLogInDjango:
     ) -> None:
         """Test logging in a user."""
         data = {"email": user.email, "password": password}
-        with django_assert_num_queries(21):
+        # Gone down from 21 -> 17 due to validating only the updated fields
+        with django_assert_num_queries(17):
             response = client.post(resource_url, data)
         assert response.status_code == 302, response.content
         assert "sessionid" in response.cookies
@@ -6,10 +6,8 @@
 import json
 import logging
 import warnings
-from pathlib import Path
 from typing import Optional
 
-from django.contrib.staticfiles import finders
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.http import (
     Http404,
@@ -18,47 +16,52 @@ from django.http import (
     HttpResponseBadRequest,
     JsonResponse,
 )
+from django.http.response import HttpResponseBase
 from django.shortcuts import render
-from django.views.decorators.cache import cache_control
+from django.utils.cache import patch_cache_control
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
 from django_ratelimit.exceptions import Ratelimited
 
+from projectify.lib.icons import (
+    ICON_VERSION_LENGTH,
+    ColoredIcon,
+    Icon,
+    icon_registry,
+)
+from projectify.lib.views import etag_response
+
 logger = logging.getLogger(__name__)
 
 
-@cache_control(max_age=60 * 60 * 24)
-def colored_icon(request: HttpRequest, icon: str, color: str) -> HttpResponse:
-    """Return a colored SVG icon."""
-    del request
-    # See `const colors` projectify/theme/static_src/tailwind.config.js
-    color_map = {
-        "primary": "#2563EB",
-        "secondary": "#2563EB",
-        "destructive": "#dc2626",
-        "white": "#ffffff",
-    }
+def colored_icon(
+    request: HttpRequest, icon: str, color: str
+) -> HttpResponseBase:
+    """
+    Return a colored SVG icon.
 
-    match finders.find(f"heroicons/{icon}.svg"):
-        case list() as paths:
-            raise ValueError(
-                f"Tried to look for icon {icon}, got a list of paths {paths}"
-            )
+    URLs from colored_icon_url() contain a version and can be cached forever.
+    """
+    match icon_registry.get(icon):
         case None:
             raise Http404(f"Icon '{icon}' not found")
-        case str() as icon_path:
+        case Icon(colored=colored):
+            pass
+    match colored.get(color):
+        case None:
+            raise Http404(f"Missing color '{color}' for icon '{icon}'")
+        case ColoredIcon() as colored_icon:
             pass
 
-    if color not in color_map:
-        raise Http404(f"Missing color '{color}' for icon '{icon}'")
-
-    svg_content = (
-        Path(icon_path)
-        .read_text()
-        .replace("<svg", f'<svg style="color: {color_map[color]}"')
-    )
-    return HttpResponse(svg_content, content_type="image/svg+xml")
+    response = HttpResponse(colored_icon.content, content_type="image/svg+xml")
+    if request.GET.get("v") == colored_icon.etag[:ICON_VERSION_LENGTH]:
+        patch_cache_control(
+            response, public=True, max_age=60 * 60 * 24 * 365, immutable=True
+        )
+    else:
+        patch_cache_control(response, max_age=60 * 60 * 24)
+    return etag_response(request, response, colored_icon.etag)
 
 
 def manifest_view(request: HttpRequest) -> JsonResponse:
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2021, 2022, 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2021, 2022, 2023, 2026 JWP Consulting GK
 """Workspace app configs."""
 
 from django.apps import AppConfig
@@ -11,3 +11,7 @@ class WorkspaceConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "projectify.workspace"
+
+    def ready(self) -> None:
+        """Connect signal receivers."""
+        from . import signals  # noqa: F401
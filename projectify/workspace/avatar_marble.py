@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2023-2026 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023 paolotiu
+# SPDX-FileCopyrightText: 2021 boringdesigners
+# Original idea from https://boringavatars.com/
+"""
+Avatar marble rendering.
+
+The SVG only depends on the team member's UUID and name, so that every
+process renders the same bytes and the ETag stays the same.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import List, Optional
+from urllib.parse import quote
+from uuid import UUID
+
+from django.template.loader import render_to_string
+
+from projectify.lib.cache import LRUCache
+
+
+@dataclass
+class MarbleColor:
+    """Represents a color configuration for marble avatar."""
+
+    color: str
+    translate_x: float
+    translate_y: float
+    scale: float
+    rotate: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class AvatarMarble:
+    """Rendered avatar marble SVG."""
+
+    content: bytes
+    # Strong ETag, without quotes
+    etag: str
+
+    @property
+    def data_uri(self) -> str:
+        """Return the SVG as a data URI for inlining."""
+        return "data:image/svg+xml," + quote(self.content)
+
+
+def _get_unit(
+    number: int, range_val: int, index: Optional[int] = None
+) -> float:
+    """Get a unit value with optional negation based on digit parity."""
+    value = number % range_val
+    if index and (number // (10**index)) % 2 == 0:
+        return -value
+    return value
+
+
+COLORS = "#92A1C6", "#146A7C", "#F0AB3D", "#C271B4", "#C20D90"
+
+
+def _generate_marble_colors(name: str, size: int) -> List[MarbleColor]:
+    """Generate three marble colors with transforms for the given name."""
+    num_from_name = sum(ord(char) for char in name)
+
+    return [
+        MarbleColor(
+            color=COLORS[(num_from_name + i) % len(COLORS)],
+            translate_x=_get_unit(num_from_name * (i + 1), size // 10, 1),
+            translate_y=_get_unit(num_from_name * (i + 1), size // 10, 2),
+            scale=1.2 + _get_unit(num_from_name * (i + 1), size // 20) / 10,
+            rotate=_get_unit(num_from_name * (i + 1), 360, 1),
+        )
+        for i in range(3)
+    ]
+
+
+# Keyed by team member UUID and title
+avatar_marble_cache = LRUCache[tuple[UUID, str], AvatarMarble](maxsize=1024)
+
+
+def avatar_marble_render(*, uuid: UUID, title: str) -> AvatarMarble:
+    """Render the avatar marble for a team member, cached."""
+    key = uuid, title
+    if (marble := avatar_marble_cache.get(key)) is not None:
+        return marble
+    size = 80
+    # IDs only have to be unique within a page
+    mask_id = f"mask__marble__{uuid.hex}"
+    filter_id = f"prefix__filter0_f__{uuid.hex}"
+    marble_colors = _generate_marble_colors(str(uuid), size)
+    content = render_to_string(
+        "workspace/avatar_marble.svg",
+        {
+            "size": size,
+            "title": title,
+            "mask_id": mask_id,
+            "filter_id": filter_id,
+            "marble_colors": marble_colors,
+        },
+    ).encode()
+    marble = AvatarMarble(
+        content=content, etag=hashlib.sha256(content).hexdigest()[:32]
+    )
+    avatar_marble_cache.set(key, marble)
+    return marble
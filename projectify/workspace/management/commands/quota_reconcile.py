@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Recompute workspace quota counters and repair drift."""
+
+from django.core.management.base import BaseCommand
+
+from projectify.workspace.models import Workspace
+from projectify.workspace.services.quota import (
+    workspace_quota_counter_reconcile,
+)
+
+
+class Command(BaseCommand):
+    """Reconcile workspace quota counters."""
+
+    help = "Recompute workspace quota counters and repair drift"
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Handle."""
+        del args, options
+        repaired = 0
+        for workspace in Workspace.objects.iterator():
+            if workspace_quota_counter_reconcile(workspace=workspace):
+                repaired += 1
+        self.stdout.write(f"Repaired {repaired} workspace quota counters")
@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Rebuild the task and project full-text search index."""
+
+from django.core.management.base import BaseCommand
+
+from projectify.workspace.services.search import search_index_rebuild
+
+
+class Command(BaseCommand):
+    """Rebuild the search index."""
+
+    help = "Rebuild the task and project full-text search index"
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Handle."""
+        del args, options
+        count = search_index_rebuild()
+        self.stdout.write(f"Indexed {count} tasks and projects")
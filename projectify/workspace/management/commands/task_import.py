@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Import tasks into a workspace from a CSV or JSON Lines file."""
+
+import os
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from projectify.user.models import User
+from projectify.workspace.models import Project, Workspace
+from projectify.workspace.selectors.export import ExportFormat
+from projectify.workspace.services.task_import import (
+    task_import,
+    task_import_read_rows,
+)
+
+
+class Command(BaseCommand):
+    """Import tasks."""
+
+    help = "Import tasks into a workspace from a CSV or JSON Lines file"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add arguments."""
+        parser.add_argument("workspace_uuid", type=UUID)
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--email",
+            required=True,
+            help="Email of the team member importing the tasks",
+        )
+        parser.add_argument(
+            "--project",
+            type=UUID,
+            help="Project for rows without a project column",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="File format, guessed from the file suffix by default",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes sanitizing descriptions",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        """Handle."""
+        del args
+        path: Path = options["path"]
+        import_format: ExportFormat
+        match options["format"] or path.suffix.lstrip("."):
+            case "csv":
+                import_format = "csv"
+            case "jsonl":
+                import_format = "jsonl"
+            case other:
+                raise CommandError(f"Unknown file format '{other}'")
+        try:
+            who = User.objects.get(email=options["email"])
+            workspace = Workspace.objects.get(uuid=options["workspace_uuid"])
+            project = (
+                None
+                if options["project"] is None
+                else workspace.project_set.get(uuid=options["project"])
+            )
+        except (
+            User.DoesNotExist,
+            Workspace.DoesNotExist,
+            Project.DoesNotExist,
+        ) as error:
+            raise CommandError(error) from error
+
+        with path.open(newline="", encoding="utf-8") as stream:
+            try:
+                result = task_import(
+                    who=who,
+                    workspace=workspace,
+                    project=project,
+                    rows=task_import_read_rows(
+                        stream, import_format=import_format
+                    ),
+                    workers=options["workers"],
+                )
+            except ValidationError as error:
+                raise CommandError(" ".join(error.messages)) from error
+        for row_error in result.errors:
+            self.stderr.write(
+                f"Row {row_error.row}: {' '.join(row_error.messages)}"
+            )
+        self.stdout.write(
+            f"Imported {result.created} tasks, skipped {len(result.errors)} "
+            "rows"
+        )
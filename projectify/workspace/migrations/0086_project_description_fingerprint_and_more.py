@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Track rich text sanitization policy fingerprints."""
+# Generated by Django 6.0.7 on 2026-10-18 09:12
+
+from django.db import migrations
+
+import projectify.lib.models
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [
+        ("workspace", "0085_remove_teammember_minimized_project_list_and_more")
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="description_fingerprint",
+            field=projectify.lib.models.SanitizationFingerprintField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=64,
+                source="description",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="description_fingerprint",
+            field=projectify.lib.models.SanitizationFingerprintField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=64,
+                source="description",
+            ),
+        ),
+    ]
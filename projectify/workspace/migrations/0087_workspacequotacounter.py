@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Add materialized workspace quota counters."""
+# Generated by Django 6.0.7 on 2026-10-18 10:05
+
+from typing import Any
+
+import django.db.migrations.operations.special
+import django.db.models.deletion
+from django.apps.registry import Apps
+from django.db import migrations, models
+
+import projectify.lib.models
+
+
+def count_workspace_resources(apps: Apps, schema_editor: object) -> None:
+    """Create a quota counter for every existing workspace."""
+    del schema_editor
+    Workspace: Any = apps.get_model("workspace", "Workspace")
+    Task: Any = apps.get_model("workspace", "Task")
+    WorkspaceQuotaCounter: Any = apps.get_model(
+        "workspace", "WorkspaceQuotaCounter"
+    )
+    for workspace in Workspace.objects.iterator():
+        WorkspaceQuotaCounter.objects.create(
+            workspace=workspace,
+            task_count=Task.objects.filter(
+                project__workspace=workspace
+            ).count(),
+            project_count=workspace.project_set.count(),
+            team_member_count=workspace.teammember_set.count(),
+            team_member_invite_count=workspace.teammemberinvite_set.filter(
+                redeemed=False
+            ).count(),
+        )
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [
+        ("workspace", "0086_project_description_fingerprint_and_more")
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkspaceQuotaCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    projectify.lib.models.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    projectify.lib.models.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                ("task_count", models.IntegerField(default=0)),
+                ("project_count", models.IntegerField(default=0)),
+                ("team_member_count", models.IntegerField(default=0)),
+                (
+                    "team_member_invite_count",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Number of unredeemed team member invites",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="quota_counter",
+                        to="workspace.workspace",
+                    ),
+                ),
+            ],
+            options={"get_latest_by": "modified", "abstract": False},
+        ),
+        migrations.RunPython(
+            code=count_workspace_resources,
+            reverse_code=django.db.migrations.operations.special.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Add full-text search index tables for tasks and projects.
+
+PostgreSQL uses a tsvector column with a GIN index, SQLite uses FTS5.
+"""
+
+from typing import Any
+
+from django.apps.registry import Apps
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+from justhtml import JustHTML
+
+from projectify.lib.settings import get_settings
+
+TABLES = {"task": "workspace_task", "project": "workspace_project"}
+
+
+def extract_text(unsafe_html: str) -> str:
+    """
+    Return all plain text in html, with whitespace collapsed.
+
+    Frozen copy of projectify.workspace.utils.extract_text at the time this
+    migration was written.
+    """
+    if len(unsafe_html) == 0:
+        return ""
+    settings = get_settings()
+    doc = JustHTML(
+        unsafe_html, policy=settings.HTML_USER_POLICY, fragment=True
+    )
+    text = doc.to_text(separator=" ", strip=False, separator_blocks_only=True)
+    return " ".join(text.split())
+
+
+def create_search_index(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    """Create and populate the search index tables."""
+    vendor = schema_editor.connection.vendor
+    for kind, source in TABLES.items():
+        table = f"workspace_{kind}_search"
+        match vendor:
+            case "postgresql":
+                schema_editor.execute(
+                    f"CREATE TABLE {table} ("
+                    f"id bigint PRIMARY KEY REFERENCES {source} (id) "
+                    "ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+                    "document tsvector NOT NULL)"
+                )
+                schema_editor.execute(
+                    f"CREATE INDEX {table}_document ON {table} "
+                    "USING GIN (document)"
+                )
+                insert = (
+                    f"INSERT INTO {table} (id, document) VALUES (%s, "
+                    "setweight(to_tsvector('simple', %s), 'A') || "
+                    "setweight(to_tsvector('simple', %s), 'B'))"
+                )
+            case "sqlite":
+                schema_editor.execute(
+                    f"CREATE VIRTUAL TABLE {table} USING fts5("
+                    "title, body, tokenize = 'unicode61 remove_diacritics 2')"
+                )
+                insert = (
+                    f"INSERT INTO {table} (rowid, title, body) "
+                    "VALUES (%s, %s, %s)"
+                )
+            case _:
+                return
+        Model: Any = apps.get_model("workspace", kind)
+        rows = Model.objects.values_list("pk", "title", "description")
+        with schema_editor.connection.cursor() as cursor:
+            for pk, title, description in rows.iterator():
+                cursor.execute(
+                    insert, (pk, title, extract_text(description or ""))
+                )
+
+
+def drop_search_index(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    """Drop the search index tables."""
+    del apps
+    if schema_editor.connection.vendor not in ("postgresql", "sqlite"):
+        return
+    for kind in TABLES:
+        schema_editor.execute(f"DROP TABLE workspace_{kind}_search")
+
+
+class Migration(migrations.Migration):
+    """Migration."""
+
+    dependencies = [("workspace", "0087_workspacequotacounter")]
+
+    operations = [
+        migrations.RunPython(
+            code=create_search_index, reverse_code=drop_search_index
+        )
+    ]
@@ -17,6 +17,8 @@ from projectify.lib.models import (
     BaseModel,
     BaseModelUUID,
     RichTextField,
+    RichTextQuerySet,
+    SanitizationFingerprintField,
     TitleDescriptionModel,
 )
 from projectify.user.models import UserInvite
@@ -29,6 +31,7 @@ if TYPE_CHECKING:
     from django.db.models.manager import RelatedManager  # noqa: F401
 
     from projectify.corporate.models import Customer
+    from projectify.lib.auth import WorkspaceQuotas
     from projectify.user.models import User, UserInvite  # noqa: F401
 
 
@@ -51,18 +54,14 @@ class Workspace(TitleDescriptionModel, BaseModelUUID):
     # Since it involves additional queries, it is None by default
     quota: Optional[WorkspaceQuota] = None
 
-    # Map User primary keys to team member roles
-    # This might contain stale roles but only if this object isn't recreated
-    role_cache: dict[int, TeamMemberRoles]
-
-    def __init__(self, *args: Any, **kwargs: Any):
-        """Create role cache."""
-        super().__init__(*args, **kwargs)
-        self.role_cache = {}
+    # Quotas shared by a batch of permission checks
+    # Set by projectify.lib.auth.validate_perms_many
+    workspace_quotas: Optional["WorkspaceQuotas"] = None
 
     if TYPE_CHECKING:
         # Related fields
         customer: RelatedField[None, "Customer"]
+        quota_counter: RelatedField[None, "WorkspaceQuotaCounter"]
 
         # Related sets
         task_set: RelatedManager["Task"]
@@ -77,12 +76,11 @@ class Workspace(TitleDescriptionModel, BaseModelUUID):
 
     def refresh_from_db(self, *args: Any, **kwargs: Any) -> None:
         """
-        Clear active_invites and role_cache.
+        Clear active_invites.
 
         This is a workaround so that invites get removed after deleting them.
         """
         setattr(self, "active_invites", [])
-        self.role_cache = {}
         super().refresh_from_db(*args, **kwargs)
 
     class Meta:
@@ -114,6 +112,9 @@ class Project(TitleDescriptionModel, BaseModelUUID):
         null=True,
         policy=settings.HTML_USER_POLICY,
     )
+    description_fingerprint = SanitizationFingerprintField(
+        source="description"
+    )
     archived = models.DateTimeField(
         null=True,
         blank=True,
@@ -123,9 +124,17 @@ class Project(TitleDescriptionModel, BaseModelUUID):
         null=True, blank=True, help_text=_("Due date for this workspace board")
     )
 
+    objects = RichTextQuerySet["Project"].as_manager()
+
+    # Optional annotations with the cache generations of this project and
+    # its workspace, see workspace.selectors.cache_generation
+    workspace_generation: Optional[int] = None
+    project_generation: Optional[int] = None
+
     if TYPE_CHECKING:
         # Related managers
         task_set: RelatedManager["Task"]
+        workspace_id: int
 
     def __str__(self) -> str:
         """Return title."""
@@ -153,6 +162,9 @@ class Task(TitleDescriptionModel, BaseModelUUID):
         null=True,
         policy=settings.HTML_USER_POLICY,
     )
+    description_fingerprint = SanitizationFingerprintField(
+        source="description"
+    )
     workspace = models.ForeignKey["Workspace"](
         "workspace.Workspace", on_delete=models.CASCADE
     )
@@ -169,16 +181,23 @@ class Task(TitleDescriptionModel, BaseModelUUID):
     )
     done = models.DateTimeField(null=True, blank=True)
 
+    objects = RichTextQuerySet["Task"].as_manager()
+
     if TYPE_CHECKING:
         id: int
+        workspace_id: int
+        project_id: int
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         """Validate workspace == project.workspace."""
-        correct_workspace = self.project.workspace
-        if self.workspace.pk != correct_workspace.pk:
-            raise ValidationError(
-                _("Task workspace must match project.workspace").format()
-            )
+        update_fields = kwargs.get("update_fields")
+        checked = {"workspace", "project"}
+        if update_fields is None or checked & set(update_fields):
+            correct_workspace = self.project.workspace
+            if self.workspace.pk != correct_workspace.pk:
+                raise ValidationError(
+                    _("Task workspace must match project.workspace").format()
+                )
         return super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -221,6 +240,9 @@ class TeamMemberInvite(BaseModel):
         help_text=_("When has this invite been redeemed?"),
     )
 
+    if TYPE_CHECKING:
+        workspace_id: int
+
     class Meta:
         """Meta."""
 
@@ -267,6 +289,7 @@ class TeamMember(BaseModelUUID):
         # Related
         user_invite: RelatedField[None, "UserInvite"]
         task_set: RelatedManager["Task"]
+        user_id: int
         workspace_id: int
 
     def __str__(self) -> str:
@@ -280,7 +303,59 @@ class TeamMember(BaseModelUUID):
         ordering = ("created",)
 
 
+class WorkspaceQuotaCounter(BaseModel):
+    """
+    Materialized resource counts for a workspace.
+
+    Quota checks read these counts instead of counting rows every time. The
+    receivers in projectify.workspace.signals update them in the same
+    transaction as the resource that is created or deleted, including
+    cascades and deletions in the Django admin. Run ./manage.py
+    quota_reconcile to repair drift, for example after QuerySet.update().
+    """
+
+    workspace = models.OneToOneField[Workspace](
+        Workspace, on_delete=models.CASCADE, related_name="quota_counter"
+    )
+    task_count = models.IntegerField(default=0)
+    project_count = models.IntegerField(default=0)
+    team_member_count = models.IntegerField(default=0)
+    team_member_invite_count = models.IntegerField(
+        default=0, help_text=_("Number of unredeemed team member invites")
+    )
+
+    def __str__(self) -> str:
+        """Return workspace title."""
+        return str(self.workspace)
+
+
+class CacheGeneration(BaseModel):
+    """
+    Generation counter of a workspace or project.
+
+    See projectify.workspace.selectors.cache_generation. Rows are created on
+    the first bump, and a missing row means generation 0. Rows aren't
+    deleted with their workspace or project, so that a deletion can bump
+    them as well.
+    """
+
+    kind = models.CharField(max_length=16)
+    object_id = models.PositiveBigIntegerField()
+    generation = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        """Add constraints."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"],
+                name="unique_cache_generation_kind_object_id",
+            )
+        ]
+
+
 __all__ = (
+    "CacheGeneration",
     "Project",
     # TODO remove
     "Task",
@@ -288,4 +363,5 @@ __all__ = (
     "TeamMemberInvite",
     "TeamMemberRoles",
     "Workspace",
+    "WorkspaceQuotaCounter",
 )
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Cache generation selectors.
+
+Every workspace and project has a generation counter, stored as a
+CacheGeneration row shared by all processes.
+It changes whenever anything in the workspace or project changes, see
+projectify.workspace.signals. Put the generation into cache keys, and
+cached values become unreachable instead of having to be deleted.
+"""
+
+from typing import Literal, Optional
+
+from django.db.models import (
+    OuterRef,
+    PositiveBigIntegerField,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce
+
+from ..models import CacheGeneration, Project, Workspace
+
+CacheGenerationKind = Literal["workspace", "project"]
+
+# Counters by kind and workspace or project id
+CacheGenerationKeys = set[tuple[CacheGenerationKind, int]]
+
+
+def cache_generation_filter(keys: CacheGenerationKeys) -> Q:
+    """Return a filter for the counters of kind and object id in keys."""
+    q = Q(pk__in=[])
+    for kind in ("workspace", "project"):
+        object_ids = [pk for key_kind, pk in keys if key_kind == kind]
+        if object_ids:
+            q |= Q(kind=kind, object_id__in=object_ids)
+    return q
+
+
+def _cache_generation_subquery(
+    kind: CacheGenerationKind, object_id: str
+) -> Coalesce:
+    """Return the generation of kind for the object_id field, or 0."""
+    generation = CacheGeneration.objects.filter(
+        kind=kind, object_id=OuterRef(object_id)
+    ).values("generation")[:1]
+    return Coalesce(
+        Subquery(generation), Value(0), output_field=PositiveBigIntegerField()
+    )
+
+
+def cache_generation_annotate(qs: QuerySet[Project]) -> QuerySet[Project]:
+    """
+    Annotate projects with their and their workspace's generation.
+
+    The generations are read with the projects, and before anything loaded
+    afterwards. Data cached under them can't be older than they are.
+    """
+    return qs.annotate(
+        workspace_generation=_cache_generation_subquery(
+            "workspace", "workspace_id"
+        ),
+        project_generation=_cache_generation_subquery("project", "pk"),
+    )
+
+
+def cache_generation_for(
+    *, workspace: Workspace, project: Optional[Project] = None
+) -> str:
+    """
+    Return the generation of workspace, or of project in workspace.
+
+    A project's generation also changes with its workspace's generation.
+    Projects loaded with cache_generation_annotate() don't need a query.
+    """
+    match project:
+        case Project(
+            workspace_generation=int(workspace_generation),
+            project_generation=int(project_generation),
+        ):
+            return f"{workspace_generation}.{project_generation}"
+        case _:
+            pass
+    keys: CacheGenerationKeys = {("workspace", workspace.pk)}
+    if project is not None:
+        keys.add(("project", project.pk))
+    generations = {
+        (kind, pk): generation
+        for kind, pk, generation in CacheGeneration.objects.filter(
+            cache_generation_filter(keys)
+        ).values_list("kind", "object_id", "generation")
+    }
+    workspace_generation = generations.get(("workspace", workspace.pk), 0)
+    if project is None:
+        return f"{workspace_generation}"
+    project_generation = generations.get(("project", project.pk), 0)
+    return f"{workspace_generation}.{project_generation}"
+
+
+def cache_key_for(
+    name: str, *, workspace: Workspace, project: Optional[Project] = None
+) -> str:
+    """Return a cache key for name that changes with every generation."""
+    if project is None:
+        scope = f"workspace:{workspace.pk}"
+    else:
+        scope = f"project:{project.pk}"
+    generation = cache_generation_for(workspace=workspace, project=project)
+    return f"{name}:{scope}:{generation}"
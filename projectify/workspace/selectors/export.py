@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Export selectors for tasks.
+
+Rows are read with a single query that joins the project and assignee, and
+are loaded in chunks, so that exporting a large workspace needs constant
+memory. The caller has to make sure that the user can see the workspace.
+"""
+
+import csv
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from ..models import Project, Task, Workspace
+
+ExportFormat = Literal["csv", "jsonl"]
+
+# Number of rows fetched from the database at once
+EXPORT_CHUNK_SIZE = 2000
+
+# Exported column names and the values() lookups they come from
+EXPORT_COLUMNS: dict[str, str] = {
+    "uuid": "uuid",
+    "title": "title",
+    "description": "description",
+    "project": "project__title",
+    "project_uuid": "project__uuid",
+    "assignee": "assignee__user__email",
+    "due_date": "due_date",
+    "done": "done",
+    "created": "created",
+    "modified": "modified",
+}
+
+
+def task_export_rows(
+    *, workspace: Workspace, project: Optional[Project] = None
+) -> Iterator[dict[str, Any]]:
+    """Yield one dict per task in a workspace, or only in project."""
+    qs = Task.objects.filter(workspace=workspace)
+    if project is not None:
+        qs = qs.filter(project=project)
+    rows = qs.order_by("pk").values_list(*EXPORT_COLUMNS.values())
+    for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield dict(zip(EXPORT_COLUMNS, row))
+
+
+def _export_value(value: Any) -> Any:
+    """Format a value for CSV or JSON."""
+    match value:
+        case datetime():
+            return value.isoformat()
+        case None | bool() | int() | float():
+            return value
+        case _:
+            return str(value)
+
+
+# Spreadsheets evaluate cells starting with these characters as formulas
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any) -> Any:
+    """Format a value for CSV, quoting text that could be run as a formula."""
+    value = "" if value is None else _export_value(value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+class _Line:
+    """File-like object that returns what is written to it."""
+
+    def write(self, value: str) -> str:
+        """Return value instead of storing it."""
+        return value
+
+
+def task_export_lines(
+    *, rows: Iterator[dict[str, Any]], export_format: ExportFormat
+) -> Iterator[bytes]:
+    """Yield a header, if any, and then one UTF-8 encoded line per row."""
+    match export_format:
+        case "csv":
+            writer = csv.writer(_Line())
+            yield writer.writerow(EXPORT_COLUMNS).encode()
+            for row in rows:
+                line = writer.writerow(_csv_value(v) for v in row.values())
+                yield line.encode()
+        case "jsonl":
+            for row in rows:
+                data = {k: _export_value(v) for k, v in row.items()}
+                yield (json.dumps(data, ensure_ascii=False) + "\n").encode()
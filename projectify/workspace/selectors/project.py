@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Project model selectors."""
 
+from dataclasses import dataclass
 from typing import Any, Optional
 from uuid import UUID
 
@@ -10,7 +11,10 @@ from django.db.models import Count, Prefetch, Q, QuerySet
 
 from projectify.user.models import User
 
-from ..models import Project, Task, TeamMember
+from ..models import Project, TeamMember, Workspace
+from .quota import workspace_get_all_quotas
+from .task import TaskCursor, TaskPage, task_find_page_for_project
+from .workspace import workspace_find_for_user
 
 
 def project_detail_query_set(
@@ -21,7 +25,6 @@ def project_detail_query_set(
     team_member_qs = TeamMember.objects.select_related("user").annotate(
         task_count=Count("task", filter=project_not_archived)
     )
-    task_qs = Task.objects.select_related("assignee__user")
 
     project_prefetches: list[Prefetch[Any]] = [
         # Prefetch for workspace 1 : N relations, projects, and team
@@ -44,8 +47,6 @@ def project_detail_query_set(
             )
         )
 
-    project_prefetches.append(Prefetch("task_set", task_qs))
-
     project = Project.objects.prefetch_related(
         *project_prefetches
     ).select_related("workspace", "workspace__customer")
@@ -83,3 +84,53 @@ def project_find_by_project_uuid(
         return qs.get()
     except Project.DoesNotExist:
         return None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProjectDetail:
+    """Contain everything the project detail page shows."""
+
+    project: Project
+    # The current user's team member
+    team_member: TeamMember
+    # The user's workspaces for the side menu, only evaluated when shown
+    workspaces: QuerySet[Workspace]
+    page: TaskPage
+
+
+def project_detail_load(
+    *,
+    who: User,
+    project_uuid: UUID,
+    limit: int,
+    after: Optional[TaskCursor] = None,
+) -> Optional[ProjectDetail]:
+    """
+    Load a project and everything its detail page shows.
+
+    The number of queries stays the same, no matter how many tasks,
+    projects or team members a workspace has. Annotate the project's
+    workspace with its quota.
+    """
+    project = project_find_by_project_uuid(
+        who=who,
+        project_uuid=project_uuid,
+        qs=project_detail_query_set(who=who),
+    )
+    if project is None:
+        return None
+    workspace = project.workspace
+    match getattr(workspace, "current_team_member_qs"):
+        case [TeamMember() as team_member]:
+            pass
+        case other:
+            raise RuntimeError(f"Expected one team member, got {other}")
+    workspace.quota = workspace_get_all_quotas(workspace)
+    return ProjectDetail(
+        project=project,
+        team_member=team_member,
+        workspaces=workspace_find_for_user(who=who),
+        page=task_find_page_for_project(
+            project=project, limit=limit, after=after
+        ),
+    )
@@ -8,10 +8,15 @@ Limitations for a trial workspaces:
 - Task: 1000 tasks,
 - Project: 10,
 - TeamMember + TeamMemberInivite(unredeemed): 2
+
+Resource counts are read from the materialized WorkspaceQuotaCounter row.
 """
 
+from collections.abc import Sequence
 from functools import partial
-from typing import Literal, TypedDict, Union
+from typing import Literal, Optional, TypedDict, Union, cast
+
+from django.db.models import prefetch_related_objects
 
 from projectify.corporate.selectors.customer import (
     customer_check_active_for_workspace,
@@ -19,7 +24,7 @@ from projectify.corporate.selectors.customer import (
 from projectify.lib.settings import get_settings
 from projectify.workspace.types import Quota, WorkspaceQuota
 
-from ..models import Task, Workspace
+from ..models import Task, Workspace, WorkspaceQuotaCounter
 
 Resource = Literal["Task", "Project", "TeamMemberAndInvite"]
 
@@ -34,6 +39,15 @@ class Limitations(TypedDict):
     TeamMemberAndInvite: Limitation
 
 
+class ResourceCounts(TypedDict):
+    """Contain resource counts, matching WorkspaceQuotaCounter fields."""
+
+    task_count: int
+    project_count: int
+    team_member_count: int
+    team_member_invite_count: int
+
+
 trial_conditions: Limitations = {
     "Task": 1000,
     "Project": 10,
@@ -68,36 +82,83 @@ def get_workspace_quota_for_resource(
     return None
 
 
+def workspace_resource_counts_compute(
+    *, workspace: Workspace
+) -> ResourceCounts:
+    """Count all resources in a workspace. Expensive calculation."""
+    return {
+        "task_count": Task.objects.filter(
+            project__workspace=workspace
+        ).count(),
+        "project_count": workspace.project_set.count(),
+        "team_member_count": workspace.users.count(),
+        "team_member_invite_count": workspace.teammemberinvite_set.filter(
+            redeemed=False
+        ).count(),
+    }
+
+
+def workspace_resource_counts(*, workspace: Workspace) -> ResourceCounts:
+    """
+    Return materialized resource counts for a workspace.
+
+    Fall back to counting if this workspace has no counter yet.
+    """
+    counter = (
+        WorkspaceQuotaCounter.objects.filter(workspace=workspace)
+        .values(*ResourceCounts.__annotations__)
+        .first()
+    )
+    match counter:
+        case None:
+            return workspace_resource_counts_compute(workspace=workspace)
+        case counter:
+            return cast(ResourceCounts, counter)
+
+
 def get_workspace_resource_count(
-    resource: Resource, workspace: Workspace
+    resource: Resource,
+    workspace: Workspace,
+    counts: Optional[ResourceCounts] = None,
 ) -> int:
     """Return resource count for a specific resource."""
+    if counts is None:
+        counts = workspace_resource_counts(workspace=workspace)
     match resource:
         case "Task":
-            return Task.objects.filter(project__workspace=workspace).count()
+            return counts["task_count"]
         case "Project":
-            return workspace.project_set.count()
+            return counts["project_count"]
         case "TeamMemberAndInvite":
-            user_count = workspace.users.count()
-            invite_count = workspace.teammemberinvite_set.filter(
-                redeemed=False
-            ).count()
-            return user_count + invite_count
-
-
-def workspace_quota_for(*, resource: Resource, workspace: Workspace) -> Quota:
+            return (
+                counts["team_member_count"]
+                + counts["team_member_invite_count"]
+            )
+
+
+def workspace_quota_for(
+    *,
+    resource: Resource,
+    workspace: Workspace,
+    counts: Optional[ResourceCounts] = None,
+) -> Quota:
     """Return the quota within a workspace for a given resource."""
     limit = get_workspace_quota_for_resource(resource, workspace)
     # Short circuit for no limit
     if limit is None:
         return Quota(current=None, limit=None, can_create_more=True)
-    current = get_workspace_resource_count(resource, workspace)
+    current = get_workspace_resource_count(resource, workspace, counts)
     return Quota(current=current, limit=limit, can_create_more=current < limit)
 
 
-def workspace_get_all_quotas(workspace: Workspace) -> WorkspaceQuota:
-    """Calculate all quotas for a workspace. Expensive calculation."""
-    mk = partial(workspace_quota_for, workspace=workspace)
+def workspace_get_all_quotas(
+    workspace: Workspace, counts: Optional[ResourceCounts] = None
+) -> WorkspaceQuota:
+    """Calculate all quotas for a workspace."""
+    # Look up the counter row only once for all resources
+    if counts is None and get_settings().STRIPE_CONFIG is not None:
+        counts = workspace_resource_counts(workspace=workspace)
+    mk = partial(workspace_quota_for, workspace=workspace, counts=counts)
     return WorkspaceQuota(
         workspace_status=customer_check_active_for_workspace(
             workspace=workspace
@@ -106,3 +167,28 @@ def workspace_get_all_quotas(workspace: Workspace) -> WorkspaceQuota:
         projects=mk(resource="Project"),
         team_members_and_invites=mk(resource="TeamMemberAndInvite"),
     )
+
+
+def workspace_get_all_quotas_many(
+    *, workspaces: Sequence[Workspace]
+) -> dict[int, WorkspaceQuota]:
+    """
+    Calculate all quotas for several workspaces, keyed by workspace pk.
+
+    Customers and counter rows are loaded with one query each.
+    """
+    prefetch_related_objects(workspaces, "customer")
+    counts: dict[int, ResourceCounts] = {}
+    if get_settings().STRIPE_CONFIG is not None:
+        rows = WorkspaceQuotaCounter.objects.filter(
+            workspace__in=workspaces
+        ).values("workspace_id", *ResourceCounts.__annotations__)
+        for row in rows:
+            workspace_id = row.pop("workspace_id")
+            counts[workspace_id] = cast(ResourceCounts, row)
+    return {
+        workspace.pk: workspace_get_all_quotas(
+            workspace, counts.get(workspace.pk)
+        )
+        for workspace in workspaces
+    }
@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Full-text search selectors for tasks and projects.
+
+On PostgreSQL, every task and project has a weighted tsvector in a side
+table with a GIN index. On SQLite, FTS5 virtual tables store the title and
+the plain text description, with the task or project id as rowid. Migration
+0088 creates the tables, and projectify.workspace.services.search keeps them
+in sync.
+
+Other databases fall back to a case insensitive substring match.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Literal, Optional, Union, cast
+from uuid import UUID
+
+from django.db import connection, transaction
+from django.db.models import FloatField, Model, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+
+from projectify.lib.cache import LRUCache
+
+from ..models import Project, Task, Workspace
+
+SearchKind = Literal["task", "project"]
+
+SEARCH_TABLES: dict[SearchKind, str] = {
+    "task": "workspace_task_search",
+    "project": "workspace_project_search",
+}
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a search query into words, dropping all operators."""
+    return re.findall(r"\w+", query.lower())
+
+
+def search_filter_ranked[M: Model](
+    qs: QuerySet[M], *, kind: SearchKind, query: str, title_only: bool = False
+) -> QuerySet[M]:
+    """
+    Filter qs to matches for query, best match first.
+
+    Every word in query has to match the beginning of a word in the title
+    or description, or only the title if title_only is set. Annotate the rank
+    as search_rank.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return qs.none()
+    table = SEARCH_TABLES[kind]
+    outer = qs.model._meta.db_table
+    match connection.vendor:
+        case "postgresql":
+            # The title has weight A
+            weight = "A" if title_only else ""
+            tsquery = " & ".join(f"{term}:*{weight}" for term in terms)
+            matches = RawSQL(
+                f"SELECT id FROM {table} "
+                "WHERE document @@ to_tsquery('simple', %s)",
+                (tsquery,),
+            )
+            rank = RawSQL(
+                f"SELECT ts_rank(document, to_tsquery('simple', %s)) "
+                f"FROM {table} WHERE {table}.id = {outer}.id",
+                (tsquery,),
+                output_field=FloatField(),
+            )
+        case "sqlite":
+            fts_query = " ".join(f'"{term}"*' for term in terms)
+            if title_only:
+                fts_query = f"title : ({fts_query})"
+            matches = RawSQL(
+                f"SELECT rowid FROM {table} WHERE {table} MATCH %s",
+                (fts_query,),
+            )
+            # bm25() is lower for better matches. Title weighs more than body
+            rank = RawSQL(
+                f"SELECT -bm25({table}, 10.0, 1.0) FROM {table} "
+                f"WHERE {table} MATCH %s AND rowid = {outer}.id",
+                (fts_query,),
+                output_field=FloatField(),
+            )
+        case _:
+            q = Q()
+            for term in terms:
+                term_q = Q(title__icontains=term)
+                if not title_only:
+                    term_q |= Q(description__icontains=term)
+                q &= term_q
+            return qs.filter(q).order_by("pk")
+    return (
+        qs.filter(pk__in=matches)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "pk")
+    )
+
+
+# Maximum number of link suggestions
+SUGGEST_LIMIT = 10
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Suggestion:
+    """A task or project to link to from rich text."""
+
+    uuid: UUID
+    title: str
+    url: str
+
+
+SuggestCacheKey = tuple[SearchKind, str]
+
+# Recent suggestions by workspace id, and then by kind and query.
+# Services clear a workspace's entry whenever a task or project changes.
+# Entries expire after a minute, since other processes can't clear them.
+suggest_cache: LRUCache[int, LRUCache[SuggestCacheKey, list[Suggestion]]] = (
+    LRUCache(maxsize=256)
+)
+
+
+def search_suggest_invalidate(*, workspace_id: int) -> None:
+    """
+    Forget cached link suggestions for a workspace.
+
+    Forget them again after the transaction commits, since other requests
+    might cache what they see until then.
+    """
+    suggest_cache.pop(workspace_id)
+    transaction.on_commit(lambda: suggest_cache.pop(workspace_id))
+
+
+def _search_suggest(
+    *, workspace: Workspace, kind: SearchKind, query: str
+) -> list[Suggestion]:
+    """Query up to SUGGEST_LIMIT + 1 suggestions by title."""
+    qs: Union[QuerySet[Task], QuerySet[Project]]
+    match kind:
+        case "task":
+            qs = Task.objects.filter(
+                workspace=workspace, project__archived__isnull=True
+            )
+            view = "dashboard:tasks:detail"
+        case "project":
+            qs = Project.objects.filter(
+                workspace=workspace, archived__isnull=True
+            )
+            view = "dashboard:projects:detail"
+    # Fetch one more, in case we need to exclude a task
+    rows = search_filter_ranked(
+        cast(QuerySet[Model], qs), kind=kind, query=query, title_only=True
+    ).values_list("uuid", "title")[: SUGGEST_LIMIT + 1]
+    return [
+        Suggestion(uuid=uuid, title=title, url=reverse(view, args=(uuid,)))
+        for uuid, title in rows
+    ]
+
+
+def search_suggest(
+    *,
+    workspace: Workspace,
+    kind: SearchKind,
+    query: str,
+    exclude_task: Optional[UUID] = None,
+) -> list[Suggestion]:
+    """
+    Suggest tasks or projects whose title matches query.
+
+    Return at most SUGGEST_LIMIT suggestions. The caller has to make sure
+    that the user can see this workspace.
+    """
+    workspace_cache = suggest_cache.get(workspace.pk)
+    if workspace_cache is None:
+        workspace_cache = LRUCache(maxsize=32, ttl=60)
+        suggest_cache.set(workspace.pk, workspace_cache)
+    key = (kind, " ".join(search_terms(query)))
+    suggestions = workspace_cache.get(key)
+    if suggestions is None:
+        suggestions = _search_suggest(
+            workspace=workspace, kind=kind, query=query
+        )
+        workspace_cache.set(key, suggestions)
+    return [s for s in suggestions if s.uuid != exclude_task][:SUGGEST_LIMIT]
@@ -3,10 +3,15 @@
 # SPDX-FileCopyrightText: 2023 JWP Consulting GK
 """Workspace selectors."""
 
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Union
 from uuid import UUID
 
-from django.db.models import Count, Prefetch, Q, QuerySet
+from django.db.models import Count, F, Prefetch, Q, QuerySet
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
 from projectify.user.models import User
 
@@ -41,3 +46,181 @@ def task_find_by_task_uuid(
         return qs.get(project__workspace__users=who, uuid=task_uuid)
     except Task.DoesNotExist:
         return None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AssigneeRow:
+    """Team member columns needed to render an avatar."""
+
+    uuid: UUID
+    name: str
+    has_profile_picture: bool
+
+    def __str__(self) -> str:
+        """Return printable user name."""
+        return self.name
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TaskRow:
+    """Task columns shown in task lists, without the description."""
+
+    pk: int
+    uuid: UUID
+    title: str
+    done: Optional[datetime]
+    modified: datetime
+    due_date: Optional[datetime]
+    project_title: str
+    assignee: Optional[AssigneeRow]
+
+    def get_absolute_url(self) -> str:
+        """Return absolute URL to this task."""
+        return reverse("dashboard:tasks:detail", args=(self.uuid,))
+
+
+TASK_ROW_FIELDS = (
+    "pk",
+    "uuid",
+    "title",
+    "done",
+    "modified",
+    "due_date",
+    "project__title",
+    "assignee__uuid",
+    "assignee__user__preferred_name",
+    "assignee__user__email",
+    "assignee__user__profile_picture",
+)
+
+
+def task_rows(qs: QuerySet[Task]) -> list[TaskRow]:
+    """
+    Evaluate qs as task rows.
+
+    Only the columns in TASK_ROW_FIELDS are loaded. Use this for lists, which
+    don't need the description or full model instances.
+    """
+    rows: list[TaskRow] = []
+    for (
+        pk,
+        uuid,
+        title,
+        done,
+        modified,
+        due_date,
+        project_title,
+        assignee_uuid,
+        preferred_name,
+        email,
+        profile_picture,
+    ) in qs.values_list(*TASK_ROW_FIELDS):
+        if assignee_uuid is None:
+            assignee = None
+        else:
+            assignee = AssigneeRow(
+                uuid=assignee_uuid,
+                name=preferred_name or email,
+                has_profile_picture=bool(profile_picture),
+            )
+        rows.append(
+            TaskRow(
+                pk=pk,
+                uuid=uuid,
+                title=title,
+                done=done,
+                modified=modified,
+                due_date=due_date,
+                project_title=project_title,
+                assignee=assignee,
+            )
+        )
+    return rows
+
+
+@dataclass(frozen=True, kw_only=True)
+class TaskCursor:
+    """Position of a task in a project's task list."""
+
+    done: Optional[datetime]
+    modified: datetime
+    pk: int
+
+
+@dataclass
+class TaskPage:
+    """Contain one page of a project's tasks."""
+
+    tasks: list[TaskRow]
+    # Pass to task_find_page_for_project to get the next page
+    next_cursor: Optional[str]
+
+
+def task_cursor_encode(task: Union[Task, TaskRow]) -> str:
+    """Encode a task's position as an opaque, URL safe cursor."""
+    done = task.done.isoformat() if task.done else ""
+    value = f"{done}|{task.modified.isoformat()}|{task.pk}"
+    return urlsafe_base64_encode(value.encode())
+
+
+def task_cursor_decode(cursor: str) -> Optional[TaskCursor]:
+    """Decode a cursor, return None if it is invalid."""
+    try:
+        value = urlsafe_base64_decode(cursor).decode()
+    except ValueError:
+        return None
+    match value.split("|"):
+        case [done, modified, pk]:
+            try:
+                decoded = TaskCursor(
+                    done=datetime.fromisoformat(done) if done else None,
+                    modified=datetime.fromisoformat(modified),
+                    pk=int(pk),
+                )
+            except ValueError:
+                return None
+        case _:
+            return None
+    # Naive datetimes can't be compared with the database's aware ones
+    if timezone.is_naive(decoded.modified) or (
+        decoded.done is not None and timezone.is_naive(decoded.done)
+    ):
+        return None
+    return decoded
+
+
+def task_find_page_for_project(
+    *, project: Project, limit: int, after: Optional[TaskCursor] = None
+) -> TaskPage:
+    """
+    Find up to limit tasks in a project, starting after a cursor.
+
+    Tasks are ordered like Task.Meta.ordering, with the primary key as a
+    tie-breaker. Instead of an OFFSET, the next page starts right after the
+    last task seen, so that every page costs the same.
+    """
+    qs = Task.objects.filter(project=project)
+    match after:
+        case None:
+            pass
+        case TaskCursor(done=None, modified=modified, pk=pk):
+            qs = qs.filter(
+                Q(done__isnull=False)
+                | Q(done__isnull=True, modified__lt=modified)
+                | Q(done__isnull=True, modified=modified, pk__lt=pk)
+            )
+        case TaskCursor(done=done, modified=modified, pk=pk):
+            qs = qs.filter(
+                Q(done__gt=done)
+                | Q(done=done, modified__lt=modified)
+                | Q(done=done, modified=modified, pk__lt=pk)
+            )
+    qs = qs.order_by(
+        F("done").asc(nulls_first=True), F("modified").desc(), F("pk").desc()
+    )
+    # Fetch one more task to see whether there is a next page
+    tasks = task_rows(qs[: limit + 1])
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        return TaskPage(tasks=tasks, next_cursor=task_cursor_encode(tasks[-1]))
+    return TaskPage(tasks=tasks, next_cursor=None)
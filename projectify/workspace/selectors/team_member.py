@@ -8,6 +8,7 @@ from uuid import UUID
 
 from projectify.user.models import User
 
+from ..const import TeamMemberRoles
 from ..models import Project, TeamMember, Workspace
 
 
@@ -21,6 +22,18 @@ def team_member_find_for_workspace(
         return None
 
 
+def team_member_find_roles_for_user(
+    *, user: User
+) -> dict[int, TeamMemberRoles]:
+    """Map workspace primary keys to the user's team member role."""
+    return {
+        workspace_id: TeamMemberRoles[role]
+        for workspace_id, role in TeamMember.objects.filter(
+            user=user
+        ).values_list("workspace_id", "role")
+    }
+
+
 def team_member_find_by_team_member_uuid(
     *, who: User, team_member_uuid: UUID
 ) -> Optional[TeamMember]:
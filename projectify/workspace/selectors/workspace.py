@@ -21,6 +21,7 @@ from projectify.corporate.types import CustomerSubscriptionStatus
 from projectify.user.models import User
 
 from ..models import Project, Task, TeamMember, TeamMemberInvite, Workspace
+from .search import search_filter_ranked
 
 logger = logging.getLogger(__name__)
 
@@ -138,7 +139,11 @@ def workspace_search(
     unassigned_tasks: bool = False,
     exclude_task: Optional[UUID] = None,
 ) -> WorkspaceSearchResults:
-    """Search workspace for `query`."""
+    """
+    Search workspace for `query`.
+
+    With a query, tasks and projects are ranked by how well they match.
+    """
     workspace_filter = Q(workspace=workspace, workspace__users=who)
 
     assignee_contained = Q(assignee__in=filter_by_team_members)
@@ -156,21 +161,21 @@ def workspace_search(
         case _, True:
             task_q &= assignee_contained | assignee_empty
 
-    if query is not None:
-        task_q &= Q(title__icontains=query) | Q(description__icontains=query)
     if exclude_task is not None:
         task_q &= ~Q(uuid=exclude_task)
-    tasks = (
-        Task.objects.filter(task_q)
-        .select_related("project", "assignee__user")
-        .order_by("project__modified")
+    tasks: QuerySet[Task] = Task.objects.filter(task_q).select_related(
+        "project", "assignee__user"
     )
 
     project_q = workspace_filter & Q(archived__isnull=True)
-    if query is not None:
-        project_q &= Q(title__icontains=query) | Q(
-            description__icontains=query
+    project_qs: QuerySet[Project] = Project.objects.filter(project_q)
+
+    if query is None:
+        tasks = tasks.order_by("project__modified")
+    else:
+        tasks = search_filter_ranked(tasks, kind="task", query=query)
+        project_qs = search_filter_ranked(
+            project_qs, kind="project", query=query
         )
-    project_qs = Project.objects.filter(project_q)
 
     return WorkspaceSearchResults(projects=project_qs, tasks=tasks)
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Cache generation services.
+
+Bumps happen after the transaction commits, so that nobody caches data from
+before the commit under the new generation. All bumps in a transaction are
+merged into one bump per counter.
+"""
+
+import threading
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..models import CacheGeneration
+from ..selectors.cache_generation import (
+    CacheGenerationKeys,
+    cache_generation_filter,
+)
+
+
+class PendingBumps(threading.local):
+    """
+    Collect counters to bump once the current thread's transaction commits.
+
+    Counters from a rolled back transaction are bumped with the next one,
+    which only costs a cache miss.
+    """
+
+    def __init__(self) -> None:
+        """Start without pending bumps."""
+        self._keys: CacheGenerationKeys = set()
+
+    def add(self, keys: CacheGenerationKeys) -> None:
+        """Bump keys on the next commit."""
+        self._keys |= keys
+
+    def take(self) -> CacheGenerationKeys:
+        """Remove and return all pending counters."""
+        keys, self._keys = self._keys, set()
+        return keys
+
+    def clear(self) -> None:
+        """Discard all pending counters."""
+        self._keys = set()
+
+
+pending_bumps = PendingBumps()
+
+
+def _cache_generation_bump_pending() -> None:
+    """Increment all pending counters, creating missing ones."""
+    keys = pending_bumps.take()
+    if not keys:
+        # An earlier callback of this transaction bumped them already
+        return
+    CacheGeneration.objects.bulk_create(
+        [CacheGeneration(kind=kind, object_id=pk) for kind, pk in keys],
+        ignore_conflicts=True,
+    )
+    # Atomic, so that concurrent bumps are never lost
+    CacheGeneration.objects.filter(cache_generation_filter(keys)).update(
+        generation=F("generation") + 1, modified=timezone.now()
+    )
+
+
+def cache_generation_bump(
+    *, workspace_ids: Iterable[int] = (), project_ids: Iterable[int] = ()
+) -> None:
+    """Start new generations for workspaces and projects on commit."""
+    keys: CacheGenerationKeys = {
+        *(("workspace", pk) for pk in workspace_ids),
+        *(("project", pk) for pk in project_ids),
+    }
+    if not keys:
+        return
+    pending_bumps.add(keys)
+    # Every bump registers a callback, in case an earlier one was discarded
+    # with a rolled back savepoint. The first one to run bumps everything.
+    transaction.on_commit(_cache_generation_bump_pending)
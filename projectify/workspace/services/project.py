@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Project services."""
 
 from datetime import datetime
@@ -12,7 +12,9 @@ from django.utils.timezone import now
 from projectify.lib.auth import validate_perm
 from projectify.user.models import User
 from projectify.workspace.models import Project, Workspace
-from projectify.workspace.utils import extract_first_paragraph_text
+from projectify.workspace.services.quota import workspace_quota_counter_batch
+from projectify.workspace.services.search import search_index_remove_batch
+from projectify.workspace.utils import analyze_rich_text
 
 
 # Create
@@ -27,14 +29,15 @@ def project_create(
     """Create a project inside a given workspace."""
     validate_perm("workspace.create_project", who, workspace)
 
-    match extract_first_paragraph_text(title_description):
+    rich_text = analyze_rich_text(title_description)
+    match rich_text.title:
         case str() as title:
             pass
         case None:
             title = title_description
 
     project = workspace.project_set.create(
-        title=title, description=title_description, due_date=due_date
+        title=title, description=rich_text.html, due_date=due_date
     )
     # 1+1 query?
     return project
@@ -52,14 +55,15 @@ def project_update(
     """Update a project."""
     validate_perm("workspace.update_project", who, project.workspace)
 
-    match extract_first_paragraph_text(title_description):
+    rich_text = analyze_rich_text(title_description)
+    match rich_text.title:
         case str() as title:
             pass
         case None:
             title = title_description
 
     project.title = title
-    project.description = title_description
+    project.description = rich_text.html
 
     if due_date and due_date.tzinfo is None:
         raise ValueError(f"tzinfo must be specified, got {due_date}")
@@ -73,7 +77,9 @@ def project_update(
 def project_delete(*, who: User, project: Project) -> None:
     """Delete a project."""
     validate_perm("workspace.delete_project", who, project.workspace)
-    project.delete()
+    # Tasks are deleted along with the project
+    with workspace_quota_counter_batch(), search_index_remove_batch():
+        project.delete()
 
 
 # RPC
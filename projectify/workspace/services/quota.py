@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Workspace quota counter services."""
+
+import logging
+import threading
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+from ..models import Workspace, WorkspaceQuotaCounter
+from ..selectors.quota import workspace_resource_counts_compute
+
+logger = logging.getLogger(__name__)
+
+# Adjustments collected by workspace_quota_counter_batch(), per thread
+_batch = threading.local()
+
+
+@transaction.atomic
+def workspace_quota_counter_reconcile(*, workspace: Workspace) -> bool:
+    """
+    Recompute the quota counter for a workspace.
+
+    Return True if the counter was missing or had drifted.
+    """
+    # Lock the counter before counting, so that adjustments committed while
+    # counting wait for us instead of being overwritten
+    qs = WorkspaceQuotaCounter.objects.select_for_update()
+    counter, created = qs.get_or_create(workspace=workspace)
+    counts = workspace_resource_counts_compute(workspace=workspace)
+    drift = {
+        key: value
+        for key, value in counts.items()
+        if getattr(counter, key) != value
+    }
+    if not drift and not created:
+        return False
+    if not created:
+        logger.warning(
+            "Repairing quota counter drift for workspace %s: %s",
+            workspace.uuid,
+            drift,
+        )
+    for key, value in drift.items():
+        setattr(counter, key, value)
+    counter.save()
+    return True
+
+
+def _workspace_quota_counter_update(
+    *, workspace_id: int, deltas: Mapping[str, int]
+) -> bool:
+    """Add deltas to a counter. Return False if the counter is missing."""
+    changes = {key: F(key) + delta for key, delta in deltas.items() if delta}
+    if not changes:
+        return True
+    updated = WorkspaceQuotaCounter.objects.filter(
+        workspace_id=workspace_id
+    ).update(modified=now(), **changes)
+    return bool(updated)
+
+
+def workspace_quota_counter_adjust(
+    *,
+    workspace: Workspace,
+    task_count: int = 0,
+    project_count: int = 0,
+    team_member_count: int = 0,
+    team_member_invite_count: int = 0,
+) -> None:
+    """
+    Adjust the quota counter for a workspace by the given amounts.
+
+    Creating and deleting resources adjusts the counter through the receivers
+    in projectify.workspace.signals. Call this for changes that send no
+    signals, like bulk_create(), or that change whether a resource counts.
+    A missing counter is counted from scratch instead.
+    """
+    deltas = {
+        "task_count": task_count,
+        "project_count": project_count,
+        "team_member_count": team_member_count,
+        "team_member_invite_count": team_member_invite_count,
+    }
+    if not _workspace_quota_counter_update(
+        workspace_id=workspace.pk, deltas=deltas
+    ):
+        workspace_quota_counter_reconcile(workspace=workspace)
+
+
+def workspace_quota_counter_created(*, workspace_id: int, key: str) -> None:
+    """Count a resource that was just created."""
+    if _workspace_quota_counter_update(
+        workspace_id=workspace_id, deltas={key: 1}
+    ):
+        return
+    workspace = Workspace.objects.filter(pk=workspace_id).first()
+    if workspace is not None:
+        workspace_quota_counter_reconcile(workspace=workspace)
+
+
+def workspace_quota_counter_deleted(*, workspace_id: int, key: str) -> None:
+    """
+    Stop counting a resource that was just deleted.
+
+    Inside workspace_quota_counter_batch(), the adjustment is applied when
+    the batch ends. A missing counter stays missing, since the workspace may
+    be deleted in the same cascade.
+    """
+    batch: Optional[dict[int, Counter[str]]] = getattr(_batch, "deltas", None)
+    if batch is not None:
+        batch.setdefault(workspace_id, Counter())[key] -= 1
+        return
+    _workspace_quota_counter_update(
+        workspace_id=workspace_id, deltas={key: -1}
+    )
+
+
+@contextmanager
+def workspace_quota_counter_batch() -> Iterator[None]:
+    """
+    Collect counter adjustments for deletions and apply them at once.
+
+    Deleting a project deletes all its tasks, and each task would otherwise
+    update the counter on its own.
+    """
+    if getattr(_batch, "deltas", None) is not None:
+        yield
+        return
+    deltas: dict[int, Counter[str]] = {}
+    _batch.deltas = deltas
+    try:
+        yield
+    finally:
+        _batch.deltas = None
+    for workspace_id, workspace_deltas in deltas.items():
+        _workspace_quota_counter_update(
+            workspace_id=workspace_id, deltas=workspace_deltas
+        )
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Full-text search index services.
+
+See projectify.workspace.selectors.search for how the index is laid out.
+Receivers in projectify.workspace.signals index tasks and projects when they
+are saved or deleted, including in the Django admin and through cascades.
+Changing the index also clears the workspace's cached link suggestions.
+"""
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Optional, Sequence, Union
+
+from django.db import connection, transaction
+
+from ..models import Project, Task, Workspace
+from ..selectors.search import (
+    SEARCH_TABLES,
+    SearchKind,
+    search_suggest_invalidate,
+    suggest_cache,
+)
+from ..utils import analyze_rich_text
+
+logger = logging.getLogger(__name__)
+
+# Ids collected by search_index_remove_batch(), per thread
+_batch = threading.local()
+
+
+def _search_index_sql(kind: SearchKind) -> Optional[str]:
+    """Return SQL storing id, title and plain text body, if supported."""
+    table = SEARCH_TABLES[kind]
+    match connection.vendor:
+        case "postgresql":
+            return (
+                f"INSERT INTO {table} (id, document) VALUES (%s, "
+                "setweight(to_tsvector('simple', %s), 'A') || "
+                "setweight(to_tsvector('simple', %s), 'B')) "
+                "ON CONFLICT (id) DO UPDATE SET document = EXCLUDED.document"
+            )
+        case "sqlite":
+            return (
+                f"INSERT OR REPLACE INTO {table} (rowid, title, body) "
+                "VALUES (%s, %s, %s)"
+            )
+        case _:
+            return None
+
+
+def _search_index_upsert(
+    *, kind: SearchKind, pk: int, title: str, description: Optional[str]
+) -> None:
+    """Store title and description text for a task or project."""
+    sql = _search_index_sql(kind)
+    if sql is None:
+        return
+    body = analyze_rich_text(description or "").text
+    with connection.cursor() as cursor:
+        cursor.execute(sql, (pk, title, body))
+
+
+def search_index_update(*, obj: Union[Task, Project]) -> None:
+    """Add or update a task or project in the search index."""
+    kind: SearchKind = "task" if isinstance(obj, Task) else "project"
+    search_suggest_invalidate(workspace_id=obj.workspace_id)
+    _search_index_upsert(
+        kind=kind, pk=obj.pk, title=obj.title, description=obj.description
+    )
+
+
+def search_index_add_tasks(
+    *, workspace: Workspace, entries: Sequence[tuple[int, str, str]]
+) -> None:
+    """Add many new tasks, given as id, title and plain text body."""
+    search_suggest_invalidate(workspace_id=workspace.pk)
+    sql = _search_index_sql("task")
+    if sql is None or not entries:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, entries)
+
+
+def _search_index_remove(*, kind: SearchKind, pks: Sequence[int]) -> None:
+    """Delete index rows on SQLite. PostgreSQL deletes them by cascade."""
+    if connection.vendor != "sqlite" or not pks:
+        return
+    table = SEARCH_TABLES[kind]
+    placeholders = ", ".join(["%s"] * len(pks))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} WHERE rowid IN ({placeholders})", pks
+        )
+
+
+def _search_index_removed(*, kind: SearchKind, pk: int) -> None:
+    """Remove an index row now, or when the current batch ends."""
+    batch: Optional[dict[SearchKind, list[int]]] = getattr(_batch, "pks", None)
+    if batch is not None:
+        batch[kind].append(pk)
+        return
+    _search_index_remove(kind=kind, pks=[pk])
+
+
+def search_index_remove_task(*, task: Task) -> None:
+    """Remove a deleted task from the search index."""
+    search_suggest_invalidate(workspace_id=task.workspace_id)
+    _search_index_removed(kind="task", pk=task.pk)
+
+
+def search_index_remove_project(*, project: Project) -> None:
+    """Remove a deleted project from the search index."""
+    search_suggest_invalidate(workspace_id=project.workspace_id)
+    _search_index_removed(kind="project", pk=project.pk)
+
+
+@contextmanager
+def search_index_remove_batch() -> Iterator[None]:
+    """
+    Collect removed tasks and projects and remove them at once.
+
+    Deleting a project deletes all its tasks, and each task would otherwise
+    be removed from the index on its own.
+    """
+    if getattr(_batch, "pks", None) is not None:
+        yield
+        return
+    pks: dict[SearchKind, list[int]] = {"task": [], "project": []}
+    _batch.pks = pks
+    try:
+        yield
+    finally:
+        _batch.pks = None
+    for kind, kind_pks in pks.items():
+        _search_index_remove(kind=kind, pks=kind_pks)
+
+
+@transaction.atomic
+def search_index_rebuild() -> int:
+    """Rebuild the search index for all tasks and projects."""
+    if connection.vendor not in ("postgresql", "sqlite"):
+        logger.warning(
+            "Full-text search isn't supported for %s", connection.vendor
+        )
+        return 0
+    suggest_cache.clear()
+    with connection.cursor() as cursor:
+        for table in SEARCH_TABLES.values():
+            cursor.execute(f"DELETE FROM {table}")
+    count = 0
+    models: tuple[tuple[SearchKind, type[Union[Task, Project]]], ...] = (
+        ("task", Task),
+        ("project", Project),
+    )
+    for kind, model in models:
+        rows = model.objects.values_list("pk", "title", "description")
+        for pk, title, description in rows.iterator():
+            _search_index_upsert(
+                kind=kind, pk=pk, title=title, description=description
+            )
+            count += 1
+    return count
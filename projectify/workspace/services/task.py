@@ -1,11 +1,11 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023-2024 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023-2024,2026 JWP Consulting GK
 """Task services."""
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 from django.db import transaction
 from django.forms import ValidationError
@@ -14,9 +14,13 @@ from django.utils.translation import gettext_lazy as _
 
 from projectify.lib.auth import validate_perm
 from projectify.user.models import User
-from projectify.workspace.utils import extract_first_paragraph_text
+from projectify.workspace.utils import analyze_rich_text
 
 from ..models import Project, Task, TeamMember
+from ..selectors.search import search_suggest_invalidate
+from .cache_generation import cache_generation_bump
+from .quota import workspace_quota_counter_batch
+from .search import search_index_remove_batch
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +49,8 @@ def task_create(
             }
         )
 
-    match extract_first_paragraph_text(title_description):
+    rich_text = analyze_rich_text(title_description)
+    match rich_text.title:
         case str() as title:
             pass
         case None:
@@ -54,7 +59,7 @@ def task_create(
     task = Task.objects.create(
         project=project,
         title=title,
-        description=title_description,
+        description=rich_text.html,
         due_date=due_date,
         workspace=workspace,
         assignee=assignee,
@@ -73,11 +78,12 @@ def task_update(
 ) -> Task:
     """Update task."""
     validate_perm("workspace.update_task", who, task.workspace)
-    task.description = title_description
+    rich_text = analyze_rich_text(title_description)
+    task.description = rich_text.html
     task.due_date = due_date
     task.assignee = assignee
 
-    match extract_first_paragraph_text(title_description):
+    match rich_text.title:
         case str() as title:
             task.title = title
         # Keep the task title when nothing matches
@@ -93,7 +99,7 @@ def task_mark_done(*, who: User, task: Task, done: bool) -> Task:
     """Mark task as done."""
     validate_perm("workspace.update_task", who, task.workspace)
     task.done = now() if done else None
-    task.save()
+    task.save_changed("done")
     return task
 
 
@@ -102,3 +108,101 @@ def task_delete(*, task: Task, who: User) -> None:
     """Delete a task."""
     validate_perm("workspace.delete_task", who, task.workspace)
     task.delete()
+
+
+def _validate_perm_per_workspace(
+    perm: str, who: User, tasks: Sequence[Task]
+) -> dict[int, list[Task]]:
+    """Check perm once for each workspace and group tasks by workspace."""
+    by_workspace: dict[int, list[Task]] = {}
+    for task in tasks:
+        if task.workspace_id not in by_workspace:
+            validate_perm(perm, who, task.workspace)
+            by_workspace[task.workspace_id] = []
+        by_workspace[task.workspace_id].append(task)
+    return by_workspace
+
+
+def _cache_generation_bump_tasks(tasks: Sequence[Task]) -> None:
+    """Bump generations for tasks changed with update(), sending no signals."""
+    cache_generation_bump(
+        workspace_ids={task.workspace_id for task in tasks},
+        project_ids={task.project_id for task in tasks},
+    )
+
+
+@transaction.atomic
+def task_bulk_mark_done(
+    *, who: User, tasks: Sequence[Task], done: bool
+) -> int:
+    """Mark tasks as done or not done, return the number of tasks updated."""
+    _validate_perm_per_workspace("workspace.update_task", who, tasks)
+    timestamp = now()
+    _cache_generation_bump_tasks(tasks)
+    return Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+        done=timestamp if done else None, modified=timestamp
+    )
+
+
+@transaction.atomic
+def task_bulk_assign(
+    *, who: User, tasks: Sequence[Task], assignee: Optional[TeamMember]
+) -> int:
+    """Assign tasks to a team member, or unassign them if assignee is None."""
+    by_workspace = _validate_perm_per_workspace(
+        "workspace.update_task", who, tasks
+    )
+    if assignee and set(by_workspace) - {assignee.workspace_id}:
+        raise ValidationError(
+            {
+                "assignee": [
+                    _(
+                        "The team member to be assigned belongs to a different workspace"
+                    )
+                ]
+            }
+        )
+    _cache_generation_bump_tasks(tasks)
+    return Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+        assignee=assignee, modified=now()
+    )
+
+
+@transaction.atomic
+def task_bulk_move_to_project(
+    *, who: User, tasks: Sequence[Task], project: Project
+) -> int:
+    """Move tasks to another project in the same workspace."""
+    by_workspace = _validate_perm_per_workspace(
+        "workspace.update_task", who, tasks
+    )
+    if set(by_workspace) - {project.workspace_id}:
+        raise ValidationError(
+            {
+                "project": [
+                    _("Tasks can only be moved within the same workspace")
+                ]
+            }
+        )
+    if project.archived is not None:
+        raise ValidationError(
+            {"project": [_("Tasks can't be moved to an archived project")]}
+        )
+    # Archived projects hide their tasks from link suggestions
+    search_suggest_invalidate(workspace_id=project.workspace_id)
+    _cache_generation_bump_tasks(tasks)
+    cache_generation_bump(project_ids=[project.pk])
+    return Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+        project=project, modified=now()
+    )
+
+
+@transaction.atomic
+def task_bulk_delete(*, who: User, tasks: Sequence[Task]) -> int:
+    """Delete tasks, return the number of tasks deleted."""
+    _validate_perm_per_workspace("workspace.delete_task", who, tasks)
+    with workspace_quota_counter_batch(), search_index_remove_batch():
+        _, deleted = Task.objects.filter(
+            pk__in=[task.pk for task in tasks]
+        ).delete()
+    return deleted.get(Task._meta.label, 0)
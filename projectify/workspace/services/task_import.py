@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Bulk task import services.
+
+Rows use the columns of projectify.workspace.selectors.export. Invalid rows
+are reported and skipped instead of aborting the import. Descriptions are
+sanitized in a process pool before the transaction starts, and tasks are
+inserted with bulk_create.
+"""
+
+import csv
+import json
+import logging
+import multiprocessing
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, TextIO, Union
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+
+import configurations
+from projectify.lib.auth import validate_perm
+from projectify.lib.models import RichTextField
+from projectify.user.models import User
+
+from ..models import Project, Task, TeamMember, Workspace
+from ..selectors.export import ExportFormat
+from ..selectors.quota import workspace_quota_for
+from ..utils import analyze_rich_text
+from .cache_generation import cache_generation_bump
+from .quota import workspace_quota_counter_adjust
+from .search import search_index_add_tasks
+
+logger = logging.getLogger(__name__)
+
+# Number of tasks inserted with one query
+IMPORT_BATCH_SIZE = 1000
+
+# Rows are None when they can't be read at all
+ImportRow = Optional[dict[str, Any]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TaskImportRowError:
+    """Errors for one row, counting rows from 1."""
+
+    row: int
+    messages: list[str]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TaskImportResult:
+    """Number of tasks created and the rows that were skipped."""
+
+    created: int
+    errors: list[TaskImportRowError]
+
+
+def task_import_read_rows(
+    stream: TextIO, *, import_format: ExportFormat
+) -> Iterator[ImportRow]:
+    """Read rows from a CSV file with a header or from JSON Lines."""
+    match import_format:
+        case "csv":
+            yield from csv.DictReader(stream)
+        case "jsonl":
+            for line in stream:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    yield None
+                    continue
+                yield row if isinstance(row, dict) else None
+
+
+def _description_field() -> RichTextField:
+    """Return Task.description."""
+    field = Task._meta.get_field("description")
+    assert isinstance(field, RichTextField), field
+    return field
+
+
+def _task_import_prepare(description: str) -> tuple[Optional[str], str, str]:
+    """
+    Return first paragraph text, sanitized description and plain text.
+
+    Runs in worker processes, so this only takes and returns plain values.
+    """
+    rich_text = analyze_rich_text(description)
+    return rich_text.title, str(rich_text.html), rich_text.text
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, or raise ValueError."""
+    if value in (None, ""):
+        return None
+    parsed = parse_datetime(str(value))
+    if parsed is None:
+        raise ValueError(value)
+    if timezone.is_naive(parsed):
+        return timezone.make_aware(parsed)
+    return parsed
+
+
+def _task_import_build(
+    row: ImportRow,
+    *,
+    workspace: Workspace,
+    project: Optional[Project],
+    projects: dict[str, Project],
+    assignees: dict[str, TeamMember],
+) -> Union[Task, list[str]]:
+    """Build an unsaved task from row, or return error messages."""
+    if row is None:
+        return [_("This row could not be read").format()]
+    messages: list[str] = []
+    project_key = row.get("project_uuid") or row.get("project")
+    if project_key:
+        project = projects.get(str(project_key))
+    if project is None:
+        messages.append(_("No project found for this row").format())
+
+    assignee: Optional[TeamMember] = None
+    if email := row.get("assignee"):
+        assignee = assignees.get(str(email).lower())
+        if assignee is None:
+            messages.append(
+                _("No team member with email {email}").format(email=email)
+            )
+
+    timestamps: dict[str, Optional[datetime]] = {}
+    for key in ("due_date", "done"):
+        try:
+            timestamps[key] = _parse_timestamp(row.get(key))
+        except ValueError:
+            messages.append(
+                _("Invalid {key} '{value}'").format(key=key, value=row[key])
+            )
+    if messages:
+        return messages
+    return Task(
+        workspace=workspace,
+        project=project,
+        title=str(row.get("title") or ""),
+        description=str(row.get("description") or ""),
+        assignee=assignee,
+        **timestamps,
+    )
+
+
+def task_import(
+    *,
+    who: User,
+    workspace: Workspace,
+    rows: Iterable[ImportRow],
+    project: Optional[Project] = None,
+    workers: int = 1,
+) -> TaskImportResult:
+    """
+    Import tasks into workspace.
+
+    Rows without a project column go into project. Descriptions are sanitized
+    by up to workers processes. Raise ValidationError if the workspace has
+    no quota left for all valid rows.
+
+    Workers are spawned instead of forked, so that they don't share this
+    process's database connection, and all sanitizing happens before the
+    tasks are saved in a transaction.
+    """
+    validate_perm("workspace.create_task", who, workspace)
+    projects: dict[str, Project] = {}
+    for p in workspace.project_set.filter(archived__isnull=True):
+        projects[str(p.uuid)] = p
+        projects.setdefault(p.title, p)
+    assignees = {
+        team_member.user.email.lower(): team_member
+        for team_member in workspace.teammember_set.select_related("user")
+    }
+
+    errors: list[TaskImportRowError] = []
+    numbered: list[tuple[int, Task]] = []
+    for number, row in enumerate(rows, start=1):
+        match _task_import_build(
+            row,
+            workspace=workspace,
+            project=project,
+            projects=projects,
+            assignees=assignees,
+        ):
+            case Task() as task:
+                numbered.append((number, task))
+            case messages:
+                errors.append(
+                    TaskImportRowError(row=number, messages=messages)
+                )
+
+    descriptions = [task.description or "" for number, task in numbered]
+    if workers > 1 and descriptions:
+        # Workers set up Django before unpickling _task_import_prepare
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=configurations.setup,
+        ) as executor:
+            prepared = list(
+                executor.map(
+                    _task_import_prepare,
+                    descriptions,
+                    chunksize=max(1, len(descriptions) // (workers * 4)),
+                )
+            )
+    else:
+        prepared = [_task_import_prepare(d) for d in descriptions]
+
+    field = _description_field()
+    tasks: list[Task] = []
+    bodies: list[str] = []
+    exclude = ["workspace", "project", "assignee"]
+    for (number, task), (title, sanitized, body) in zip(numbered, prepared):
+        task.description = field.mark_sanitized(sanitized)
+        if not task.title and title is not None:
+            task.title = title
+        try:
+            task.clean_fields(exclude=exclude)
+        except ValidationError as error:
+            errors.append(
+                TaskImportRowError(row=number, messages=error.messages)
+            )
+            continue
+        tasks.append(task)
+        bodies.append(body)
+    errors.sort(key=lambda error: error.row)
+    created = _task_import_save(
+        workspace=workspace, tasks=tasks, bodies=bodies
+    )
+    logger.info(
+        "Imported %d tasks into workspace %s, skipped %d rows",
+        created,
+        workspace.uuid,
+        len(errors),
+    )
+    return TaskImportResult(created=created, errors=errors)
+
+
+@transaction.atomic
+def _task_import_save(
+    *, workspace: Workspace, tasks: list[Task], bodies: list[str]
+) -> int:
+    """Save prepared tasks and index them, return the number created."""
+    quota = workspace_quota_for(resource="Task", workspace=workspace)
+    if (
+        quota.limit is not None
+        and quota.current is not None
+        and quota.current + len(tasks) > quota.limit
+    ):
+        raise ValidationError(
+            _(
+                "Importing {count} tasks would exceed this workspace's "
+                "limit of {limit} tasks"
+            ).format(count=len(tasks), limit=quota.limit)
+        )
+
+    created = Task.objects.bulk_create(tasks, batch_size=IMPORT_BATCH_SIZE)
+    workspace_quota_counter_adjust(
+        workspace=workspace, task_count=len(created)
+    )
+    # bulk_create sends no post_save signals
+    cache_generation_bump(
+        workspace_ids=[workspace.pk],
+        project_ids={task.project_id for task in created},
+    )
+    search_index_add_tasks(
+        workspace=workspace,
+        entries=[
+            (task.pk, task.title, body) for task, body in zip(created, bodies)
+        ],
+    )
+    return len(created)
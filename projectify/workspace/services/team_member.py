@@ -3,19 +3,28 @@
 # SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Team member services."""
 
+import logging
+import threading
+import time
+from datetime import datetime
 from typing import Optional
 
-from django.db import transaction
+from django.db import DatabaseError, transaction
+from django.db.models import Case, F, Subquery, Value, When
 from django.forms import ValidationError
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
-from projectify.lib.auth import validate_perm
+from projectify.lib.auth import validate_perm, workspace_roles_clear
+from projectify.lib.settings import get_settings
+from projectify.lib.worker import PeriodicWorker
 from projectify.user.models import User
 
 from ..const import TeamMemberRoles
 from ..models import Project, TeamMember
 
+logger = logging.getLogger(__name__)
+
 
 @transaction.atomic
 def team_member_update(
@@ -28,6 +37,16 @@ def team_member_update(
     return team_member
 
 
+def _team_member_roles_clear(*, team_member: TeamMember, who: User) -> None:
+    """Forget the loaded roles of the team member's user."""
+    # who keeps its roles for the rest of the request, unless they changed
+    if team_member.user_id == who.pk:
+        workspace_roles_clear(who)
+    # Don't query the user only to find that it has no roles loaded
+    if TeamMember.user.is_cached(team_member):
+        workspace_roles_clear(team_member.user)
+
+
 @transaction.atomic
 def team_member_change_role(
     *, team_member: TeamMember, who: User, role: TeamMemberRoles
@@ -36,6 +55,7 @@ def team_member_change_role(
     validate_perm("workspace.update_team_member_role", who, team_member)
     team_member.role = role
     team_member.save()
+    _team_member_roles_clear(team_member=team_member, who=who)
     return team_member
 
 
@@ -59,19 +79,164 @@ def team_member_delete(*, team_member: TeamMember, who: User) -> None:
             _("You can't remove yourself from this workspace")
         )
     team_member.delete()
+    _team_member_roles_clear(team_member=team_member, who=who)
+
+
+# Last visited workspace time and project pk by team member pk
+Visits = dict[int, tuple[datetime, Optional[int]]]
+
+
+class VisitBuffer:
+    """
+    Collect team member visits in memory until they are written.
+
+    Repeated visits by the same team member coalesce into one entry. Start a
+    flusher in each process the first time a visit is recorded, unless
+    TEAM_MEMBER_VISIT_FLUSH_INTERVAL is 0.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty buffer."""
+        self._visits: Visits = {}
+        self._taken = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(
+        self, *, team_member: TeamMember, project: Optional[Project]
+    ) -> None:
+        """Record a visit, keeping a project visited earlier."""
+        visited = team_member.last_visited_workspace
+        assert visited is not None
+        with self._lock:
+            project_pk = None if project is None else project.pk
+            if project_pk is None and team_member.pk in self._visits:
+                _, project_pk = self._visits[team_member.pk]
+            self._visits[team_member.pk] = (visited, project_pk)
+        visit_flusher.start()
+
+    def take(self, *, interval: float = 0) -> Visits:
+        """
+        Remove and return all visits.
+
+        Return nothing if the last take was less than interval seconds ago.
+        """
+        with self._lock:
+            taken = time.monotonic()
+            if taken - self._taken < interval:
+                return {}
+            self._taken = taken
+            visits, self._visits = self._visits, {}
+        return visits
+
+    def restore(self, visits: Visits) -> None:
+        """Record visits again that couldn't be written."""
+        with self._lock:
+            for pk, (visited, project_pk) in visits.items():
+                match self._visits.get(pk):
+                    case None:
+                        self._visits[pk] = (visited, project_pk)
+                    # A newer visit without a project keeps the earlier one
+                    case (newer, None):
+                        self._visits[pk] = (newer, project_pk)
+                    case _:
+                        pass
+
+    def clear(self) -> None:
+        """Discard all visits."""
+        with self._lock:
+            self._visits = {}
+
+
+visit_buffer = VisitBuffer()
 
 
 def team_member_visit_workspace(*, team_member: TeamMember) -> None:
-    """Mark a workspace as recently visited."""
+    """
+    Mark a workspace as recently visited.
+
+    The visit is only written by team_member_visits_flush().
+    """
     team_member.last_visited_workspace = now()
-    team_member.save()
+    visit_buffer.add(team_member=team_member, project=None)
 
 
 def team_member_visit_project(
     *, team_member: TeamMember, project: Project
 ) -> None:
-    """Mark a workspace and project as recently visited."""
+    """
+    Mark a workspace and project as recently visited.
+
+    The visit is only written by team_member_visits_flush().
+    """
     assert team_member.workspace_id == project.workspace.pk
     team_member.last_visited_project = project
     team_member.last_visited_workspace = now()
-    team_member.save()
+    visit_buffer.add(team_member=team_member, project=project)
+
+
+def team_member_visits_flush(*, interval: float = 0) -> int:
+    """
+    Write buffered visits with a single UPDATE.
+
+    Skip writing if the last flush was less than interval seconds ago.
+    Unlike TeamMember.save(), this doesn't validate and doesn't change
+    modified. Return the number of team members written. If writing fails,
+    the visits are kept for the next flush.
+    """
+    visits = visit_buffer.take(interval=interval)
+    if not visits:
+        return 0
+    updates = {
+        "last_visited_workspace": Case(
+            *(
+                When(pk=pk, then=Value(visited))
+                for pk, (visited, _) in visits.items()
+            )
+        )
+    }
+    project_visits = {
+        pk: project_pk
+        for pk, (_, project_pk) in visits.items()
+        if project_pk is not None
+    }
+    if project_visits:
+        # The subquery is NULL if the project has been deleted since
+        updates["last_visited_project"] = Case(
+            *(
+                When(
+                    pk=pk,
+                    then=Subquery(
+                        Project.objects.filter(pk=project_pk).values("pk")
+                    ),
+                )
+                for pk, project_pk in project_visits.items()
+            ),
+            default=F("last_visited_project"),
+            output_field=TeamMember.last_visited_project.field,
+        )
+    try:
+        TeamMember.objects.filter(pk__in=visits).update(**updates)
+    except DatabaseError:
+        visit_buffer.restore(visits)
+        raise
+    return len(visits)
+
+
+def _flush_periodically() -> None:
+    """
+    Flush visits, unless that happened during the last interval.
+
+    This writes visits left behind when no more requests come in.
+    """
+    team_member_visits_flush(
+        interval=get_settings().TEAM_MEMBER_VISIT_FLUSH_INTERVAL
+    )
+
+
+visit_flusher = PeriodicWorker(
+    name="team-member-visit-flusher",
+    run=_flush_periodically,
+    # Visits are written after every request anyway
+    interval=lambda: get_settings().TEAM_MEMBER_VISIT_FLUSH_INTERVAL,
+    at_exit=team_member_visits_flush,
+)
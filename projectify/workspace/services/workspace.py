@@ -16,14 +16,15 @@ from django.forms import ValidationError
 from django.utils.translation import gettext_lazy as _
 
 from projectify.corporate.services.customer import customer_create
-from projectify.lib.auth import validate_perm
+from projectify.lib.auth import validate_perm, workspace_roles_clear
 from projectify.user.models import User
 from projectify.workspace.selectors.workspace import (
     workspace_find_unpaid_for_user,
 )
 
 from ..const import TeamMemberRoles
-from ..models import TeamMember, Workspace
+from ..models import TeamMember, Workspace, WorkspaceQuotaCounter
+from .quota import workspace_quota_counter_batch
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ def workspace_create(
             )
         )
     workspace = Workspace.objects.create(title=title, description=description)
+    WorkspaceQuotaCounter.objects.create(workspace=workspace)
     workspace_add_user(
         workspace=workspace, user=owner, role=TeamMemberRoles.OWNER
     )
@@ -101,13 +103,15 @@ def workspace_delete(*, who: User, workspace: Workspace) -> None:
         )
     if workspace.project_set.exists():
         raise ValidationError(_("Can only delete workspace with no projects"))
-    count, _info = workspace.teammember_set.all().delete()
-    logger.info(
-        "Deleting workspace %s, after having deleted %d users",
-        workspace,
-        count,
-    )
-    workspace.delete()
+    with workspace_quota_counter_batch():
+        count, _info = workspace.teammember_set.all().delete()
+        logger.info(
+            "Deleting workspace %s, after having deleted %d users",
+            workspace,
+            count,
+        )
+        workspace.delete()
+    workspace_roles_clear(who)
 
 
 # TODO looks like this is a private method only to be used to create the
@@ -117,4 +121,5 @@ def workspace_add_user(
 ) -> TeamMember:
     """Add user to workspace. Return new team member."""
     team_member = workspace.teammember_set.create(user=user, role=role)
+    workspace_roles_clear(user)
     return team_member
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""
+Workspace signal receivers.
+
+Creating or deleting resources adjusts the workspace's quota counter, see
+projectify.workspace.services.quota. This covers cascades and deletions in
+the Django admin, which bypass the services.
+
+Saving or deleting a task or project updates the full-text search index, see
+projectify.workspace.services.search.
+
+Saving or deleting anything that is shown inside a workspace starts a new
+cache generation for it, see projectify.workspace.selectors.cache_generation.
+
+QuerySet.update() and bulk_create() send no signals, so services using them
+adjust counters and bump generations themselves.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Optional, Union
+
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from projectify.corporate.models import Customer
+
+from .models import Project, Task, TeamMember, TeamMemberInvite, Workspace
+from .services.cache_generation import cache_generation_bump
+from .services.quota import (
+    workspace_quota_counter_created,
+    workspace_quota_counter_deleted,
+)
+from .services.search import (
+    search_index_remove_project,
+    search_index_remove_task,
+    search_index_update,
+)
+
+QuotaResource = Union[Task, Project, TeamMember, TeamMemberInvite]
+
+# WorkspaceQuotaCounter field counting each model
+QUOTA_COUNTER_KEYS: Mapping[type[Model], str] = {
+    Task: "task_count",
+    Project: "project_count",
+    TeamMember: "team_member_count",
+    TeamMemberInvite: "team_member_invite_count",
+}
+
+# Task and project fields stored in the search index
+SEARCH_FIELDS = frozenset({"title", "description"})
+
+
+def _quota_counts(instance: QuotaResource) -> bool:
+    """Return True if instance counts towards its workspace's quota."""
+    match instance:
+        case TeamMemberInvite(redeemed=True):
+            # Redeeming adjusts the counter, see user_invite_redeem()
+            return False
+        case _:
+            return True
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_save, sender=TeamMemberInvite)
+def quota_resource_saved(
+    instance: QuotaResource, created: bool, **kwargs: Any
+) -> None:
+    """Count a created resource."""
+    if created and _quota_counts(instance):
+        workspace_quota_counter_created(
+            workspace_id=instance.workspace_id,
+            key=QUOTA_COUNTER_KEYS[type(instance)],
+        )
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_delete, sender=TeamMemberInvite)
+def quota_resource_deleted(instance: QuotaResource, **kwargs: Any) -> None:
+    """Stop counting a deleted resource."""
+    if _quota_counts(instance):
+        workspace_quota_counter_deleted(
+            workspace_id=instance.workspace_id,
+            key=QUOTA_COUNTER_KEYS[type(instance)],
+        )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Project)
+def search_resource_saved(
+    instance: Union[Task, Project],
+    update_fields: Optional[frozenset[str]],
+    **kwargs: Any,
+) -> None:
+    """Index a saved task or project, unless only other fields changed."""
+    if update_fields is None or not SEARCH_FIELDS.isdisjoint(update_fields):
+        search_index_update(obj=instance)
+
+
+@receiver(post_delete, sender=Task)
+def search_task_deleted(instance: Task, **kwargs: Any) -> None:
+    """Remove a deleted task from the search index."""
+    search_index_remove_task(task=instance)
+
+
+@receiver(post_delete, sender=Project)
+def search_project_deleted(instance: Project, **kwargs: Any) -> None:
+    """Remove a deleted project from the search index."""
+    search_index_remove_project(project=instance)
+
+
+@receiver(post_save, sender=Workspace)
+@receiver(post_delete, sender=Workspace)
+def workspace_changed(instance: Workspace, **kwargs: Any) -> None:
+    """Bump the workspace's generation."""
+    cache_generation_bump(workspace_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_changed(instance: Project, **kwargs: Any) -> None:
+    """Bump the generations of the project and its workspace."""
+    cache_generation_bump(
+        workspace_ids=[instance.workspace_id], project_ids=[instance.pk]
+    )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def task_changed(instance: Task, **kwargs: Any) -> None:
+    """Bump the generations of the task's project and workspace."""
+    cache_generation_bump(
+        workspace_ids=[instance.workspace_id],
+        project_ids=[instance.project_id],
+    )
+
+
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_save, sender=TeamMemberInvite)
+@receiver(post_delete, sender=TeamMemberInvite)
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def workspace_member_changed(
+    instance: Union[TeamMember, TeamMemberInvite, Customer], **kwargs: Any
+) -> None:
+    """Bump the workspace's generation for team and subscription changes."""
+    cache_generation_bump(workspace_ids=[instance.workspace_id])
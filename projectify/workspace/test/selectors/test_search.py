@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test full-text search selectors."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from projectify.lib.cache import LRUCache
+from pytest_types import DjangoAssertNumQueries, DjangoCaptureOnCommitCallbacks
+
+from ...models import Project, Task, TeamMember
+from ...selectors.search import (
+    SEARCH_TABLES,
+    SUGGEST_LIMIT,
+    search_filter_ranked,
+    search_suggest,
+    search_terms,
+    suggest_cache,
+)
+from ...selectors.workspace import workspace_search
+from ...services.project import project_archive, project_delete
+from ...services.search import search_index_rebuild
+from ...services.task import task_create, task_delete, task_update
+
+pytestmark = pytest.mark.django_db
+
+
+def test_search_terms() -> None:
+    """Test that operators and punctuation are dropped."""
+    assert search_terms('Fix "the" BUG* -now!') == ["fix", "the", "bug", "now"]
+    assert search_terms("*:& |") == []
+
+
+def test_search_ranked(team_member: TeamMember, project: Project) -> None:
+    """Test that title matches rank above description matches."""
+    who = team_member.user
+    in_description = task_create(
+        who=who,
+        project=project,
+        title_description="<p>Groceries</p><p>Buy some bananas</p>",
+    )
+    in_title = task_create(
+        who=who, project=project, title_description="<p>Banana bread</p>"
+    )
+    task_create(who=who, project=project, title_description="Unrelated")
+    results = workspace_search(
+        workspace=project.workspace, who=who, query="banan"
+    )
+    assert list(results.tasks) == [in_title, in_description]
+    # Every word has to match
+    results = workspace_search(
+        workspace=project.workspace, who=who, query="banana bread"
+    )
+    assert list(results.tasks) == [in_title]
+    # Nothing to search for
+    results = workspace_search(
+        workspace=project.workspace, who=who, query="!!"
+    )
+    assert list(results.tasks) == []
+
+
+def test_search_index_sync(
+    team_member: TeamMember, project: Project, task: Task
+) -> None:
+    """Test that services keep the search index up to date."""
+    who = team_member.user
+    tasks = Task.objects.all()
+    task_update(who=who, task=task, title_description="Zeppelin")
+    assert list(search_filter_ranked(tasks, kind="task", query="zep")) == [
+        task
+    ]
+    task_delete(who=who, task=task)
+    assert not search_filter_ranked(tasks, kind="task", query="zep").exists()
+
+    projects = Project.objects.all()
+    assert search_filter_ranked(
+        projects, kind="project", query=project.title
+    ).exists()
+    project_delete(who=who, project=project)
+    assert not search_filter_ranked(
+        projects, kind="project", query=project.title
+    ).exists()
+
+
+def test_search_index_cascade(project: Project, task: Task) -> None:
+    """Test that deleting outside of services leaves no index rows behind."""
+    project.title = "Quince"
+    # Like the Django admin does
+    project.save()
+    projects = Project.objects.all()
+    assert search_filter_ranked(
+        projects, kind="project", query="quince"
+    ).exists()
+    project.delete()
+    with connection.cursor() as cursor:
+        for table in SEARCH_TABLES.values():
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            assert cursor.fetchone() == (0,)
+
+
+def test_search_index_remove_batch(
+    team_member: TeamMember, project: Project
+) -> None:
+    """Test that deleting a project removes its tasks at once."""
+    who = team_member.user
+    for _ in range(3):
+        task_create(who=who, project=project, title_description="Plum")
+    with CaptureQueriesContext(connection) as captured:
+        project_delete(who=who, project=project)
+    index_deletes = [
+        query["sql"]
+        for query in captured.captured_queries
+        if query["sql"].startswith("DELETE FROM workspace_")
+        and "_search " in query["sql"]
+    ]
+    if connection.vendor == "sqlite":
+        # One for the tasks, one for the project
+        assert len(index_deletes) == 2
+    else:
+        assert index_deletes == []
+    with connection.cursor() as cursor:
+        for table in SEARCH_TABLES.values():
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            assert cursor.fetchone() == (0,)
+
+
+def test_search_index_rebuild(project: Project, task: Task) -> None:
+    """Test rebuilding the search index."""
+    assert search_index_rebuild() == 2
+    tasks = Task.objects.all()
+    assert list(
+        search_filter_ranked(tasks, kind="task", query=task.title)
+    ) == [task]
+
+
+def test_search_suggest(
+    team_member: TeamMember,
+    project: Project,
+    task: Task,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Test that suggestions match titles only and are cached."""
+    who = team_member.user
+    workspace = project.workspace
+    task_update(who=who, task=task, title_description="<p>Kiwi</p><p>Fig</p>")
+    with django_assert_num_queries(1):
+        (suggestion,) = search_suggest(
+            workspace=workspace, kind="task", query="kiw"
+        )
+    assert suggestion.uuid == task.uuid
+    assert suggestion.url == task.get_absolute_url()
+    # The description doesn't count
+    assert search_suggest(workspace=workspace, kind="task", query="fig") == []
+    # Same prefix, cached
+    with django_assert_num_queries(0):
+        assert search_suggest(
+            workspace=workspace, kind="task", query=" KIW "
+        ) == [suggestion]
+        assert (
+            search_suggest(
+                workspace=workspace,
+                kind="task",
+                query="kiw",
+                exclude_task=task.uuid,
+            )
+            == []
+        )
+    # Changing a task clears the cache
+    other = task_create(who=who, project=project, title_description="Kiwis")
+    suggestions = search_suggest(workspace=workspace, kind="task", query="kiw")
+    assert {s.uuid for s in suggestions} == {task.uuid, other.uuid}
+    # Tasks in archived projects aren't suggested
+    project_archive(who=who, project=project, archived=True)
+    assert search_suggest(workspace=workspace, kind="task", query="kiw") == []
+    assert (
+        search_suggest(
+            workspace=workspace, kind="project", query=project.title
+        )
+        == []
+    )
+
+
+def test_search_suggest_invalidate_on_commit(
+    team_member: TeamMember,
+    task: Task,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    """Test that suggestions cached before the commit are forgotten."""
+    workspace = task.workspace
+    with django_capture_on_commit_callbacks(execute=True):
+        task_update(who=team_member.user, task=task, title_description="Yuzu")
+        # Another request still sees the old title and caches it
+        suggest_cache.set(workspace.pk, LRUCache(maxsize=1))
+    assert suggest_cache.get(workspace.pk) is None
+    (suggestion,) = search_suggest(
+        workspace=workspace, kind="task", query="yuz"
+    )
+    assert suggestion.uuid == task.uuid
+
+
+def test_search_suggest_limit(
+    team_member: TeamMember, project: Project
+) -> None:
+    """Test that at most SUGGEST_LIMIT suggestions are returned."""
+    who = team_member.user
+    tasks = [
+        task_create(who=who, project=project, title_description="Lemon")
+        for _ in range(SUGGEST_LIMIT + 2)
+    ]
+    suggestions = search_suggest(
+        workspace=project.workspace,
+        kind="task",
+        query="lem",
+        exclude_task=tasks[0].uuid,
+    )
+    assert len(suggestions) == SUGGEST_LIMIT
+    assert tasks[0].uuid not in {s.uuid for s in suggestions}
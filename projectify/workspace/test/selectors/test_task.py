@@ -3,13 +3,29 @@
 # SPDX-FileCopyrightText: 2023 JWP Consulting GK
 """Test task selectors."""
 
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Optional
+from uuid import UUID
+
+from django.db.models import F
+from django.utils.http import urlsafe_base64_encode
+
 import pytest
 
 from projectify.user.models import User
 from pytest_types import DjangoAssertNumQueries
 
-from ...models import Task, Workspace
-from ...selectors.task import task_find_by_task_uuid
+from ...models import Project, Task, TeamMember, Workspace
+from ...selectors.task import (
+    TaskCursor,
+    task_cursor_decode,
+    task_cursor_encode,
+    task_find_by_task_uuid,
+    task_find_page_for_project,
+    task_rows,
+)
+from ...services.task import task_create
 
 
 @pytest.mark.django_db
@@ -29,3 +45,82 @@ def test_task_find_by_task_uuid(
             task_find_by_task_uuid(who=meddling_user, task_uuid=task.uuid)
             is None
         )
+
+
+@pytest.mark.django_db
+def test_task_rows(
+    task: Task,
+    team_member: TeamMember,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Test loading task rows."""
+    task.assignee = team_member
+    task.save()
+    with django_assert_num_queries(1):
+        (row,) = task_rows(Task.objects.filter(pk=task.pk))
+    assert row.uuid == task.uuid
+    assert row.title == task.title
+    assert row.project_title == task.project.title
+    assert row.get_absolute_url() == task.get_absolute_url()
+    assert row.assignee is not None
+    assert row.assignee.uuid == team_member.uuid
+    assert row.assignee.name == str(team_member.user)
+
+    task.assignee = None
+    task.save()
+    (row,) = task_rows(Task.objects.filter(pk=task.pk))
+    assert row.assignee is None
+
+
+@pytest.mark.django_db
+def test_task_find_page_for_project(
+    project: Project,
+    team_member: TeamMember,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Test paging through a project's tasks with cursors."""
+    tasks = [
+        task_create(who=team_member.user, project=project, title_description=t)
+        for t in "abcdefg"
+    ]
+    # Produce ties in done and modified
+    then = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+    Task.objects.filter(pk__in=[t.pk for t in tasks[:4]]).update(modified=then)
+    Task.objects.filter(pk__in=[t.pk for t in tasks[2:6]]).update(done=then)
+    expected = list(
+        Task.objects.filter(project=project)
+        .order_by(
+            F("done").asc(nulls_first=True),
+            F("modified").desc(),
+            F("pk").desc(),
+        )
+        .values_list("uuid", flat=True)
+    )
+    seen: list[UUID] = []
+    after: Optional[TaskCursor] = None
+    while True:
+        with django_assert_num_queries(1):
+            page = task_find_page_for_project(
+                project=project, limit=3, after=after
+            )
+        seen += [row.uuid for row in page.tasks]
+        if page.next_cursor is None:
+            break
+        after = task_cursor_decode(page.next_cursor)
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_task_cursor(task: Task) -> None:
+    """Test encoding and decoding task cursors."""
+    task.done = task.modified - timedelta(days=1)
+    cursor = task_cursor_decode(task_cursor_encode(task))
+    assert cursor is not None
+    assert cursor.done == task.done
+    assert cursor.modified == task.modified
+    assert cursor.pk == task.pk
+    assert task_cursor_decode("!!") is None
+    assert task_cursor_decode("Zm9v") is None
+    # Naive datetimes
+    naive = urlsafe_base64_encode(f"|2026-01-01T00:00:00|{task.pk}".encode())
+    assert task_cursor_decode(naive) is None
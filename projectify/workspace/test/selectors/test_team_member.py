@@ -16,6 +16,7 @@ from ...selectors.team_member import (
 from ...services.team_member import (
     team_member_visit_project,
     team_member_visit_workspace,
+    team_member_visits_flush,
 )
 
 pytestmark = pytest.mark.django_db
@@ -39,13 +40,16 @@ def test_team_member_multiple_workspaces(
     # No last visited in the beginning
     assert team_member_last_workspace_for_user(user=user) is None
     team_member_visit_workspace(team_member=team_member)
+    team_member_visits_flush()
     assert team_member_last_workspace_for_user(user=user) == workspace
 
     other_team_member = other_workspace.teammember_set.get()
     team_member_visit_workspace(team_member=other_team_member)
+    team_member_visits_flush()
     assert team_member_last_workspace_for_user(user=user) == other_workspace
 
     team_member_visit_workspace(team_member=team_member)
+    team_member_visits_flush()
     assert team_member_last_workspace_for_user(user=user) == workspace
 
     # This will not set a last visited project
@@ -76,6 +80,7 @@ def test_team_member_multiple_projects(
     )
 
     team_member_visit_project(team_member=team_member, project=project)
+    team_member_visits_flush()
     assert (
         team_member_last_project_for_user(user=user, workspace=workspace)
         == project
@@ -84,12 +89,14 @@ def test_team_member_multiple_projects(
     team_member_visit_project(
         team_member=team_member, project=other_project_same_workspace
     )
+    team_member_visits_flush()
     assert (
         team_member_last_project_for_user(user=user, workspace=workspace)
         == other_project_same_workspace
     )
 
     team_member_visit_project(team_member=team_member, project=project)
+    team_member_visits_flush()
     assert (
         team_member_last_project_for_user(user=user, workspace=workspace)
         == project
@@ -108,6 +115,7 @@ def test_team_member_preferences_other_project(
     """
     user = team_member.user
     team_member_visit_project(team_member=team_member, project=project)
+    team_member_visits_flush()
 
     assert (
         team_member_last_project_for_user(user=user, workspace=other_workspace)
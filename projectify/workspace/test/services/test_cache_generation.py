@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test cache generation services and signal receivers."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from projectify.corporate.models import Customer
+from pytest_types import DjangoAssertNumQueries, DjangoCaptureOnCommitCallbacks
+
+from ...models import CacheGeneration, Project, Task, TeamMember, Workspace
+from ...selectors.cache_generation import (
+    cache_generation_annotate,
+    cache_generation_for,
+    cache_key_for,
+)
+from ...services.cache_generation import cache_generation_bump, pending_bumps
+from ...services.task import task_bulk_assign, task_mark_done
+
+pytestmark = pytest.mark.django_db
+
+
+def test_cache_generation_bump(
+    workspace: Workspace,
+    project: Project,
+    other_project_same_workspace: Project,
+    task: Task,
+    unpaid_customer: Customer,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    """Test that saving models starts new generations on commit."""
+    workspace_generation = cache_generation_for(workspace=workspace)
+    project_generation = cache_generation_for(
+        workspace=workspace, project=project
+    )
+    other_generation = cache_generation_for(
+        workspace=workspace, project=other_project_same_workspace
+    )
+    key = cache_key_for("sidebar", workspace=workspace, project=project)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        task.save()
+        # Nothing changes before the commit
+        assert (
+            cache_generation_for(workspace=workspace) == workspace_generation
+        )
+    assert cache_generation_for(workspace=workspace) != workspace_generation
+    assert (
+        cache_generation_for(workspace=workspace, project=project)
+        != project_generation
+    )
+    assert (
+        cache_key_for("sidebar", workspace=workspace, project=project) != key
+    )
+    # The other project's generation changes with the workspace
+    assert (
+        cache_generation_for(
+            workspace=workspace, project=other_project_same_workspace
+        )
+        != other_generation
+    )
+
+    workspace_generation = cache_generation_for(workspace=workspace)
+    with django_capture_on_commit_callbacks(execute=True):
+        unpaid_customer.seats = 2
+        unpaid_customer.save()
+    assert cache_generation_for(workspace=workspace) != workspace_generation
+
+
+def test_cache_generation_bulk(
+    workspace: Workspace,
+    project: Project,
+    task: Task,
+    team_member: TeamMember,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    """Test that bulk updates without signals start new generations."""
+    generation = cache_generation_for(workspace=workspace, project=project)
+    with django_capture_on_commit_callbacks(execute=True):
+        task_bulk_assign(who=team_member.user, tasks=[task], assignee=None)
+    assert (
+        cache_generation_for(workspace=workspace, project=project)
+        != generation
+    )
+
+
+def test_cache_generation_merged(
+    workspace: Workspace,
+    project: Project,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    """Test that all bumps in a transaction are merged into one."""
+    assert cache_generation_for(workspace=workspace, project=project) == "0.0"
+    with django_capture_on_commit_callbacks() as callbacks:
+        cache_generation_bump(workspace_ids=[workspace.pk])
+        cache_generation_bump(
+            workspace_ids=[workspace.pk], project_ids=[project.pk]
+        )
+    # One INSERT for missing counters, one UPDATE for all of them
+    with django_assert_num_queries(2):
+        for callback in callbacks:
+            callback()
+    assert cache_generation_for(workspace=workspace, project=project) == "1.1"
+    with django_capture_on_commit_callbacks(execute=True):
+        cache_generation_bump(project_ids=[project.pk])
+    assert cache_generation_for(workspace=workspace, project=project) == "1.2"
+
+
+def test_cache_generation_annotate(
+    workspace: Workspace,
+    project: Project,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    """Test that annotated projects carry their generations."""
+    # Creating the fixtures bumped generations that never committed
+    pending_bumps.clear()
+    with django_capture_on_commit_callbacks(execute=True):
+        cache_generation_bump(project_ids=[project.pk])
+    annotated = cache_generation_annotate(Project.objects.all()).get(
+        pk=project.pk
+    )
+    with django_assert_num_queries(0):
+        generation = cache_generation_for(
+            workspace=workspace, project=annotated
+        )
+    assert generation == "0.1"
+    assert generation == cache_generation_for(
+        workspace=workspace, project=project
+    )
+
+
+def test_cache_generation_write_queries(
+    team_member: TeamMember,
+    task: Task,
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    """Test how many writes bumping generations adds to a task update."""
+    table = CacheGeneration._meta.db_table
+    with CaptureQueriesContext(connection) as captured:
+        with django_capture_on_commit_callbacks(execute=True):
+            task_mark_done(who=team_member.user, task=task, done=True)
+    generation_queries = [
+        query["sql"]
+        for query in captured.captured_queries
+        if table in query["sql"]
+    ]
+    # One INSERT for missing counters, one UPDATE for all of them
+    assert len(generation_queries) == 2
+    assert generation_queries[0].startswith("INSERT")
+    assert generation_queries[1].startswith("UPDATE")
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test workspace quota counter services."""
+
+import pytest
+
+from pytest_types import DjangoAssertNumQueries
+
+from ...models import Project, Task, TeamMember, TeamMemberInvite, Workspace
+from ...selectors.quota import (
+    workspace_resource_counts,
+    workspace_resource_counts_compute,
+)
+from ...services.project import project_delete
+from ...services.quota import workspace_quota_counter_reconcile
+from ...services.task import task_create, task_delete
+
+pytestmark = pytest.mark.django_db
+
+
+def test_counters_follow_services(
+    team_member: TeamMember, project: Project, task: Task
+) -> None:
+    """Test that services keep the counter in sync."""
+    workspace = team_member.workspace
+    user = team_member.user
+    assert workspace_resource_counts(workspace=workspace) == {
+        "task_count": 1,
+        "project_count": 1,
+        # The project fixture adds other_team_member
+        "team_member_count": 2,
+        "team_member_invite_count": 0,
+    }
+    task_create(who=user, project=project, title_description="bla")
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 2
+    task_delete(who=user, task=task)
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 1
+    project_delete(who=user, project=project)
+    assert workspace_resource_counts(
+        workspace=workspace
+    ) == workspace_resource_counts_compute(workspace=workspace)
+
+
+def test_counters_follow_cascades(
+    team_member: TeamMember,
+    other_team_member: TeamMember,
+    team_member_invite: TeamMemberInvite,
+    project: Project,
+    task: Task,
+) -> None:
+    """Test that deleting models directly keeps the counter in sync."""
+    workspace = team_member.workspace
+    team_member_invite.delete()
+    other_team_member.user.delete()
+    project.delete()
+    assert workspace_resource_counts(workspace=workspace) == {
+        "task_count": 0,
+        "project_count": 0,
+        "team_member_count": 1,
+        "team_member_invite_count": 0,
+    }
+    assert not workspace_quota_counter_reconcile(workspace=workspace)
+
+
+def test_workspace_resource_counts_single_query(
+    workspace: Workspace, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    """Test that reading counts is one row lookup."""
+    with django_assert_num_queries(1):
+        workspace_resource_counts(workspace=workspace)
+
+
+def test_workspace_quota_counter_reconcile(
+    team_member: TeamMember, task: Task
+) -> None:
+    """Test repairing counter drift."""
+    workspace = team_member.workspace
+    assert not workspace_quota_counter_reconcile(workspace=workspace)
+    workspace.quota_counter.task_count = 1337
+    workspace.quota_counter.save()
+    assert workspace_quota_counter_reconcile(workspace=workspace)
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 1
+
+    # Missing counters are created
+    workspace.quota_counter.delete()
+    assert workspace_quota_counter_reconcile(workspace=workspace)
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 1
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Test task services."""
 
 from datetime import datetime
@@ -10,7 +10,16 @@ from django.forms import ValidationError
 import pytest
 
 from ...models import Project, Task, TeamMember
-from ...services.task import task_create, task_mark_done, task_update
+from ...selectors.quota import workspace_resource_counts
+from ...services.task import (
+    task_bulk_assign,
+    task_bulk_delete,
+    task_bulk_mark_done,
+    task_bulk_move_to_project,
+    task_create,
+    task_mark_done,
+    task_update,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -113,3 +122,80 @@ def test_task_mark_done(task: Task, team_member: TeamMember) -> None:
     task_mark_done(who=team_member.user, task=task, done=False)
     task.refresh_from_db()
     assert task.done is None
+
+
+# Bulk
+def test_task_bulk_mark_done(
+    task: Task, other_task: Task, team_member: TeamMember
+) -> None:
+    """Test marking several tasks as done and then not done."""
+    tasks = [task, other_task]
+    assert task_bulk_mark_done(who=team_member.user, tasks=tasks, done=True)
+    assert Task.objects.filter(done__isnull=False).count() == 2
+
+    task_bulk_mark_done(who=team_member.user, tasks=tasks, done=False)
+    assert Task.objects.filter(done__isnull=False).count() == 0
+
+
+def test_task_bulk_assign(
+    task: Task,
+    other_task: Task,
+    team_member: TeamMember,
+    other_team_member: TeamMember,
+    unrelated_team_member: TeamMember,
+) -> None:
+    """Test assigning and unassigning several tasks."""
+    tasks = [task, other_task]
+    task_bulk_assign(
+        who=team_member.user, tasks=tasks, assignee=other_team_member
+    )
+    assert other_team_member.task_set.count() == 2
+
+    with pytest.raises(ValidationError) as e:
+        task_bulk_assign(
+            who=team_member.user, tasks=tasks, assignee=unrelated_team_member
+        )
+    assert e.match("belongs to a different workspace")
+
+    task_bulk_assign(who=team_member.user, tasks=tasks, assignee=None)
+    assert other_team_member.task_set.count() == 0
+
+
+def test_task_bulk_move_to_project(
+    task: Task,
+    other_task: Task,
+    team_member: TeamMember,
+    other_project_same_workspace: Project,
+    other_project: Project,
+    archived_project: Project,
+) -> None:
+    """Test moving several tasks to another project."""
+    tasks = [task, other_task]
+    task_bulk_move_to_project(
+        who=team_member.user, tasks=tasks, project=other_project_same_workspace
+    )
+    assert other_project_same_workspace.task_set.count() == 2
+
+    with pytest.raises(ValidationError) as e:
+        task_bulk_move_to_project(
+            who=team_member.user, tasks=tasks, project=other_project
+        )
+    assert e.match("same workspace")
+
+    with pytest.raises(ValidationError) as e:
+        task_bulk_move_to_project(
+            who=team_member.user, tasks=tasks, project=archived_project
+        )
+    assert e.match("archived project")
+
+
+def test_task_bulk_delete(
+    task: Task, other_task: Task, team_member: TeamMember
+) -> None:
+    """Test deleting several tasks."""
+    workspace = task.workspace
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 2
+    deleted = task_bulk_delete(who=team_member.user, tasks=[task, other_task])
+    assert deleted == 2
+    assert not Task.objects.exists()
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 0
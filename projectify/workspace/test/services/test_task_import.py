@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test task import services."""
+
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+
+import pytest
+
+from projectify.corporate.models import Customer
+
+from ...models import Project, Task, TeamMember
+from ...selectors.quota import workspace_resource_counts
+from ...selectors.search import search_filter_ranked
+from ...services.task_import import task_import, task_import_read_rows
+
+pytestmark = pytest.mark.django_db
+
+
+def test_task_import(
+    project: Project,
+    team_member: TeamMember,
+    other_project_same_workspace: Project,
+) -> None:
+    """Test importing valid and invalid rows."""
+    workspace = project.workspace
+    rows = [
+        {"description": "<p>Hello</p><p>world<script>x</script></p>"},
+        {
+            "title": "Assigned",
+            "project": other_project_same_workspace.title,
+            "assignee": team_member.user.email.upper(),
+            "due_date": "2026-01-01T00:00:00+00:00",
+        },
+        {"title": "Unknown project", "project": "Does not exist"},
+        {"title": "Bad date", "due_date": "yesterday"},
+        {"description": ""},
+        None,
+    ]
+    result = task_import(
+        who=team_member.user, workspace=workspace, project=project, rows=rows
+    )
+    assert result.created == 2
+    assert [error.row for error in result.errors] == [3, 4, 5, 6]
+
+    task = project.task_set.get()
+    assert task.title == "Hello"
+    assert task.description.startswith("<p>Hello</p><p>world")
+    assert "script" not in task.description
+    other = other_project_same_workspace.task_set.get()
+    assert other.assignee == team_member
+    assert other.due_date is not None
+
+    assert workspace_resource_counts(workspace=workspace)["task_count"] == 2
+    matches = search_filter_ranked(
+        Task.objects.all(), kind="task", query="world"
+    )
+    assert list(matches) == [task]
+
+
+def test_task_import_workers(
+    project: Project, team_member: TeamMember
+) -> None:
+    """Test sanitizing descriptions in worker processes."""
+    rows = [
+        {"description": f"<p>Task {i}</p><script>x</script>"} for i in range(4)
+    ]
+    result = task_import(
+        who=team_member.user,
+        workspace=project.workspace,
+        project=project,
+        rows=rows,
+        workers=2,
+    )
+    assert result.created == 4
+    assert result.errors == []
+    tasks = project.task_set.order_by("title")
+    assert [task.title for task in tasks] == [f"Task {i}" for i in range(4)]
+    assert all("script" not in task.description for task in tasks)
+
+
+def test_task_import_quota(
+    project: Project,
+    team_member: TeamMember,
+    unpaid_customer: Customer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that imports exceeding the quota are refused."""
+    monkeypatch.setattr(
+        "projectify.workspace.selectors.quota.trial_conditions",
+        {"Task": 1, "Project": 10, "TeamMemberAndInvite": 2},
+    )
+    rows = [{"title": "a"}, {"title": "b"}]
+    with pytest.raises(ValidationError) as e:
+        task_import(
+            who=team_member.user,
+            workspace=project.workspace,
+            project=project,
+            rows=rows,
+        )
+    assert e.match("exceed")
+    assert not Task.objects.exists()
+
+
+def test_task_import_read_rows() -> None:
+    """Test reading CSV and JSON Lines."""
+    csv_rows = task_import_read_rows(
+        StringIO("title,description\nfoo,<p>bar</p>\n"), import_format="csv"
+    )
+    assert list(csv_rows) == [{"title": "foo", "description": "<p>bar</p>"}]
+    jsonl_rows = task_import_read_rows(
+        StringIO('{"title": "foo"}\n\nnot json\n[]\n'), import_format="jsonl"
+    )
+    assert list(jsonl_rows) == [{"title": "foo"}, None, None]
@@ -3,11 +3,15 @@
 # SPDX-FileCopyrightText: 2023,2026 JWP Consulting GK
 """Test team member services."""
 
+from unittest.mock import patch
+
 from django.core.exceptions import PermissionDenied
+from django.db import DatabaseError
 
 import pytest
 
 from projectify.user.models import User
+from pytest_types import DjangoAssertNumQueries
 
 from ...const import TeamMemberRoles
 from ...models import Project, TeamMember
@@ -17,6 +21,8 @@ from ...services.team_member import (
     team_member_update,
     team_member_visit_project,
     team_member_visit_workspace,
+    team_member_visits_flush,
+    visit_buffer,
 )
 from ...services.workspace import workspace_add_user
 
@@ -90,3 +96,57 @@ def test_team_member_visit_functions(
         team_member_visit_project(
             team_member=team_member, project=other_project
         )
+
+
+def test_team_member_visits_flush(
+    team_member: TeamMember,
+    other_team_member: TeamMember,
+    project: Project,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Test that visits are coalesced and written with one query."""
+    modified = team_member.modified
+    team_member_visit_project(team_member=team_member, project=project)
+    # Visiting the workspace afterwards keeps the last visited project
+    team_member_visit_workspace(team_member=team_member)
+    team_member_visit_workspace(team_member=other_team_member)
+    with django_assert_num_queries(1):
+        assert team_member_visits_flush() == 2
+    assert team_member_visits_flush() == 0
+
+    team_member.refresh_from_db()
+    assert team_member.last_visited_project == project
+    assert team_member.last_visited_workspace is not None
+    assert team_member.modified == modified
+    other_team_member.refresh_from_db()
+    assert other_team_member.last_visited_project is None
+    assert other_team_member.last_visited_workspace is not None
+
+
+def test_team_member_visits_flush_interval(team_member: TeamMember) -> None:
+    """Test that visits wait for the flush interval."""
+    team_member_visit_workspace(team_member=team_member)
+    assert team_member_visits_flush() == 1
+    team_member_visit_workspace(team_member=team_member)
+    assert team_member_visits_flush(interval=60) == 0
+    assert team_member_visits_flush() == 1
+
+
+def test_team_member_visits_flush_error(
+    team_member: TeamMember, project: Project
+) -> None:
+    """Test that visits are kept when they can't be written."""
+    team_member_visit_project(team_member=team_member, project=project)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        # Another request records a visit without a project meanwhile
+        team_member_visit_workspace(team_member=team_member)
+        raise DatabaseError()
+
+    with patch.object(TeamMember.objects, "filter", side_effect=fail):
+        with pytest.raises(DatabaseError):
+            team_member_visits_flush()
+    # The newer visit keeps the project of the restored one
+    ((visited, project_pk),) = visit_buffer.take().values()
+    assert visited == team_member.last_visited_workspace
+    assert project_pk == project.pk
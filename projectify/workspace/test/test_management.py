@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test workspace app management commands."""
+
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+
+import pytest
+
+from ..models import Project, Task, TeamMember, WorkspaceQuotaCounter
+
+pytestmark = pytest.mark.django_db
+
+
+def test_quota_reconcile(task: Task) -> None:
+    """Test repairing quota counters."""
+    WorkspaceQuotaCounter.objects.update(task_count=0)
+    out = StringIO()
+    call_command("quota_reconcile", stdout=out)
+    assert "Repaired 1 workspace quota counters" in out.getvalue()
+    counter = WorkspaceQuotaCounter.objects.get(workspace=task.workspace)
+    assert counter.task_count == 1
+
+
+def test_search_index_rebuild(task: Task) -> None:
+    """Test rebuilding the search index."""
+    out = StringIO()
+    call_command("search_index_rebuild", stdout=out)
+    assert "Indexed 2 tasks and projects" in out.getvalue()
+
+
+def test_task_import(
+    project: Project, team_member: TeamMember, tmp_path: Path
+) -> None:
+    """Test importing tasks from a CSV file."""
+    path = tmp_path / "tasks.csv"
+    path.write_text("title,project\nfoo,\nbar,Does not exist\n")
+    out = StringIO()
+    err = StringIO()
+    call_command(
+        "task_import",
+        str(project.workspace.uuid),
+        str(path),
+        email=team_member.user.email,
+        project=str(project.uuid),
+        workers=1,
+        stdout=out,
+        stderr=err,
+    )
+    assert "Imported 1 tasks, skipped 1 rows" in out.getvalue()
+    assert "Row 2: No project found for this row" in err.getvalue()
+    assert project.task_set.get().title == "foo"
@@ -3,10 +3,17 @@
 # SPDX-FileCopyrightText: 2021-2024,2026 JWP Consulting GK
 """Test workspace models."""
 
+from typing import cast
+
 from django.core.exceptions import ValidationError
+from django.utils.safestring import SafeString
+from django.utils.timezone import now
 
 import pytest
 
+from projectify.lib.models import RichTextField
+from pytest_types import DjangoAssertNumQueries
+
 from ..models import Task, Workspace
 
 pytestmark = pytest.mark.django_db
@@ -69,3 +76,69 @@ class TestTask:
         task.workspace = unrelated_workspace
         with pytest.raises(ValidationError):
             task.save()
+
+    def test_save_update_fields(
+        self, task: Task, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """Test that only update_fields are validated and saved."""
+        modified = task.modified
+        task.done = now()
+        with django_assert_num_queries(1):
+            task.save(update_fields=["done"])
+        task.refresh_from_db()
+        assert task.done is not None
+        assert task.modified == modified
+        with django_assert_num_queries(0):
+            task.save(update_fields=[])
+
+        task.done = None
+        with django_assert_num_queries(1):
+            task.save_changed("done")
+        task.refresh_from_db()
+        assert task.done is None
+        assert task.modified > modified
+
+        task.title = ""
+        with pytest.raises(ValidationError) as error:
+            task.save_changed("title")
+        assert error.value.error_dict is not None
+        assert "title" in error.value.error_dict
+
+    def test_description_fingerprint(self, task: Task) -> None:
+        """Test that descriptions are only sanitized for stale fingerprints."""
+        field = cast(RichTextField, Task._meta.get_field("description"))
+        assert task.description_fingerprint == field.fingerprint
+        loaded = Task.objects.get(pk=task.pk)
+        assert isinstance(loaded.description, SafeString)
+
+        # Stale fingerprint, sanitize again when loading
+        Task.objects.filter(pk=task.pk).update(
+            description="<p>hello<script>alert(1)</script></p>",
+            description_fingerprint="",
+        )
+        loaded = Task.objects.get(pk=task.pk)
+        assert loaded.description == "<p>hello</p>"
+
+        # .values() receives the stored value without marking it safe
+        (values,) = Task.objects.filter(pk=task.pk).values("description")
+        assert not isinstance(values["description"], SafeString)
+
+        # Updating only the description resets the fingerprint
+        loaded.save()
+        Task.objects.filter(pk=task.pk).update(
+            description="<p>hi<script>alert(1)</script></p>"
+        )
+        loaded = Task.objects.get(pk=task.pk)
+        assert loaded.description_fingerprint == ""
+        assert loaded.description == "<p>hi</p>"
+        loaded.description = "<p>hello<script>alert(1)</script></p>"
+        Task.objects.bulk_update([loaded], ["description"])
+        loaded = Task.objects.get(pk=task.pk)
+        assert loaded.description_fingerprint == ""
+        assert loaded.description == "<p>hello</p>"
+
+        # Saving stores the current fingerprint
+        loaded.save()
+        loaded.refresh_from_db()
+        assert loaded.description_fingerprint == field.fingerprint
+        assert loaded.description == "<p>hello</p>"
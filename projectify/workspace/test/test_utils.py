@@ -7,7 +7,16 @@ from typing import Optional
 
 import pytest
 
-from ..utils import extract_first_paragraph_text, strip_first_paragraph
+from projectify.lib.utils import clean_rich_text
+
+from ..models import Task
+from ..utils import (
+    analyze_rich_text,
+    extract_first_paragraph_text,
+    extract_text,
+    rich_text_cache,
+    strip_first_paragraph,
+)
 
 
 @pytest.mark.parametrize(
@@ -97,3 +106,41 @@ def test_extract_first_paragraph_text(
 def test_strip_first_paragraph(html: str, expected: Optional[str]) -> None:
     """Test stripping the first paragraph."""
     assert strip_first_paragraph(html) == expected
+
+
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("", ""),
+        ("Hello world", "Hello world"),
+        ("<p>Hello <b>w</b>orld</p>", "Hello world"),
+        ("<p>First</p><ul><li>a</li><li>b &amp; c</li></ul>", "First a b & c"),
+        ("<p>  lots   of\n whitespace </p>", "lots of whitespace"),
+        ("<p>x<script>alert(1)</script></p>", "x"),
+    ],
+)
+def test_extract_text(html: str, expected: str) -> None:
+    """Test extracting all text."""
+    assert extract_text(html) == expected
+
+
+def test_analyze_rich_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that rich text is parsed once and sanitized like pre_save()."""
+    rich_text_cache.clear()
+    html = "<p>Title</p><p>Hello <script>alert(1)</script>world</p>"
+    rich_text = analyze_rich_text(html)
+    assert rich_text.html == clean_rich_text(html)
+    assert rich_text.title == "Title"
+    assert rich_text.rest == "<p>Hello world</p>"
+    assert rich_text.text == "Title Hello world"
+
+    # Both the input and the sanitized html are cached
+    monkeypatch.setattr("projectify.workspace.utils._analyze_rich_text", None)
+    assert analyze_rich_text(html) is rich_text
+    assert analyze_rich_text(rich_text.html) is rich_text
+
+    # pre_save() doesn't sanitize analyzed html again
+    monkeypatch.setattr("projectify.lib.models.clean_rich_text", None)
+    field = Task._meta.get_field("description")
+    task = Task(description=rich_text.html)
+    assert field.pre_save(task, add=True) is rich_text.html
@@ -12,6 +12,7 @@ import pytest
 
 from pytest_types import DjangoAssertNumQueries
 
+from ...avatar_marble import avatar_marble_cache
 from ...models import TeamMember
 
 pytestmark = pytest.mark.django_db
@@ -40,6 +41,21 @@ def test_response(
     assert response.content == user_client.get(resource_url).content
 
 
+def test_etag(
+    user_client: Client, resource_url: str, team_member: TeamMember
+) -> None:
+    """Test that the ETag only depends on the team member."""
+    response = user_client.get(resource_url)
+    etag = response["ETag"]
+    assert f"mask__marble__{team_member.uuid.hex}" in response.content.decode()
+    avatar_marble_cache.clear()
+    assert user_client.get(resource_url)["ETag"] == etag
+
+    response = user_client.get(resource_url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
 def test_nonexistent_team_member_returns_404(user_client: Client) -> None:
     """Test that nonexistent team member returns 404."""
     assert (
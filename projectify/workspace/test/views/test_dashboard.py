@@ -12,6 +12,7 @@ from faker import Faker
 
 from ...models import Project, TeamMember, Workspace
 from ...services.project import project_archive, project_create
+from ...services.team_member import team_member_visit_project
 
 pytestmark = pytest.mark.django_db
 
@@ -119,3 +120,27 @@ class TestRedirectToDashboard:
             "dashboard:projects:detail",
             kwargs={"project_uuid": new_project.uuid},
         )
+
+    def test_redirect_to_buffered_last_visited_project(
+        self,
+        user_client: Client,
+        resource_url: str,
+        workspace: Workspace,
+        team_member: TeamMember,
+        project: Project,
+        faker: Faker,
+    ) -> None:
+        """Test that visits that haven't been written yet are seen."""
+        project_create(
+            who=team_member.user,
+            title_description=faker.paragraph(),
+            workspace=workspace,
+        )
+        team_member_visit_project(team_member=team_member, project=project)
+
+        response = user_client.get(resource_url)
+
+        assert isinstance(response, HttpResponseRedirect)
+        assert response.url == reverse(
+            "dashboard:projects:detail", kwargs={"project_uuid": project.uuid}
+        )
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Test task export views."""
+
+import csv
+import io
+import json
+from typing import Any
+
+from django.test.client import Client
+from django.urls import reverse
+
+import pytest
+
+from pytest_types import DjangoAssertNumQueries
+
+from ...models import Project, Task, TeamMember
+
+pytestmark = pytest.mark.django_db
+
+
+def _content(response: Any) -> str:
+    """Read the whole streamed response."""
+    return b"".join(response.streaming_content).decode()
+
+
+class TestWorkspaceExportView:
+    """Test exporting a workspace's tasks."""
+
+    def test_csv(
+        self,
+        user_client: Client,
+        team_member: TeamMember,
+        task: Task,
+        other_task: Task,
+        django_assert_num_queries: DjangoAssertNumQueries,
+    ) -> None:
+        """Test exporting tasks as CSV."""
+        other_task.title = '=HYPERLINK("https://example.com")'
+        other_task.save()
+        url = reverse(
+            "dashboard:workspaces:export", args=(task.workspace.uuid,)
+        )
+        response = user_client.get(url)
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/csv")
+        # Only the task rows themselves
+        with django_assert_num_queries(1):
+            rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert [row["uuid"] for row in rows] == [
+            str(task.uuid),
+            str(other_task.uuid),
+        ]
+        # Formulas are exported as text
+        assert rows[1]["title"] == f"'{other_task.title}"
+        assert rows[1]["project"] == task.project.title
+        assert rows[1]["assignee"] == ""
+
+    def test_jsonl(
+        self, user_client: Client, team_member: TeamMember, task: Task
+    ) -> None:
+        """Test exporting tasks as JSON Lines."""
+        url = reverse(
+            "dashboard:workspaces:export", args=(task.workspace.uuid,)
+        )
+        response = user_client.get(url, {"format": "jsonl"})
+        assert response.status_code == 200
+        (line,) = _content(response).splitlines()
+        row = json.loads(line)
+        assert row["uuid"] == str(task.uuid)
+        assert row["done"] is None
+
+        response = user_client.get(url, {"format": "xlsx"})
+        assert response.status_code == 400
+
+    def test_unrelated_user(
+        self, unrelated_user_client: Client, task: Task
+    ) -> None:
+        """Test that only team members can export."""
+        url = reverse(
+            "dashboard:workspaces:export", args=(task.workspace.uuid,)
+        )
+        assert unrelated_user_client.get(url).status_code == 404
+
+
+class TestProjectExportView:
+    """Test exporting a project's tasks."""
+
+    def test_csv(
+        self,
+        user_client: Client,
+        team_member: TeamMember,
+        task: Task,
+        other_project_same_workspace: Project,
+    ) -> None:
+        """Test that only the project's tasks are exported."""
+        url = reverse(
+            "dashboard:projects:export",
+            args=(other_project_same_workspace.uuid,),
+        )
+        response = user_client.get(url)
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert rows == []
+
+        url = reverse("dashboard:projects:export", args=(task.project.uuid,))
+        response = user_client.get(url)
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        assert [row["uuid"] for row in rows] == [str(task.uuid)]
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2024 JWP Consulting GK
+# SPDX-FileCopyrightText: 2024,2026 JWP Consulting GK
 """Workspace URLs for dashboard."""
 # TODO rename to projectify.workspace.urls
 
@@ -12,6 +12,10 @@ from projectify.lib.settings import get_settings
 from projectify.lib.types import UrlPatterns
 from projectify.workspace.views.avatar_marble import avatar_marble_view
 from projectify.workspace.views.dashboard import redirect_to_dashboard
+from projectify.workspace.views.export import (
+    project_export_view,
+    workspace_export_view,
+)
 from projectify.workspace.views.project import (
     project_archive_view,
     project_create_view,
@@ -59,6 +63,7 @@ workspace_patterns: UrlPatterns = (
         "<uuid:workspace_uuid>/picture", workspace_picture_view, name="picture"
     ),
     path("<uuid:workspace_uuid>/search", workspace_search_view, name="search"),
+    path("<uuid:workspace_uuid>/export", workspace_export_view, name="export"),
     # Settings
     path(
         "<uuid:workspace_uuid>/settings",
@@ -124,6 +129,7 @@ project_patterns = (
     path("<uuid:project_uuid>/archive", project_archive_view, name="archive"),
     path("<uuid:project_uuid>/delete", project_delete_view, name="delete"),
     path("<uuid:project_uuid>/recover", project_recover_view, name="recover"),
+    path("<uuid:project_uuid>/export", project_export_view, name="export"),
     # Create task within project
     path(
         "<uuid:project_uuid>/create-task", task_create_view, name="create-task"
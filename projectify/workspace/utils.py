@@ -3,37 +3,112 @@
 # SPDX-FileCopyrightText: 2026 JWP Consulting GK
 """Workspace app utils."""
 
+import hashlib
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from functools import cache
 from typing import Optional
+from uuid import UUID
 
 from django.utils.safestring import SafeString, mark_safe
 
-from justhtml import JustHTML, PruneEmpty
+from justhtml import JustHTML
 
+from projectify.lib.cache import LRUCache
+from projectify.lib.models import SanitizedHtml
 from projectify.lib.settings import get_settings
+from projectify.lib.utils import (
+    rich_text_policy_fingerprint,
+    rich_text_transforms,
+)
 
 
-def extract_first_paragraph_text(unsafe_html: str) -> Optional[str]:
-    """Return plain text from the first non-empty block tag in html, or None."""
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RichText:
+    """Results of parsing user rich text once."""
+
+    # Sanitized with HTML_USER_POLICY, like clean_rich_text()
+    html: SanitizedHtml
+    # Plain text of the first non-empty block
+    title: Optional[str]
+    # Sanitized html after the first block, if anything follows
+    rest: Optional[SafeString]
+    # All plain text, with whitespace collapsed
+    text: str
+
+
+# Analyses of recent rich text by content hash. Analyzing only depends on the
+# content and HTML_USER_POLICY, so entries never go stale.
+rich_text_cache: LRUCache[bytes, RichText] = LRUCache(maxsize=512)
+
+
+@cache
+def _user_policy_fingerprint() -> str:
+    """Return the fingerprint of HTML_USER_POLICY."""
+    return rich_text_policy_fingerprint(get_settings().HTML_USER_POLICY)
+
+
+def _analyze_rich_text(unsafe_html: str) -> RichText:
+    """Parse and sanitize unsafe_html, and extract everything from it."""
+    html = SanitizedHtml()
+    html.fingerprint = _user_policy_fingerprint()
     if len(unsafe_html) == 0:
-        return None
-    settings = get_settings()
+        return RichText(html=html, title=None, rest=None, text="")
     doc = JustHTML(
         unsafe_html,
-        policy=settings.HTML_USER_POLICY,
+        policy=get_settings().HTML_USER_POLICY,
         fragment=True,
-        transforms=[PruneEmpty("*")],
+        transforms=rich_text_transforms(),
     )
-    match doc.root.children:
-        case None | []:
-            return None
-        case children:
-            pass
+    # JustHTML outputs safe html, see clean_rich_text()
+    html = SanitizedHtml(doc.to_html(pretty=False))
+    html.fingerprint = _user_policy_fingerprint()
+    text = doc.to_text(separator=" ", strip=False, separator_blocks_only=True)
+    children = doc.root.children or []
     # Try extracting the contents of the first non-empty HTML element
+    title: Optional[str] = None
     for child in children:
-        text: str = child.to_text()
-        if len(text) > 0:
-            return text
-    return None
+        child_text: str = child.to_text()
+        if len(child_text) > 0:
+            title = child_text
+            break
+    rest: Optional[SafeString] = None
+    if len(children) > 1:
+        doc.root.children = children[1:]
+        # calling mark_safe doesn't make it safe
+        # html is safe because JustHTML outputs safe html in
+        # doc.to_html()
+        rest = mark_safe(doc.to_html())
+    return RichText(
+        html=html, title=title, rest=rest, text=" ".join(text.split())
+    )
+
+
+def _content_hash(content: str) -> bytes:
+    """Return the cache key for content."""
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+def analyze_rich_text(unsafe_html: str) -> RichText:
+    """
+    Sanitize user rich text and extract its title and text in one parse.
+
+    Results are cached by content hash. RichTextField.pre_save() stores the
+    sanitized html as is, without parsing it again.
+    """
+    analysis = rich_text_cache.get(_content_hash(unsafe_html))
+    if analysis is None:
+        analysis = _analyze_rich_text(unsafe_html)
+        rich_text_cache.set(_content_hash(unsafe_html), analysis)
+        # Sanitizing is idempotent, so the sanitized html that is stored and
+        # rendered later analyzes the same
+        rich_text_cache.set(_content_hash(analysis.html), analysis)
+    return analysis
+
+
+def extract_first_paragraph_text(unsafe_html: str) -> Optional[str]:
+    """Return plain text from the first non-empty block tag in html, or None."""
+    return analyze_rich_text(unsafe_html).title
 
 
 def strip_first_paragraph(unsafe_html: str) -> Optional[SafeString]:
@@ -44,25 +119,35 @@ def strip_first_paragraph(unsafe_html: str) -> Optional[SafeString]:
 
     Return None if there's nothing after the first block.
     """
-    if len(unsafe_html) == 0:
-        return None
-    settings = get_settings()
-    doc = JustHTML(
-        unsafe_html,
-        policy=settings.HTML_USER_POLICY,
-        fragment=True,
-        transforms=[PruneEmpty("*")],
-    )
-    match doc.root.children:
-        case None:
-            return None
-        # Empty or just one element
-        case [] | [_]:
+    return analyze_rich_text(unsafe_html).rest
+
+
+def extract_text(unsafe_html: str) -> str:
+    """Return all plain text in html, with whitespace collapsed."""
+    return analyze_rich_text(unsafe_html).text
+
+
+# Rendered task rows by task UUID. Each task has one entry per variant, e.g.,
+# per viewer permissions, holding the version it was rendered for and the
+# html.
+TaskRowVariants = Mapping[Hashable, tuple[Hashable, str]]
+task_row_cache: LRUCache[UUID, TaskRowVariants] = LRUCache(maxsize=2048)
+
+
+def task_row_cache_get(
+    uuid: UUID, *, variant: Hashable, version: Hashable
+) -> Optional[str]:
+    """Return a rendered task row, if it was rendered for version."""
+    match (task_row_cache.get(uuid) or {}).get(variant):
+        case (cached_version, str(html)) if cached_version == version:
+            return html
+        case _:
             return None
-        case children:
-            doc.root.children = children[1:]
-            sanitized_html = doc.to_html()
-            # calling mark_safe doesn't make it safe
-            # html is safe because JustHTML outputs safe html in
-            # doc.to_html()
-            return mark_safe(sanitized_html)
+
+
+def task_row_cache_set(
+    uuid: UUID, *, variant: Hashable, version: Hashable, html: str
+) -> None:
+    """Store a rendered task row."""
+    variants = task_row_cache.get(uuid) or {}
+    task_row_cache.set(uuid, {**variants, variant: (version, html)})
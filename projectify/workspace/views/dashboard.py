@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2024 JWP Consulting GK
+# SPDX-FileCopyrightText: 2024,2026 JWP Consulting GK
 """General dashboard views."""
 
 from django.http.response import HttpResponse
@@ -17,6 +17,7 @@ from projectify.workspace.selectors.team_member import (
     team_member_last_workspace_for_user,
 )
 from projectify.workspace.selectors.workspace import workspace_find_for_user
+from projectify.workspace.services.team_member import team_member_visits_flush
 
 
 @platform_view
@@ -26,6 +27,8 @@ def redirect_to_dashboard(request: AuthenticatedHttpRequest) -> HttpResponse:
     # that returns either a workspace or project
     # but still, if we're going to a workspace, we should remember what
     # project we looked at last
+    # Write visits that this process has buffered, so that we see them
+    team_member_visits_flush()
     maybe_last_visited_workspace = team_member_last_workspace_for_user(
         user=request.user
     )
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# SPDX-FileCopyrightText: 2026 JWP Consulting GK
+"""Task export views."""
+
+from typing import Optional
+from uuid import UUID
+
+from django.core.exceptions import BadRequest
+from django.http import Http404, StreamingHttpResponse
+from django.utils.text import slugify
+from django.utils.translation import gettext_lazy as _
+from django.views.decorators.http import require_GET
+
+from projectify.lib.auth import validate_perm
+from projectify.lib.types import AuthenticatedHttpRequest
+from projectify.lib.views import platform_view
+
+from ..models import Project, Workspace
+from ..selectors.export import (
+    ExportFormat,
+    task_export_lines,
+    task_export_rows,
+)
+from ..selectors.project import project_find_by_project_uuid
+from ..selectors.workspace import workspace_find_by_workspace_uuid
+
+CONTENT_TYPES: dict[ExportFormat, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/jsonl; charset=utf-8",
+}
+
+
+def _task_export_response(
+    request: AuthenticatedHttpRequest,
+    *,
+    workspace: Workspace,
+    project: Optional[Project] = None,
+) -> StreamingHttpResponse:
+    """Stream the tasks of a workspace or project."""
+    validate_perm("workspace.read_task", request.user, workspace)
+    export_format: ExportFormat
+    match request.GET.get("format", "csv"):
+        case "csv":
+            export_format = "csv"
+        case "jsonl":
+            export_format = "jsonl"
+        case other:
+            raise BadRequest(
+                _("Unsupported export format '{format}'").format(format=other)
+            )
+    rows = task_export_rows(workspace=workspace, project=project)
+    response = StreamingHttpResponse(
+        task_export_lines(rows=rows, export_format=export_format),
+        content_type=CONTENT_TYPES[export_format],
+    )
+    name = slugify((project or workspace).title) or "tasks"
+    response["Content-Disposition"] = (
+        f'attachment; filename="{name}.{export_format}"'
+    )
+    return response
+
+
+@require_GET
+@platform_view
+def workspace_export_view(
+    request: AuthenticatedHttpRequest, workspace_uuid: UUID
+) -> StreamingHttpResponse:
+    """Export all tasks in a workspace as CSV or JSON Lines."""
+    workspace = workspace_find_by_workspace_uuid(
+        workspace_uuid=workspace_uuid, who=request.user
+    )
+    if workspace is None:
+        raise Http404(_("Workspace not found"))
+    return _task_export_response(request, workspace=workspace)
+
+
+@require_GET
+@platform_view
+def project_export_view(
+    request: AuthenticatedHttpRequest, project_uuid: UUID
+) -> StreamingHttpResponse:
+    """Export all tasks in a project as CSV or JSON Lines."""
+    project = project_find_by_project_uuid(
+        who=request.user, project_uuid=project_uuid
+    )
+    if project is None:
+        raise Http404(_("No project found for this uuid"))
+    return _task_export_response(
+        request, workspace=project.workspace, project=project
+    )
@@ -22,14 +22,15 @@ from projectify.lib.htmx import HttpResponseClientRefresh
 from projectify.lib.types import AuthenticatedHttpRequest
 from projectify.lib.views import platform_view
 from projectify.workspace.forms import WorkspaceRichTextEditor
-from projectify.workspace.utils import strip_first_paragraph
+from projectify.workspace.utils import analyze_rich_text
 
 from ..models import Project, Task, TeamMember, Workspace
 from ..selectors.project import (
+    project_detail_load,
     project_detail_query_set,
     project_find_by_project_uuid,
 )
-from ..selectors.quota import workspace_get_all_quotas
+from ..selectors.task import task_cursor_decode, task_find_page_for_project
 from ..selectors.team_member import team_member_find_for_workspace
 from ..selectors.workspace import (
     workspace_build_detail_query_set,
@@ -42,13 +43,23 @@ from ..services.project import (
     project_delete,
     project_update,
 )
-from ..services.task import task_create, task_mark_done
+from ..services.task import (
+    task_bulk_assign,
+    task_bulk_delete,
+    task_bulk_mark_done,
+    task_bulk_move_to_project,
+    task_create,
+    task_mark_done,
+)
 from ..services.team_member import team_member_visit_project
 
 logger = logging.getLogger(__name__)
 
 Q = TypeVar("Q", bound=Model)
 
+# Number of tasks shown on the project page, and loaded with "Load more"
+PROJECT_TASK_PAGE_SIZE = 50
+
 
 def get_project_view_context(
     request: AuthenticatedHttpRequest, workspace: Workspace
@@ -111,6 +122,93 @@ class TaskMarkDoneForm(forms.Form):
         )
 
 
+class TaskBulkActionForm(forms.Form):
+    """Form for applying one action to several selected tasks."""
+
+    bulk_action = forms.ChoiceField(
+        choices=[
+            ("mark_done", _("Mark as done")),
+            ("mark_not_done", _("Mark as not done")),
+            ("assign", _("Assign to")),
+            ("move", _("Move to project")),
+            ("delete", _("Delete")),
+        ]
+    )
+
+    def __init__(self, project: Project, *args: Any, **kwargs: Any) -> None:
+        """Initialize task, assignee and project choices from project."""
+        super().__init__(*args, **kwargs)
+        workspace = project.workspace
+        self.fields["tasks"] = forms.ModelMultipleChoiceField(
+            queryset=Task.objects.filter(project=project).select_related(
+                "workspace"
+            ),
+            to_field_name="uuid",
+        )
+        self.fields["assignee"] = forms.ModelChoiceField(
+            queryset=workspace.teammember_set.all(),
+            to_field_name="uuid",
+            required=False,
+        )
+        self.fields["project"] = forms.ModelChoiceField(
+            queryset=workspace.project_set.filter(
+                archived__isnull=True
+            ).exclude(pk=project.pk),
+            to_field_name="uuid",
+            required=False,
+        )
+
+    def clean(self) -> dict[str, Any]:
+        """Ensure that moving tasks has a project to move them to."""
+        cleaned_data = super().clean() or {}
+        match cleaned_data.get("bulk_action"), cleaned_data.get("project"):
+            case "move", None:
+                self.add_error(
+                    "project", _("Select a project to move the tasks to")
+                )
+            case _:
+                pass
+        return cleaned_data
+
+
+def _task_bulk_action(
+    request: AuthenticatedHttpRequest, project: Project
+) -> None:
+    """Apply a bulk action to the selected tasks."""
+    form = TaskBulkActionForm(project=project, data=request.POST)
+    if not form.is_valid():
+        raise BadRequest(
+            _("Task bulk action form not valid. Errors={errors}").format(
+                errors=form.errors
+            )
+        )
+    tasks: list[Task] = list(form.cleaned_data["tasks"])
+    try:
+        match form.cleaned_data["bulk_action"]:
+            case "mark_done":
+                task_bulk_mark_done(who=request.user, tasks=tasks, done=True)
+            case "mark_not_done":
+                task_bulk_mark_done(who=request.user, tasks=tasks, done=False)
+            case "assign":
+                task_bulk_assign(
+                    who=request.user,
+                    tasks=tasks,
+                    assignee=form.cleaned_data["assignee"],
+                )
+            case "move":
+                task_bulk_move_to_project(
+                    who=request.user,
+                    tasks=tasks,
+                    project=form.cleaned_data["project"],
+                )
+            case "delete":
+                task_bulk_delete(who=request.user, tasks=tasks)
+            case other:
+                assert False, other
+    except ValidationError as error:
+        raise BadRequest(" ".join(error.messages)) from error
+
+
 # Factored out of project_detail_view
 def _project_detail_view_actions(
     request: AuthenticatedHttpRequest,
@@ -145,6 +243,9 @@ def _project_detail_view_actions(
                 done=task_mark_done_form.cleaned_data["done"],
             )
             template = "workspace/project_detail.html#project_tasks"
+        case "POST", "bulk_tasks":
+            _task_bulk_action(request, project)
+            template = "workspace/project_detail.html#project_tasks"
         case "POST", action:
             raise BadRequest(
                 _("Unrecognized action '{action}'").format(action=action)
@@ -162,44 +263,82 @@ def project_detail_view(
     request: AuthenticatedHttpRequest, project_uuid: UUID
 ) -> HttpResponse:
     """Show project details."""
-    project = project_find_by_project_uuid(
-        who=request.user, project_uuid=project_uuid
-    )
-    if project is None:
-        raise Http404(_("No project found for this uuid"))
-
-    team_member = team_member_find_for_workspace(
-        user=request.user, workspace=project.workspace
-    )
-    if team_member is None:
-        raise RuntimeError("No team member")
+    match request.method, request.GET.get("after"):
+        case "GET", str(cursor):
+            after = task_cursor_decode(cursor)
+            if after is None:
+                raise BadRequest(_("Invalid task cursor"))
+        case _:
+            after = None
 
-    qs = project_detail_query_set(who=request.user)
+    # Load more tasks with HTMX
+    if after is not None and request.htmx:
+        project = project_find_by_project_uuid(
+            who=request.user, project_uuid=project_uuid
+        )
+        if project is None:
+            raise Http404(_("No project found for this uuid"))
+        page = task_find_page_for_project(
+            project=project, limit=PROJECT_TASK_PAGE_SIZE, after=after
+        )
+        context = {
+            "project": project,
+            "tasks": page.tasks,
+            "next_cursor": page.next_cursor,
+        }
+        return render(
+            request, "workspace/project_detail.html#project_task_page", context
+        )
 
-    template, context = _project_detail_view_actions(
-        request, project, team_member
-    )
+    template = "workspace/project_detail.html"
+    context = {}
+    if request.method == "POST":
+        # Actions only need the project and team member. Everything else is
+        # loaded afterwards, since actions change tasks, the task counts in
+        # the side menu and quotas.
+        action_project = project_find_by_project_uuid(
+            who=request.user,
+            project_uuid=project_uuid,
+            qs=Project.objects.select_related("workspace"),
+        )
+        if action_project is None:
+            raise Http404(_("No project found for this uuid"))
+        team_member = team_member_find_for_workspace(
+            user=request.user, workspace=action_project.workspace
+        )
+        assert team_member is not None
+        template, context = _project_detail_view_actions(
+            request, action_project, team_member
+        )
 
-    # TODO run this before the match: case:
-    project = project_find_by_project_uuid(
-        who=request.user, project_uuid=project_uuid, qs=qs
+    detail = project_detail_load(
+        who=request.user,
+        project_uuid=project_uuid,
+        limit=PROJECT_TASK_PAGE_SIZE,
+        after=after,
     )
-    assert project, "Project disappeared"
+    if detail is None:
+        raise Http404(_("No project found for this uuid"))
+    project = detail.project
+    workspace = project.workspace
+    page = detail.page
 
     # Mark this project as most recently visited
-    team_member_visit_project(team_member=team_member, project=project)
-
-    project.workspace.quota = workspace_get_all_quotas(project.workspace)
-    team_members = project.workspace.teammember_set.all()
+    team_member_visit_project(team_member=detail.team_member, project=project)
 
     context = {
         **context,
-        **get_project_view_context(request, project.workspace),
-        "project_description": strip_first_paragraph(
+        "workspace": workspace,
+        "workspaces": detail.workspaces,
+        "projects": workspace.project_set.all(),
+        "current_team_member_qs": detail.team_member,
+        "project_description": analyze_rich_text(
             project.description or ""
-        ),
+        ).rest,
         "project": project,
-        "team_members": team_members,
+        "team_members": workspace.teammember_set.all(),
+        "tasks": page.tasks,
+        "next_cursor": page.next_cursor,
         "quick_add_task": TaskQuickAddForm(),
     }
     return render(request, template, context)
@@ -26,7 +26,7 @@ from projectify.workspace.selectors.project import (
     ProjectDetailQuerySet,
     project_find_by_project_uuid,
 )
-from projectify.workspace.utils import extract_first_paragraph_text
+from projectify.workspace.utils import analyze_rich_text
 
 from ..models import Task, Workspace
 from ..selectors.task import TaskDetailQuerySet, task_find_by_task_uuid
@@ -83,7 +83,7 @@ class TaskForm(forms.Form):
     def clean_description(self) -> str:
         """Make sure that the description has at least one child."""
         description: str = self.cleaned_data["description"]
-        match extract_first_paragraph_text(description):
+        match analyze_rich_text(description).title:
             case str():
                 return description
             case None:
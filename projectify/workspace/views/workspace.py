@@ -9,6 +9,7 @@ from typing import Any, Literal, Optional, TypedDict
 from uuid import UUID
 
 from django import forms
+from django.core.paginator import Page, Paginator
 from django.forms import ValidationError
 from django.http import Http404, HttpResponse, HttpResponseBadRequest
 from django.shortcuts import redirect, render
@@ -35,6 +36,8 @@ from ..forms import ModelMultipleChoice, WorkspaceSearchForm
 from ..models import TeamMember, Workspace
 from ..selectors.project import project_find_by_workspace_uuid
 from ..selectors.quota import workspace_get_all_quotas
+from ..selectors.search import SearchKind, search_suggest
+from ..selectors.task import TaskRow, task_rows
 from ..selectors.team_member import (
     team_member_find_by_team_member_uuid,
     team_member_find_for_workspace,
@@ -166,6 +169,10 @@ def workspace_view(
     return redirect("onboarding:new_project", workspace_uuid=workspace_uuid)
 
 
+# Number of tasks shown per search result page
+SEARCH_PAGE_SIZE = 50
+
+
 @require_GET
 @platform_view
 def workspace_search_view(
@@ -182,6 +189,8 @@ def workspace_search_view(
         raise Http404(_("Workspace not found"))
 
     team_members = workspace.teammember_set.all()
+    tasks: Optional[Page] = None
+    rows: Optional[list[TaskRow]] = None
     if len(request.GET) > 0:
         form = WorkspaceSearchForm(team_members=team_members, data=request.GET)
         if form.is_valid():
@@ -206,6 +215,9 @@ def workspace_search_view(
                 filter_by_team_members=filter_by_team_member,
                 unassigned_tasks=filter_by_unassigned,
             )
+            paginator = Paginator(results.tasks, SEARCH_PAGE_SIZE)
+            tasks = paginator.get_page(request.GET.get("page"))
+            rows = task_rows(tasks.object_list)
         else:
             results = None
     else:
@@ -218,6 +230,8 @@ def workspace_search_view(
         "workspaces": workspace_find_for_user(who=request.user),
         "form": form,
         "results": results,
+        "tasks": tasks,
+        "task_rows": rows,
     }
     return render(request, "workspace/workspace_search.html", context=context)
 
@@ -767,27 +781,22 @@ def workspace_suggest_links(
         case ("POST", data, _) | ("GET", _, {"search": _} as data):
             form = SuggestLinksForm(data)
             if form.is_valid():
-                results = workspace_search(
-                    workspace=workspace,
-                    who=request.user,
-                    query=form.cleaned_data["search"],
-                    exclude_task=form.cleaned_data.get("exclude_task"),
-                )
+                kind: SearchKind
                 match link_type:
                     case "project":
-                        suggestions = [
-                            (project.title, project.get_absolute_url())
-                            for project in results.projects
-                        ]
+                        kind = "project"
                     case "task":
-                        suggestions = [
-                            (task.title, task.get_absolute_url())
-                            for task in results.tasks
-                        ]
+                        kind = "task"
                     case other:
                         return HttpResponseBadRequest(
                             _("Unknown query type {type}").format(type=other)
                         )
+                suggestions = search_suggest(
+                    workspace=workspace,
+                    kind=kind,
+                    query=form.cleaned_data["search"],
+                    exclude_task=form.cleaned_data.get("exclude_task"),
+                )
                 template = "workspace/workspace_suggest_links.html#results"
                 status = 200
             else:
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 #
-# SPDX-FileCopyrightText: 2023 JWP Consulting GK
+# SPDX-FileCopyrightText: 2023, 2026 JWP Consulting GK
 """Useful types for pytest fixtures."""
 
 import contextlib
@@ -13,4 +13,7 @@ Headers = Mapping[str, Any]
 DjangoAssertNumQueries = Callable[
     [int], contextlib.AbstractContextManager[None]
 ]
+DjangoCaptureOnCommitCallbacks = Callable[
+    ..., contextlib.AbstractContextManager[list[Callable[[], Any]]]
+]
 Mailbox = Sequence[EmailMessage]
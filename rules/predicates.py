@@ -28,6 +28,10 @@ logger = logging.getLogger("rules")
 
 P = ParamSpec("P")
 
+# A compiled predicate receives the normalized argument tuple and returns
+# True, False, or None when it should be skipped
+Applier = Callable[[Tuple[Any, ...]], Optional[bool]]
+
 
 def assert_has_kwonlydefaults(fn: Callable[..., Any], msg: str) -> None:
     argspec = getfullargspec(fn)
@@ -71,6 +75,9 @@ class Predicate(Generic[P]):
     num_args: int
     var_args: bool
     name: str
+    # For predicates created with &, |, ^ and ~: the operator and operands
+    combinator: Optional[Tuple[str, Tuple["Predicate[P]", ...]]] = None
+    _compiled: Optional[Callable[..., bool]] = None
 
     def __init__(
         self,
@@ -85,6 +92,7 @@ class Predicate(Generic[P]):
         assert callable(fn), "The given predicate is not callable."
         innerfn = fn
         if isinstance(fn, Predicate):
+            self.combinator = fn.combinator
             innerfn, num_args, var_args, name = (
                 fn.fn,
                 fn.num_args,
@@ -200,23 +208,109 @@ class Predicate(Generic[P]):
         finally:
             _context.stack.pop()
 
+    def compile(self) -> Callable[..., bool]:
+        """
+        Return a callable that gives the same result as ``test()``.
+
+        The predicate tree is flattened into closures once, with argument
+        slicing resolved ahead of time for each number of arguments. Like
+        ``test()``, it pushes an invocation context, so predicates can use
+        ``context``. Trees with a ``bind=True`` predicate, and all calls while
+        debug logging is enabled, fall back to ``test()``.
+        """
+        if self._compiled is not None:
+            return self._compiled
+        if self._uses_bind():
+            self._compiled = self.test
+            return self.test
+        appliers = [self._compile(nargs) for nargs in range(3)]
+        test = self.test
+
+        def compiled(obj: Any = NO_VALUE, target: Any = NO_VALUE) -> bool:
+            if logger.isEnabledFor(logging.DEBUG):
+                return test(obj, target)
+            if target is NO_VALUE:
+                args: Tuple[Any, ...] = () if obj is NO_VALUE else (obj,)
+            elif obj is NO_VALUE:
+                args = (target,)
+            else:
+                args = (obj, target)
+            _context.stack.append(Context(args))
+            try:
+                return bool(appliers[len(args)](args))
+            finally:
+                _context.stack.pop()
+
+        self._compiled = compiled
+        return compiled
+
+    def _uses_bind(self) -> bool:
+        if self.bind:
+            return True
+        if self.combinator is None:
+            return False
+        return any(operand._uses_bind() for operand in self.combinator[1])
+
+    def _compile(self, nargs: int) -> Applier:
+        # Return an applier equivalent to ``_apply`` for nargs arguments
+        if self.combinator is not None:
+            op, operands = self.combinator
+            if op == "~":
+                return _compile_invert(operands[0]._compile(nargs))
+            left = operands[0]._compile(nargs)
+            right = operands[1]._compile(nargs)
+            if op == "&":
+                return _compile_and(left, right)
+            if op == "|":
+                return _compile_or(left, right)
+            return _compile_xor(left, right)
+
+        fn = self.fn
+        if self.var_args or self.num_args == nargs:
+
+            def apply(args: Tuple[Any, ...]) -> Optional[bool]:
+                result = fn(*args)
+                return None if result is None else bool(result)
+
+        elif self.num_args > nargs:
+            padding = (None,) * (self.num_args - nargs)
+
+            def apply(args: Tuple[Any, ...]) -> Optional[bool]:
+                result = fn(*args, *padding)
+                return None if result is None else bool(result)
+
+        else:
+            num_args = self.num_args
+
+            def apply(args: Tuple[Any, ...]) -> Optional[bool]:
+                result = fn(*args[:num_args])
+                return None if result is None else bool(result)
+
+        return apply
+
     def __and__(self, other: "Predicate[P]") -> "Predicate[P]":
         def AND(*args: Any) -> Optional[bool]:
             return self._combine(other, operator.and_, args)
 
-        return type(self)(AND, "(%s & %s)" % (self.name, other.name))
+        p = type(self)(AND, "(%s & %s)" % (self.name, other.name))
+        p.combinator = ("&", (self, other))
+        return p
 
     def __or__(self, other: "Predicate[P]") -> "Predicate[P]":
         def OR(*args: Any) -> Optional[bool]:
             return self._combine(other, operator.or_, args)
 
-        return type(self)(OR, "(%s | %s)" % (self.name, other.name))
+        p = type(self)(OR, "(%s | %s)" % (self.name, other.name))
+        p.combinator = ("|", (self, other))
+        return p
 
     def __xor__(self, other: "Predicate[P]") -> "Predicate[P]":
         def XOR(*args: Any) -> Optional[bool]:
             return self._combine(other, operator.xor, args)
 
-        return type(self)(XOR, "(%s ^ %s)" % (self.name, other.name))
+        p = type(self)(XOR, "(%s ^ %s)" % (self.name, other.name))
+        p.combinator = ("^", (self, other))
+        return p
 
     def __invert__(self) -> "Predicate[P]":
         def INVERT(*args: Any) -> Optional[bool]:
@@ -227,7 +321,9 @@ class Predicate(Generic[P]):
             name = self.name[1:]
         else:
             name = "~" + self.name
-        return type(self)(INVERT, name)
+        p = type(self)(INVERT, name)
+        p.combinator = ("~", (self,))
+        return p
 
     def _combine(
         self,
@@ -273,6 +369,53 @@ class Predicate(Generic[P]):
         return result
 
 
+def _compile_and(left: Applier, right: Applier) -> Applier:
+    def AND(args: Tuple[Any, ...]) -> Optional[bool]:
+        left_result = left(args)
+        if left_result is None:
+            return right(args)
+        if not left_result:
+            return False
+        right_result = right(args)
+        return left_result if right_result is None else right_result
+
+    return AND
+
+
+def _compile_or(left: Applier, right: Applier) -> Applier:
+    def OR(args: Tuple[Any, ...]) -> Optional[bool]:
+        left_result = left(args)
+        if left_result is None:
+            return right(args)
+        if left_result:
+            return True
+        right_result = right(args)
+        return left_result if right_result is None else right_result
+
+    return OR
+
+
+def _compile_xor(left: Applier, right: Applier) -> Applier:
+    def XOR(args: Tuple[Any, ...]) -> Optional[bool]:
+        left_result = left(args)
+        if left_result is None:
+            return right(args)
+        right_result = right(args)
+        if right_result is None:
+            return left_result
+        return left_result ^ right_result
+
+    return XOR
+
+
+def _compile_invert(operand: Applier) -> Applier:
+    def INVERT(args: Tuple[Any, ...]) -> Optional[bool]:
+        result = operand(args)
+        return None if result is None else not result
+
+    return INVERT
+
+
 PredicateFn = Callable[P, bool]
 
 
@@ -15,7 +15,8 @@ class RuleSet(dict[str, Predicate[P]]):
         if not name in self:
             warnings.warn(f"Rule {name} is not a valid predicate")
             return False
-        return self[name].test(*args, **kwargs)
+        # Predicates compile themselves on first use, see Predicate.compile()
+        return self[name].compile()(*args, **kwargs)
 
     def rule_exists(self, name: str) -> bool:
         return name in self
@@ -6,12 +6,13 @@ from typing import TYPE_CHECKING, Any
 
 from django import template
 
-from projectify.lib.auth import PermissionsCache, validate_perm
+from projectify.lib.auth import PermissionsCache, validate_perm, validate_perms_many
 
 from ..rulesets import default_rules
 
 if TYPE_CHECKING:
     from projectify.user.models import User
+    from projectify.workspace.models import Workspace
 
 register = template.Library()
 
@@ -26,10 +27,33 @@ def has_perm(context: dict[str, Any], perm: str, user: "User", obj: Any = None)
     if not hasattr(user, "has_perm"):  # pragma: no cover
         return False  # swapped user model that doesn't support permissions
 
+    cache = _perm_cache(context)
+    return validate_perm(perm, user, obj, raise_exception=False, cache=cache)
+
+
+@register.simple_tag(takes_context=True)
+def has_perms(
+    context: dict[str, Any], perms: str, user: "User", obj: "Workspace"
+) -> dict[str, bool]:
+    # Like has_perm, but for several space separated permissions at once,
+    # keyed by name without app label:
+    #   {% has_perms "workspace.update_task workspace.delete_task" user workspace as perms %}
+    #   {% if perms.update_task %}
+    if not hasattr(user, "has_perm"):  # pragma: no cover
+        return {}
+    names = perms.split()
+    cache = _perm_cache(context)
+    missing = [perm for perm in names if (perm, obj.uuid) not in cache]
+    if missing:
+        cache.update(validate_perms_many(user, missing, [obj]))
+    return {perm.partition(".")[2]: cache[(perm, obj.uuid)] for perm in names}
+
+
+def _perm_cache(context: dict[str, Any]) -> PermissionsCache:
     cache: PermissionsCache
     if "_perm_cache" not in context:
         cache = {}
         context["_perm_cache"] = cache
     else:
         cache = context["_perm_cache"]
-    return validate_perm(perm, user, obj, raise_exception=False, cache=cache)
+    return cache